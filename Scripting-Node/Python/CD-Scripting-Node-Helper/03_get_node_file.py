@@ -19,10 +19,16 @@ response = CDScriptingResponse()
 # Define a variable to store the node file and use the method 'get_node_file' to get the node file.
 # Parameters
 # ----------
-# None
+# read_only : bool, optional
+#     If True, the parsed node file itself is returned instead of a deep copy (default is False).
+#     The read-only node file cannot be modified (an exception is raised); use the method 'add_node_file' to create a node file that can be modified.
 
 # Returns
 # -------
 # dict
 #     The node file contents as a dictionary.
-node_args = response.get_node_file()
\ No newline at end of file
+node_args = response.get_node_file()
+
+
+# Define a variable to store the read-only node file (no copy is made).
+node_args_read_only = response.get_node_file(read_only=True)
\ No newline at end of file
@@ -38,4 +38,5 @@ node_args = response.get_node_file()
 # -------
 # dict
 #     The updated node file dictionary with the new node file.
+#     The new node file is a complete copy of 'node_file' that can be modified freely; 'node_file' may also be the read-only node file returned by 'get_node_file(read_only=True)'.
 node_response = response.add_node_file(node_args)    # No other parameters given/assigned in this example.
\ No newline at end of file
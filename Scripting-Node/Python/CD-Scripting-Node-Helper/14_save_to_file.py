@@ -70,8 +70,20 @@ response.update_node_file(node_response, CurrentWorkflowID = '999', Version = '2
 # filename : str
 #     The filename to which to save the node file. If not an absolute path, then the
 #     file is saved in the same directory as the script.
+# compact : bool, optional
+#     If True, the node file is saved on a single line without indentation, which is
+#     smaller and faster to write and read (default is False).
+# backend : str, optional
+#     The JSON package to use: 'orjson', 'ujson', or 'json' (default is 'json', which writes the node file as 'json.dump' with 'indent=4').
+#     'orjson' and 'ujson' are optional packages (e.g., pip install orjson); 'json' is part of the standard library.
+# fast : bool, optional
+#     If True, the fastest JSON package installed is used (default is False). Its output may differ from that of 'json' (e.g., 'orjson' indents with 2 spaces and writes NaN as null).
 
 # Returns
 # -------
 # None
 response.save_to_file(node_response, 'node_response.json')
+
+
+# Save the node file as compact JSON, e.g., for large node files with many columns.
+response.save_to_file(node_response, 'node_response.json', compact=True)
\ No newline at end of file
@@ -7,15 +7,13 @@
 
 
 # Load Libraries
-# Load a package/module that is capable of reading JSON files.
-import json    # JSON encoder and decoder.
 import os    # Miscellaneous operating system interfaces.
 import pandas as pd  # Pandas is a Python library for data analysis and manipulation.
 import sys    # System-specific parameters and functions.
 import traceback    # Print or retrieve a stack traceback.
 
 sys.path.append(r'D:/Ahmad/Python/Working Directory/TFS/Compound Discoverer')
-from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+from CDScriptingNodeHelper import CDScriptingResponse, dumps_json    # Import the CDScriptingResponse class and the 'dumps_json' function from the CDScriptingNodeHelper module.
 #==============================
 
 
@@ -34,7 +32,8 @@ directory = response._CDScriptingResponse__directory
 # Get the ndoe file from the command line arguments passed by Compound Discoverer upon initiation of the scripting node feature.
 # This file contains essential information about the exported data, including location(s) of the exported text files as well as the row IDs, columns, and column attributes of the exported tables.
 # Define a variable to store the node file and use the method 'get_node_file' to get the node file.
-node_args = response.get_node_file()
+# The node file is only read in this script (the 'node_response' created below is modified instead), so there is no need for a copy.
+node_args = response.get_node_file(read_only=True)
 #==============================
 
 
@@ -49,7 +48,10 @@ node_response = response.add_node_file(node_args)
 # Tables are exported as tab-separated text files. 
 # In this example, read the contents of the first table's datafile.
 # Define new variable 'GCEI_Compounds_table' and read the 'GC EI Compounds' data into it.
-GCEI_Compounds_table = pd.read_table(node_args['Tables'][0]['DataFile'], header=0)
+# Use the method 'load_table' to read the table with the data types given by its 'ColumnDescriptions' (Int, Float, String, Boolean).
+# The table is written back with a new column (see 'Write Files'), so the 'Structure' column, which 'load_table' leaves out by default, is read as well ('structures=True').
+# Without it, 'commit' would refuse to write the table, since the 'Structure' column described in the node file would be missing from the data.
+GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args, structures=True)
 #==============================
 
 
@@ -69,18 +71,13 @@ new_CD_column = list(range(1, len(GCEI_Compounds_table) + 1))
 # Create Table(s).
 # In this example, we will create a table 'New CD Table' that computes the 'Area Mean' for each 'Genuine' (Control) samples and 'Suspect' (Test) samples (the contents of the table are irrelevant - perform any desired calculation instead).
 # We will use this table to demonstrate how to add a table to be imported back into Compound Discoverer.
-# Subset 'GCEI_Compounds_table' indices 0, 3, and 23-28, corresponding to 'GC EI Compounds ID', 'Name', and individual Area columns for each of the 6 samples (3 Genuine and 3 Suspect).
-new_CD_table = GCEI_Compounds_table.iloc[:, [0, 3, 23, 24, 25, 26, 27, 28]]
-new_CD_table.iloc[:, 2:8] = new_CD_table.iloc[:, 2:8].apply(pd.to_numeric, errors='coerce')
+# Use the method 'group_stats' to compute the mean of the individual Area columns of each sample group ('Genuine_1raw', 'Genuine_2raw', and 'Genuine_3raw' are the 'Genuine' group, etc.).
+# The Area columns are found by name ('Area <sample> F<file ID>'), so no column positions are needed.
+area_means = response.group_stats(GCEI_Compounds_table, metric='Area', statistics=['Mean'], ratios=False)
 
 
-# Compute the Mean values (row-wise) for each set of samples.
-new_CD_table.insert(2, 'Area Mean (Genuine)', new_CD_table.iloc[:, 2:5].mean(axis=1, skipna=True))    # Indices 2, 3, 4 are the Area columns for Genuine samples.
-new_CD_table.insert(3, 'Area Mean (Suspect)', new_CD_table.iloc[:, 6:9].mean(axis=1, skipna=True))    # Indices 6, 7, 8 are the Area columns for Suspect samples.
-
-
-# Remove the individual Area columns (indices 4:9) since they are no longer necessary.
-new_CD_table = new_CD_table.drop(new_CD_table.columns[4:10], axis=1)
+# Combine the 'GC EI Compounds ID' and 'Name' columns with the 'Area Mean (Genuine)' and 'Area Mean (Suspect)' columns.
+new_CD_table = pd.concat([GCEI_Compounds_table[['GC EI Compounds ID', 'Name']], area_means], axis=1)
 #==============================
 
 
@@ -112,12 +109,6 @@ new_CD_table['New CD Table ID'] = list(range(1, len(new_CD_table) + 1))
 new_CD_table['New CD Table WorkflowID'] = node_response['CurrentWorkflowID']
 
 
-# Create 'Connection Table' data frame, which will eventually be written as a 'Connection Table' text file. 
-# This table only requires the ID columns: 'GC EI Compounds ID', 'New CD Table ID', and 'New CD Table WorkflowID'.
-# These columns should be maintained in the following order: Original Table ID column, New Table ID column, etc.
-connection_table = new_CD_table[['GC EI Compounds ID', 'New CD Table ID', 'New CD Table WorkflowID']]
-
-
 # Create a second instance of 'new_CD_table', which will be named 'CD_table_2'. 
 # This table will be appended to the 'node_response' object and, eventually, to the 'node_response.json' file. 
 # This table will serve as the JSON structure file for the newly created table ('New CD Table'), which will be imported back into Compound Discoverer.
@@ -147,56 +138,31 @@ response.add_column(node_response, TableName = 'New CD Table', ColumnName = 'Are
 response.add_column(node_response, TableName = 'New CD Table', ColumnName = 'New CD Table WorkflowID', ID = 'WorkflowID', DataType = 'Int')
 
 
-# Create a third instance of 'new_CD_table', which will be named 'CD_table_3'. 
-# This table will be appended to the 'node_response' object and, eventually, to the 'node_response.json' file. 
-# This table will serve as the JSON structure file for the 'Connection Table' between the original table exported out of Compound Discoverer and the newly created table ('New CD Table'), which will be imported back into Compound Discoverer.
-# Create a variable that defines the new text file name.
-connection_table_file = os.path.join(table_directory, table_basename + '-NewCDTable.out.txt')
-
-
-# Create/update 'CD_table_3' table structure.
-# Use the moethod 'add_table' to add a new table to the 'node_response' object.
-response.add_table(node_response, TableName = 'GC EI Compounds - New CD Table', DataFile = connection_table_file, DataFormat = 'CSVConnectionTable', Options = {'FirstTable': 'GC EI Compounds', 'SecondTable': 'New CD Table'})
-
-
-# Update 'Connection Table' (CD_table_3) Column Descriptions. 
-# Use the method 'add_column' to add new columns to the table.
-# Be sure to use the 'ID' columns (previously referenced) and order the columns in a manner consistent with the tables' connection structure - Original Table followed by the (new) one connected to it.
-response.add_column(node_response, TableName = 'GC EI Compounds - New CD Table', ColumnName = 'GC EI Compounds ID', ID = 'ID', DataType = 'Int')
-response.add_column(node_response, TableName = 'GC EI Compounds - New CD Table', ColumnName = 'New CD Table ID', ID = 'ID', DataType = 'Int')
-response.add_column(node_response, TableName = 'GC EI Compounds - New CD Table', ColumnName = 'New CD Table WorkflowID', ID = 'WorkflowID', DataType = 'Int')
+# Create a third table, 'CD_table_3', the 'Connection Table' between the original table exported out of Compound Discoverer and the newly created table ('New CD Table').
+# This table only requires the ID columns: 'GC EI Compounds ID', 'New CD Table ID', and 'New CD Table WorkflowID', in the order of the tables' connection structure - Original Table followed by the (new) one connected to it.
+# Use the method 'add_connection_table' to add its JSON structure to the 'node_response' object; with 'defer=True', the 'Connection Table' text file ('ConsolidatedGCEICompoundItem-NewCDTable.out.txt', next to the original table's data file) is written along with the other files (see 'Write Files').
+# The pairs of connected rows are given as two arrays of IDs: here, each compound is connected to the row of 'New CD Table' with the same position.
+# The ID columns are taken from the 'ColumnDescriptions' of both tables, and the 'New CD Table WorkflowID' column is filled with the 'CurrentWorkflowID'.
+response.add_connection_table(node_response, 'GC EI Compounds', 'New CD Table', (new_CD_table['GC EI Compounds ID'].to_numpy(dtype='int64'), new_CD_table['New CD Table ID'].to_numpy(dtype='int64')), defer=True)
 #==============================
 
 
 # Write Files.
 # In this section, we will modify and write text (.out.txt) and JSON (.json) files. 
 # The text files will reflect our newly created data (calculations performed in Python) and the JSON files will serve to instruct Compound Discoverer as to the structure of those files, where to find them, and how to read them.
-# Write newly created results table as a 'txt' ('.out.txt') file to temporary ('scratch') folder. 
-# The '.out.txt' file will be stored in the 'DataFile' field of the 'tables' section of 'node_response' file.
-# Substitute 'out.txt' for 'txt' in the would be 'node_response.json' file. 
-# Write the information for 'modified_GCEI_Compounds_table'.
-result_out_txt = node_response['Tables'][0]['DataFile'].replace('txt', 'out.txt')
-
-
-# Write newly created table results to file. Note: write files as tab-separated (CSV) text files.
-modified_GCEI_Compounds_Table.to_csv(result_out_txt, sep='\t', index=False, encoding='utf-8')
-
+# Use the method 'add_table_data' to set the data of each table to be written.
+# The newly created results table will be written as a 'txt' ('.out.txt') file to the temporary ('scratch') folder: the table's 'DataFile' field in 'node_response' is updated from '.txt' to '.out.txt'.
+response.add_table_data(node_response, 'GC EI Compounds', modified_GCEI_Compounds_Table)
 
-# Update 'node_response.json' table 'DataFile' path (with '.out.txt').
-node_response['Tables'][0]['DataFile'] = result_out_txt
 
+# The 'New CD Table' data is written to the 'DataFile' defined above ('NewCDTable.out.txt').
+response.add_table_data(node_response, 'New CD Table', new_CD_table)
 
-# Write newly created table results to file. Note: write files as tab-separated (CSV) text files.
-new_CD_table.to_csv(node_response['Tables'][1]['DataFile'], sep='\t', index=False, encoding='utf-8')
 
-
-# Write newly created table to 'Connection Table' portion of the file.
-connection_table.to_csv(node_response['Tables'][2]['DataFile'], sep='\t', index=False, encoding='utf-8')
-
-
-# Save/convert 'node_response' to JSON structure.
-# Use the method 'save_to_file' to save the 'node_response' object to the 'node_response.json' file.
-response.save_to_file(node_response, 'node_response.json')
+# Use the method 'commit' to write all the tables' data files (in parallel, as tab-separated (CSV) text files) and then the 'node_response' object to the 'node_response.json' file ('ExpectedResponsePath').
+# Each file is first written to a temporary file and only renamed once all of them have been written, so that Compound Discoverer never receives a half-written result: if any file fails, an exception is raised and nothing is saved.
+# With 'validate=True', the files written are also checked against 'node_response' (column names, data types, and ID columns; see the method 'validate') before they are saved, so that mistakes are reported at once rather than when Compound Discoverer imports the results.
+response.commit(node_response, validate=True)
 #==============================
 
 
@@ -219,9 +185,10 @@ script_data_outfilepath = os.path.join(script_data_directory, script_data_outfil
 
 
 # Save data.
+# Use the function 'dumps_json' to serialize the script data as compact JSON (on a single line; 'fast=True' uses the fastest JSON package installed, e.g., 'orjson').
 try:
-    with open(script_data_outfilepath, mode='w') as f:
-        json.dump(script_data, f)
+    with open(script_data_outfilepath, mode='wb') as f:
+        f.write(dumps_json(script_data, compact=True, fast=True))
     print('Successfully saved script_data.json file!')
 
 except Exception as e:
@@ -261,6 +228,7 @@ modified_GCEI_Compounds_Table.to_csv(script_data_table_1_outfilepath, sep='\t',
 
 new_CD_table.to_csv(script_data_table_2_outfilepath, sep='\t', index=False, encoding='utf-8')
 
+connection_table = pd.read_csv(node_response['Tables'][2]['DataFile'], sep='\t')
 connection_table.to_csv(script_data_table_3_outfilepath, sep='\t', index=False, encoding='utf-8')
 
 
@@ -272,6 +240,7 @@ connection_table.to_csv(script_data_table_3_outfilepath, sep='\t', index=False,
 
 
 # Uncomment/use command line below as needed.
+# import json    # JSON encoder and decoder.
 # try:
 #     with open('script_data.json', mode='r') as f:
 #         script_data = json.load(f)
@@ -289,4 +258,4 @@ connection_table.to_csv(script_data_table_3_outfilepath, sep='\t', index=False,
 # modified_GCEI_Compounds_Table = pd.read_csv('modified_GCEI_Compounds_table.txt', sep='\t')
 # new_CD_table = pd.read_csv('NewCDTable.txt', sep='\t')
 # connection_table = pd.read_csv('ConnectionTable.txt', sep='\t')
-#==============================
+#==============================
\ No newline at end of file
@@ -0,0 +1,34 @@
+#==============================================================================
+# Name   : reload
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'reload' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to read the node file from disk again, regardless of the copy cached by the 'get_node_file' method.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+# The node file is read and parsed only once; subsequent calls use the cached copy unless the file has changed on disk (path, modification time, or size).
+node_args = response.get_node_file()
+
+
+# Use the method 'reload' to force a fresh read of the node file.
+# Parameters
+# ----------
+# read_only : bool, optional
+#     If True, the parsed node file itself is returned instead of a deep copy (default is False).
+
+# Returns
+# -------
+# dict
+#     The node file contents as a dictionary.
+node_args = response.reload()
\ No newline at end of file
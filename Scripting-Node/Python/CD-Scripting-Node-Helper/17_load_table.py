@@ -0,0 +1,62 @@
+#==============================================================================
+# Name   : load_table
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'load_table' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to read the data file of a table exported by Compound Discoverer into a data frame, using the data types given by the table's 'ColumnDescriptions'.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file(read_only=True)
+
+
+# Define a variable to store the table's data and use the method 'load_table' to read the table.
+# Parameters
+# ----------
+# TableName : str
+#     The name of the table to read.
+# node_file : dict, optional
+#     The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+# engine : str, optional
+#     The pandas parser engine to use (default is 'pyarrow' if the pyarrow package is installed, otherwise 'c').
+# columns : list or callable, optional
+#     The columns to read, either as a list of column names or as a function that takes a column dictionary from 'ColumnDescriptions' and returns True for the columns to read (default is all columns).
+# cache : bool, optional
+#     If True, the data read is saved to a binary cache file next to the data file, and later calls read the cache file instead of the data file for as long as the data file is unchanged (default is False).
+# structures : bool, optional
+#     If True, the 'Structure' column (a molfile per row, by far the largest column of the table) is read as text along with the other columns; otherwise it is left out unless listed in 'columns' (default is False).
+
+# Returns
+# -------
+# pandas.DataFrame
+#     The table's data, with one column per column of the data file (except 'Structure'; use 'open_structures' to parse the molfiles of individual rows).
+#     'Int' columns are read as nullable integers ('Int64'), 'Float' columns as 'float64', 'String' columns as text (padding spaces removed), and 'Boolean' columns as nullable booleans ('boolean').
+GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args)
+
+
+# Read only some of the columns.
+# Select the columns by name...
+GCEI_Compounds_areas = response.load_table('GC EI Compounds', node_args, columns=['GC EI Compounds ID', 'Name', 'Area Genuine_1raw F1', 'Area Suspect_1raw F4'])
+
+
+# ...or with a function that takes a column dictionary from 'ColumnDescriptions' and returns True for the columns to read.
+GCEI_Compounds_text_columns = response.load_table('GC EI Compounds', node_args, columns=lambda column: column['DataType'] == 'String')
+
+
+# Read all columns, including the 'Structure' column as text (e.g., to write the whole table back).
+GCEI_Compounds_table_with_structure = response.load_table('GC EI Compounds', node_args, structures=True)
+
+
+# During script development, the same export is often read many times: use 'cache=True' to read it from a binary cache file (Feather, or pickle if pyarrow is not installed) after the first time.
+# The cache file is written next to the data file and is replaced whenever the data file changes (size, modification time, or hash).
+GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args, cache=True)
\ No newline at end of file
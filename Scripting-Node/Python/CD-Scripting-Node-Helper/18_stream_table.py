@@ -0,0 +1,59 @@
+#==============================================================================
+# Name   : stream_table
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'stream_table' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to read the data file of a (very large) table in chunks, apply a function to each chunk, and append the result to a new data file, so that the whole table is never held in memory.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file(read_only=True)
+
+
+# Define a variable to store the node file and use the method 'add_node_file' to add the node file.
+node_response = response.add_node_file(node_args)
+
+
+# Define the function applied to each chunk of the table.
+# In this example, the function adds a column 'New CD Column' that doubles the 'GC EI Compounds ID' values (the actual values of the column are irrelevant, in this case).
+def add_new_CD_column(chunk):
+    chunk['New CD Column'] = chunk['GC EI Compounds ID'] * 2
+    return chunk
+
+
+# Use the method 'stream_table' to read the table in chunks, add the new column to each chunk, and write the result to the '.out.txt' data file.
+# Parameters
+# ----------
+# TableName : str
+#     The name of the table to read.
+# function : callable
+#     A function that takes a chunk of the table (a data frame) and returns the data frame to write (e.g., the chunk with new columns added). If the function returns None, the chunk itself is written.
+# node_file : dict, optional
+#     The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+# DataFile : str, optional
+#     The path of the data file to write (default is the table's 'DataFile' with the extension '.out.txt').
+# chunksize : int, optional
+#     The number of rows per chunk (default is 100000).
+# columns : list or callable, optional
+#     The columns to read, as for 'load_table' (default is all columns).
+
+# Returns
+# -------
+# str
+#     The path of the data file written.
+result_out_txt = response.stream_table('GC EI Compounds', add_new_CD_column, node_args, chunksize=100000)
+
+
+# Update the response node file: add the new column to the table's 'ColumnDescriptions' and point the table's 'DataFile' to the data file written.
+response.add_column(node_response, 'GC EI Compounds', 'New CD Column', DataType='Int')
+response.get_table(node_response, 'GC EI Compounds')['DataFile'] = result_out_txt
\ No newline at end of file
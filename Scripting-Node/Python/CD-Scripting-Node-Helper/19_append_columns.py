@@ -0,0 +1,58 @@
+#==============================================================================
+# Name   : append_columns
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'append_columns' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to write a copy of the data file of a table with new columns appended, without copying the table in memory or re-writing its original columns.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file(read_only=True)
+
+
+# Define a variable to store the node file and use the method 'add_node_file' to add the node file.
+node_response = response.add_node_file(node_args)
+
+
+# Read the columns needed to compute the new column.
+GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args, columns=['GC EI Compounds ID'])
+
+
+# Create Column(s)
+# In this example, we will create a column 'New CD Column'.
+# We will assign this column values 1 to number of rows of 'GC EI Compounds' table (the actual values of the column are irrelevant, in this case).
+new_CD_column = list(range(1, len(GCEI_Compounds_table) + 1))
+
+
+# Use the method 'append_columns' to write the '.out.txt' data file: a copy of the original data file with the new column appended to each line.
+# Parameters
+# ----------
+# TableName : str
+#     The name of the table whose data file is copied.
+# columns : dict
+#     The new columns, as a dictionary of column names and values (lists, NumPy arrays, or pandas Series, with one value per row of the table).
+# node_file : dict, optional
+#     The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+# DataFile : str, optional
+#     The path of the data file to write (default is the table's 'DataFile' with the extension '.out.txt').
+
+# Returns
+# -------
+# str
+#     The path of the data file written.
+result_out_txt = response.append_columns('GC EI Compounds', {'New CD Column': new_CD_column}, node_args)
+
+
+# Update the response node file: add the new column to the table's 'ColumnDescriptions' and point the table's 'DataFile' to the data file written.
+response.add_column(node_response, 'GC EI Compounds', 'New CD Column', DataType='Int')
+response.get_table(node_response, 'GC EI Compounds')['DataFile'] = result_out_txt
\ No newline at end of file
@@ -0,0 +1,56 @@
+#==============================================================================
+# Name   : open_table
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'open_table' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to open the data file of a table as a LazyCDTable, which indexes the data file once and decodes each column only when it is first accessed.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file(read_only=True)
+
+
+# Define a variable to store the table and use the method 'open_table' to open the table.
+# Parameters
+# ----------
+# TableName : str
+#     The name of the table to open.
+# node_file : dict, optional
+#     The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+
+# Returns
+# -------
+# LazyCDTable
+#     The table, indexed but not yet decoded.
+GCEI_Compounds_table = response.open_table('GC EI Compounds', node_args)
+
+
+# Access the columns needed; each column is decoded into a NumPy array on first access and cached.
+# Columns that are never accessed are never decoded; the 'Structure' column is returned as a CDStructureColumn, which parses a row's molfile only when accessed (see 23_open_structures.py).
+GCEI_Compounds_ID = GCEI_Compounds_table['GC EI Compounds ID']
+GCEI_Compounds_name = GCEI_Compounds_table['Name']
+GCEI_Compounds_area = GCEI_Compounds_table['Area Genuine_1raw F1']
+
+
+# The number of rows and the column names are available without decoding any column.
+number_of_rows = len(GCEI_Compounds_table)
+column_names = GCEI_Compounds_table.column_names
+
+
+# The data file is memory-mapped; a single raw value can be accessed as a view of the mapped data file, without decoding it.
+first_name = bytes(GCEI_Compounds_table.field(0, 'Name'))
+
+
+# Unmap the data file once done (columns already decoded remain available).
+# Alternatively, use the LazyCDTable in a 'with' block: with response.open_table('GC EI Compounds') as GCEI_Compounds_table: ...
+GCEI_Compounds_table.close()
\ No newline at end of file
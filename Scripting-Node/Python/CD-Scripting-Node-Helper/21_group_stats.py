@@ -0,0 +1,51 @@
+#==============================================================================
+# Name   : group_stats
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'group_stats' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to compute per-sample-group statistics (mean, median, SD, CV, fold change, and log2 fold change) of the per-file columns of a metric (e.g., the 'Area' columns) of a table.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file(read_only=True)
+
+
+# Define a variable to store the table's data and use the method 'load_table' to read the table.
+GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args)
+
+
+# Define a variable to store the statistics and use the method 'group_stats' to compute them.
+# Parameters
+# ----------
+# data : pandas.DataFrame or LazyCDTable
+#     The table's data, e.g., as returned by 'load_table' or 'open_table'.
+# metric : str, optional
+#     The metric whose per-file columns are used, i.e., the part of the column names before the sample name (default is 'Area').
+# groups : dict or callable, optional
+#     The sample group of each sample, either as a dictionary of sample names and groups or as a function that takes a sample name and returns its group (default is the sample name without its replicate number, e.g., 'Genuine' for 'Genuine_1raw').
+# reference : str, optional
+#     The group used as the denominator of the ratios (default is the first group).
+# statistics : list, optional
+#     The statistics to compute for each group, among 'Mean', 'Median', 'SD', and 'CV' (default is all).
+# ratios : bool, optional
+#     If True, the fold change and log2 fold change of the mean of each group relative to the mean of the reference group are computed (default is True).
+
+# Returns
+# -------
+# pandas.DataFrame
+#     The statistics, with one row per row of the table and columns named, e.g., 'Area Mean (Genuine)', 'Area CV (Genuine)', 'Area Fold Change (Suspect/Genuine)', and 'Area Log2 Fold Change (Suspect/Genuine)'.
+area_stats = response.group_stats(GCEI_Compounds_table, metric='Area', reference='Genuine')
+
+
+# The sample groups can also be given explicitly, e.g., when the sample names do not follow the '<group>_<replicate>' convention.
+area_stats = response.group_stats(GCEI_Compounds_table, groups={'Genuine_1raw': 'Control', 'Genuine_2raw': 'Control', 'Genuine_3raw': 'Control', 'Suspect_1raw': 'Test', 'Suspect_2raw': 'Test', 'Suspect_3raw': 'Test'}, reference='Control')
\ No newline at end of file
@@ -0,0 +1,58 @@
+#==============================================================================
+# Name   : get_sample_index
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'get_sample_index' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to build the index of the samples, files, and per-file columns (e.g., 'Area Genuine_1raw F1') of a table from its 'ColumnDescriptions'.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file(read_only=True)
+
+
+# Define a variable to store the sample index and use the method 'get_sample_index' to build it.
+# Parameters
+# ----------
+# TableName : str
+#     The name of the table.
+# node_file : dict, optional
+#     The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+# groups : dict or callable, optional
+#     The sample group of each sample, either as a dictionary of sample names and groups or as a function that takes a sample name and returns its group (default is the sample name without its replicate number, e.g., 'Genuine' for 'Genuine_1raw').
+
+# Returns
+# -------
+# CDSampleIndex
+#     The index of the table's per-file columns:
+#     - 'metrics' : dict of metric -> {file ID: column position}, e.g., {'Area': {1: 23, 2: 24, ...}, 'Gap Status': {1: 29, ...}, 'Gap Fill Status': {1: 35, ...}}
+#     - 'column_names' : dict of metric -> {file ID: column name}
+#     - 'samples' : dict of file ID -> sample name, e.g., {1: 'Genuine_1raw', ...}
+#     - 'groups' : dict of file ID -> sample group, e.g., {1: 'Genuine', ...}
+sample_index = response.get_sample_index('GC EI Compounds', node_args)
+
+
+# Get the file IDs of each sample group, e.g., {'Genuine': [1, 2, 3], 'Suspect': [4, 5, 6]}.
+group_files = sample_index.get_group_files('Area')
+
+
+# Read the table and get the Area values of the 'Suspect' files as a single (rows x files) array, without looking up column names or positions.
+GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args)
+suspect_areas = sample_index.get_matrix(GCEI_Compounds_table, 'Area', sample_index.get_files('Area', group='Suspect'))
+
+# 'Gap Status' and 'Gap Fill Status' columns are read as categorical data (small integer codes and labels), so they can be filtered without comparing text row by row.
+# Get the Gap Status of all files as a single (rows x files) array of codes, and the list of labels the codes refer to (e.g., ['Full gap', 'Missing reference mass', 'No gap']).
+gap_codes, gap_labels = sample_index.get_codes(GCEI_Compounds_table, 'Gap Status')
+
+
+# Keep the compounds with no gap in at least 3 files.
+detected_compounds = GCEI_Compounds_table[sample_index.count(GCEI_Compounds_table, 'Gap Status', 'No gap') >= 3]
\ No newline at end of file
@@ -0,0 +1,67 @@
+#==============================================================================
+# Name   : open_structures
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'open_structures' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to open the 'Structure' column of a table as a CDStructureColumn, which parses the molfile of a row into arrays of atoms and bonds only when the row is accessed.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file(read_only=True)
+
+
+# Read the table; the 'Structure' column (a molfile per row, with ';' in place of line breaks) is left out by 'load_table' by default.
+GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args)
+
+
+# Define a variable to store the structures and use the method 'open_structures' to open the 'Structure' column.
+# Parameters
+# ----------
+# TableName : str
+#     The name of the table.
+# node_file : dict, optional
+#     The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+# ColumnName : str, optional
+#     The name of the column holding the molfiles (default is 'Structure').
+# maxsize : int, optional
+#     The number of parsed structures to keep in memory, the least recently used being removed first (default is 'STRUCTURE_CACHE_SIZE', i.e., 1024).
+
+# Returns
+# -------
+# CDStructureColumn
+#     The column, holding only the byte offsets of each row's molfile in the data file; the rows are in the same order as the rows of the table's data frame.
+structures = response.open_structures('GC EI Compounds', node_args)
+
+
+# Parse the structure of the first row (None if the row has no structure).
+# The structure is a dictionary:
+# - 'Name' : the first line of the molfile
+# - 'Elements' : the element symbol of each atom, e.g., ['C', 'C', 'O', ...]
+# - 'Coordinates' : the x, y, and z coordinates of each atom, as an array of shape (number of atoms, 3)
+# - 'Charges' : the formal charge of each atom
+# - 'Bonds' : the positions (starting at 0) in 'Elements' of the two atoms of each bond, as an array of shape (number of bonds, 2)
+# - 'BondOrders' : the bond type of each bond (1, 2, 3, or 4 for aromatic)
+first_structure = structures[0]
+
+
+# Parse only the structures needed, e.g., to count the chlorine atoms of the compounds with a name.
+named_rows = GCEI_Compounds_table.index[GCEI_Compounds_table['Name'].notna()]
+chlorine_atoms = {row: int((structures[row]['Elements'] == 'Cl').sum()) for row in named_rows if structures[row] is not None}
+
+
+# The molfile of a row can also be read as text, e.g., to pass it to a cheminformatics package.
+first_molfile = structures.get_molfile(0)
+
+
+# Unmap the data file once done.
+structures.table.close()
\ No newline at end of file
@@ -0,0 +1,66 @@
+#==============================================================================
+# Name   : add_connection_table
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'add_connection_table' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to write the data file of a connection table between two tables and to add the connection table ('CSVConnectionTable') to the node file.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+import numpy as np    # NumPy is a Python library for numerical computing with arrays.
+import os    # Miscellaneous operating system interfaces.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file()
+
+
+# Define a variable to store the response node file and use the method 'add_node_file' to create it.
+node_response = response.add_node_file(node_args)
+
+
+# Add the new table, with its 'ID' and 'WorkflowID' columns, to which the compounds will be connected.
+response.add_table(node_response, TableName = 'New CD Table', DataFile = os.path.join(os.path.dirname(node_args['Tables'][0]['DataFile']), 'NewCDTable.out.txt'), DataFormat = 'CSV')
+response.add_column(node_response, TableName = 'New CD Table', ColumnName = 'New CD Table ID', ID = 'ID', DataType = 'Int')
+response.add_column(node_response, TableName = 'New CD Table', ColumnName = 'New CD Table WorkflowID', ID = 'WorkflowID', DataType = 'Int')
+
+
+# Define the pairs of connected rows as two arrays of IDs (compound ID, new table ID).
+# An ID may appear in several pairs: here, every compound is connected to row 1 of 'New CD Table', and compounds 1 to 10 are also connected to row 2.
+compound_IDs = np.arange(1, len(response.open_table('GC EI Compounds', node_args)) + 1)
+first_IDs = np.concatenate([compound_IDs, compound_IDs[:10]])
+second_IDs = np.concatenate([np.full(len(compound_IDs), 1), np.full(10, 2)])
+
+
+# Use the method 'add_connection_table' to write the connection table's data file and add the connection table to the 'node_response' object.
+# Parameters
+# ----------
+# node_file : dict
+#     The node file dictionary containing the two tables, to which the connection table is added.
+# FirstTable : str
+#     The name of the first table (e.g., the table exported by Compound Discoverer).
+# SecondTable : str
+#     The name of the second table (e.g., a new table added with 'add_table').
+# id_pairs : numpy.ndarray or tuple
+#     The pairs of connected rows, either as an array of shape (number of pairs, 2) or as a tuple of two arrays of the same length.
+# DataFile : str, optional
+#     The path of the data file to write (default is the first table's 'DataFile' with the second table's name appended, e.g., 'ConsolidatedGCEICompoundItem-NewCDTable.out.txt').
+# WorkflowID : int or numpy.ndarray, optional
+#     The value(s) of the 'WorkflowID' columns (default is the node file's 'CurrentWorkflowID').
+# TableName : str, optional
+#     The name of the connection table (default is '<FirstTable> - <SecondTable>').
+
+# Returns
+# -------
+# dict
+#     The updated node file dictionary with the connection table, e.g.:
+#     {'TableName': 'GC EI Compounds - New CD Table', 'DataFile': '...-NewCDTable.out.txt', 'DataFormat': 'CSVConnectionTable', 'Options': {'FirstTable': 'GC EI Compounds', 'SecondTable': 'New CD Table'},
+#      'ColumnDescriptions': [{'ColumnName': 'GC EI Compounds ID', 'ID': 'ID', ...}, {'ColumnName': 'New CD Table ID', 'ID': 'ID', ...}, {'ColumnName': 'New CD Table WorkflowID', 'ID': 'WorkflowID', ...}]}
+node_response = response.add_connection_table(node_response, 'GC EI Compounds', 'New CD Table', (first_IDs, second_IDs))
\ No newline at end of file
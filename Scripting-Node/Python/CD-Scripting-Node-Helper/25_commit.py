@@ -0,0 +1,82 @@
+#==============================================================================
+# Name   : commit
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'add_table_data' and 'commit' methods of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The methods are defined in the CDScriptingNodeHelper and are used to set the data of the response tables and to write all of the tables' data files and the response node file at once, so that Compound Discoverer receives either all of the results or none of them.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file()
+
+
+# Define a variable to store the response node file and use the method 'add_node_file' to create it.
+node_response = response.add_node_file(node_args)
+
+
+# Read the table (including the 'Structure' column, as the whole table is written back) and add a new column.
+GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args, structures=True)
+GCEI_Compounds_table['New CD Column'] = GCEI_Compounds_table['GC EI Compounds ID'] * 2
+response.add_column(node_response, 'GC EI Compounds', 'New CD Column', DataType = 'Int')
+
+
+# Use the method 'add_table_data' to set the data of the table; nothing is written yet.
+# Parameters
+# ----------
+# node_file : dict
+#     The response node file dictionary containing the table.
+# TableName : str
+#     The name of the table.
+# data : pandas.DataFrame or callable
+#     The table's data, or a function that takes the path of a file and writes the table's data file to it (e.g., lambda path: response.append_columns('GC EI Compounds', columns, DataFile=path)).
+# DataFile : str, optional
+#     The path of the table's data file (default is the table's 'DataFile' if it ends with '.out.txt', otherwise the table's 'DataFile' with the extension '.out.txt').
+
+# Returns
+# -------
+# dict
+#     The node file dictionary, with the table's 'DataFile' set to the path of the data file to be written (here, 'ConsolidatedGCEICompoundItem.out.txt').
+node_response = response.add_table_data(node_response, 'GC EI Compounds', GCEI_Compounds_table)
+
+
+# Use the method 'commit' to write the data files of all the tables set with 'add_table_data' and then the 'node_response.json' file.
+# Parameters
+# ----------
+# node_file : dict
+#     The response node file dictionary to save.
+# filename : str, optional
+#     The filename to which to save the node file. If not an absolute path, then the file is saved in the same directory as the script (default is the node file's 'ExpectedResponsePath').
+# max_workers : int, optional
+#     The number of data files written at the same time (default is the number of data files, up to 32).
+# compact : bool, optional
+#     If True, the node file is saved on a single line without indentation (default is False).
+# validate : bool, optional
+#     If True, the data files written are checked against the node file with 'validate' before they replace the existing files (default is False).
+# fast : bool, optional
+#     If True, the node file is serialized with the fastest JSON package installed, e.g., 'orjson' (default is False, i.e., 'json' with 'indent=4').
+
+# Returns
+# -------
+# str
+#     The path of the node file saved.
+
+# Notes
+# -----
+# Each file is written to a temporary file (in parallel) and flushed to disk; only once all of them have been written are the temporary files renamed, the node file last.
+# If any file fails (or, with 'validate=True', does not match the node file), an exception listing all the errors is raised and neither the data files nor the node file are changed.
+node_response_path = response.commit(node_response, validate=True)
+
+
+# The method 'validate' can also be used on its own, e.g., on data files written otherwise; it returns the list of problems found (empty if none).
+# Each data file is read once, sequentially, and the data files are read in parallel; use 'rows' to check only the first rows of each data file.
+problems = response.validate(node_response)
\ No newline at end of file
@@ -0,0 +1,56 @@
+#==============================================================================
+# Name   : run_script
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'run_script' function of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The function is defined in the CDScriptingNodeHelper and is used to run a script with a CDScriptingResponse object while recording the time spent reading the node file, loading tables, computing, and writing the data files and the response node file.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+import numpy as np    # NumPy is a Python library for numerical computing with arrays.
+from CDScriptingNodeHelper import run_script    # Import the 'run_script' function from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define the script as a function that takes the CDScriptingResponse object created by 'run_script'.
+def main(response):
+    # Phase 'read node file'.
+    node_args = response.get_node_file(read_only=True)
+    node_response = response.add_node_file(node_args)
+
+    # Phase 'load table GC EI Compounds'.
+    GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args, structures=True)
+
+    # Phase 'compute' (the time of the function not spent in any other phase).
+    areas = GCEI_Compounds_table[[name for name in GCEI_Compounds_table.columns if name.startswith('Area ') and name != 'Area Max']]
+    GCEI_Compounds_table['Log Area Sum'] = np.log10(areas.sum(axis=1) + 1)
+    response.add_column(node_response, 'GC EI Compounds', 'Log Area Sum', DataType = 'Float')
+
+    # Phases 'write files', 'write ConsolidatedGCEICompoundItem.out.txt', and 'write response'.
+    response.add_table_data(node_response, 'GC EI Compounds', GCEI_Compounds_table)
+    response.commit(node_response)
+
+
+# Use the function 'run_script' to run the script.
+# Parameters
+# ----------
+# function : callable
+#     The script function, which takes the CDScriptingResponse object.
+# timing : bool, optional
+#     If True, the timing report is saved as a JSON file next to the node file's 'ExpectedResponsePath' (default is True).
+# filename : str, optional
+#     The name of the timing report file (default is 'node_timing.json').
+
+# Returns
+# -------
+# object
+#     The value returned by the script function.
+
+# Notes
+# -----
+# The timing report ('node_timing.json') lists each phase with its wall time ('Wall', including nested phases, and 'Exclusive', excluding them), CPU time ('CPU'), and the peak resident memory of the process at the end of the phase ('PeakRSS', in bytes), e.g.:
+# {"Phase": "load table GC EI Compounds", "Thread": "MainThread", "Depth": 1, "Start": 0.01, "Wall": 0.07, "Exclusive": 0.07, "CPU": 0.07, "PeakRSS": 134217728}
+# The peak resident memory is measured with the 'resource' module or, on Windows, with the optional 'psutil' package (pip install psutil); it is null if neither is available.
+if __name__ == '__main__':
+    run_script(main)
\ No newline at end of file
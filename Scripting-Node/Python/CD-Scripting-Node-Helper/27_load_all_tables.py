@@ -0,0 +1,48 @@
+#==============================================================================
+# Name   : load_all_tables
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'load_all_tables' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to read the data files of all the tables exported by Compound Discoverer (e.g., compounds, features, and connection tables) at the same time, each into a data frame.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+from CDScriptingNodeHelper import CDScriptingResponse    # Import the CDScriptingResponse class from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define a variable to store the CDScriptingResponse object.
+response = CDScriptingResponse()
+
+
+# Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+node_args = response.get_node_file(read_only=True)
+
+
+# Define a variable to store the tables' data and use the method 'load_all_tables' to read all the tables of the node file.
+# Parameters
+# ----------
+# node_file : dict, optional
+#     The node file dictionary containing the tables (default is the node file returned by 'get_node_file').
+# TableNames : list, optional
+#     The names of the tables to read (default is all tables of the node file).
+# max_workers : int, optional
+#     The number of data files read at the same time (default is the number of CPU cores, up to the number of tables).
+# **kwargs : dict, optional
+#     The options passed to 'load_table' for every table ('engine', 'columns', 'cache', 'structures').
+
+# Returns
+# -------
+# dict
+#     The tables' data, as a dictionary of table names and data frames, e.g.:
+#     {'GC EI Compounds': <pandas.DataFrame of 1285 rows>}
+tables = response.load_all_tables(node_args)
+
+
+# Each data frame is the same as the one returned by 'load_table' for the table.
+GCEI_Compounds_table = tables['GC EI Compounds']
+
+
+# Read only some of the tables, with the same options for all of them (here, including the 'Structure' columns).
+tables = response.load_all_tables(node_args, TableNames=['GC EI Compounds'], structures=True)
\ No newline at end of file
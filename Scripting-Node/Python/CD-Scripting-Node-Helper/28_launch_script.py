@@ -0,0 +1,58 @@
+#==============================================================================
+# Name   : launch_script
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'launch' function of the Compound Discoverer Scripting Node "Launcher" (CDScriptingNodeLauncher) file. The function is defined in the CDScriptingNodeLauncher and is used to hand the run of a script over to a long-lived worker process that has already imported the CDScriptingNodeHelper, pandas, and NumPy, or to run the script in-process if no worker is running.
+# Usage  : Start the worker once (e.g., in a separate console, before running the workflows): python CDScriptingNodeLauncher.py serve
+#          Compound Discoverer then runs this script as usual: python 28_launch_script.py node_args.json
+#==============================================================================
+
+
+# Load Libraries
+# Only the standard library is imported here: the CDScriptingNodeHelper, pandas, and NumPy are imported inside the script function, which runs in the worker (where they are already imported).
+import sys    # System-specific parameters and functions.
+#==============================
+
+
+# Define the script as a function that takes the CDScriptingResponse object (see 'run_script').
+def main(response):
+    import numpy as np    # NumPy is a Python library for numerical computing with arrays.
+
+    node_args = response.get_node_file(read_only=True)
+    node_response = response.add_node_file(node_args)
+
+    GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args, structures=True)
+    areas = GCEI_Compounds_table[[name for name in GCEI_Compounds_table.columns if name.startswith('Area ') and name != 'Area Max']]
+    GCEI_Compounds_table['Log Area Sum'] = np.log10(areas.sum(axis=1) + 1)
+    response.add_column(node_response, 'GC EI Compounds', 'Log Area Sum', DataType = 'Float')
+
+    response.add_table_data(node_response, 'GC EI Compounds', GCEI_Compounds_table)
+    response.commit(node_response)
+
+
+# Use the function 'launch' to run the script function in the worker.
+# Parameters
+# ----------
+# script : str
+#     The path of the script file (e.g., __file__).
+# node_file_path : str, optional
+#     The path of the node file (default is the first command line argument, sys.argv[1], as passed by Compound Discoverer).
+# function : str, optional
+#     The name of the script function, which takes the CDScriptingResponse object (default is 'main').
+# timing : bool, optional
+#     If True, the timing report is saved next to the node file's 'ExpectedResponsePath' (default is True).
+# address : str, optional
+#     The address of the worker (default is a named pipe on Windows, otherwise a socket file in the temporary directory).
+
+# Returns
+# -------
+# int
+#     The exit status of the run: 0 if the script function succeeded, otherwise 1 (the error is printed).
+
+# Notes
+# -----
+# The worker imports this file as a module (without running this block) and runs 'main' with 'run_script'; the output of the script is printed here once it has finished.
+# If no worker is running, 'main' is run in this process, importing the CDScriptingNodeHelper as usual.
+if __name__ == '__main__':
+    from CDScriptingNodeLauncher import launch
+    sys.exit(launch(__file__))
\ No newline at end of file
@@ -0,0 +1,80 @@
+#==============================================================================
+# Name   : map_rows
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'map_rows' method of the Compound Discoverer Scripting Node "Helper" (CDScriptingNodeHelper) file. The method is defined in the CDScriptingNodeHelper and is used to compute new columns from numeric columns of a table by running a function over shards of rows on all CPU cores, with the data shared between the processes rather than copied.
+#==============================================================================
+
+
+# Load Libraries
+# Load a package/module that is capable of reading JSON files.
+import math    # Mathematical functions.
+import numpy as np    # NumPy is a Python library for numerical computing with arrays.
+from CDScriptingNodeHelper import run_script    # Import the 'run_script' function from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define the function computing the new columns, at the top level of the script so that the processes can import it.
+# It takes the values of the columns for a shard of rows (missing values are NaN) and returns the new values for these rows, here a custom score written in pure Python.
+def custom_score(values):
+    scores = np.empty((len(values), 2))
+
+    for row, (*areas, total_score) in enumerate(values):
+        detected = [area for area in areas if not math.isnan(area)]
+        scores[row, 0] = total_score * math.log10(sum(detected) + 1) if detected else math.nan
+        scores[row, 1] = len(detected)
+
+    return scores
+
+
+# Define the script as a function that takes the CDScriptingResponse object (see 'run_script').
+def main(response):
+    # Define a variable to store the node file and use the method 'get_node_file' to get the node file.
+    node_args = response.get_node_file()
+
+    # Define a variable to store the response node file and use the method 'add_node_file' to create it.
+    node_response = response.add_node_file(node_args)
+
+    # Read the table.
+    GCEI_Compounds_table = response.load_table('GC EI Compounds', node_args, structures=True)
+    area_columns = [name for name in GCEI_Compounds_table.columns if name.startswith('Area ') and name != 'Area Max']
+
+    # Use the method 'map_rows' to compute the new columns.
+    # Parameters
+    # ----------
+    # data : pandas.DataFrame or LazyCDTable
+    #     The table's data, e.g., as returned by 'load_table' or 'open_table'.
+    # columns : list
+    #     The names of the numeric columns passed to the function.
+    # function : callable
+    #     The function, which takes a float64 array of shape (number of rows of the shard, number of columns) and returns the new values for these rows (an array of shape (rows, outputs), a one-dimensional array for a single output, or a dictionary of output names and arrays).
+    # outputs : str or list
+    #     The name(s) of the new column(s).
+    # max_workers : int, optional
+    #     The number of processes (default is the number of CPU cores).
+    # shards : int, optional
+    #     The number of shards of rows (default is 'max_workers').
+
+    # Returns
+    # -------
+    # pandas.DataFrame
+    #     The new columns (float64), with one row per row of the table, e.g.:
+    #        Custom Score  Detected Files
+    #     0        574.08             6.0
+    #     1           NaN             6.0    (no 'Total Score')
+    scores = response.map_rows(GCEI_Compounds_table, area_columns + ['Total Score'], custom_score, ['Custom Score', 'Detected Files'])
+
+    # Add the new columns to the table and to the node file.
+    GCEI_Compounds_table[scores.columns] = scores
+    for ColumnName in scores.columns:
+        response.add_column(node_response, 'GC EI Compounds', ColumnName, DataType = 'Float')
+
+    # Write the table and the node file.
+    response.add_table_data(node_response, 'GC EI Compounds', GCEI_Compounds_table)
+    response.commit(node_response, validate=True)
+
+
+# Run the script under "if __name__ == '__main__':", since the processes import the script again on Windows.
+# The script can be run directly (python 29_map_rows.py node_args.json), through the worker of the CDScriptingNodeLauncher (python CDScriptingNodeLauncher.py run 29_map_rows.py node_args.json), or on many job folders with the CDScriptingNodeBatch runner; in each case the processes of 'map_rows' import 'custom_score' from this file.
+if __name__ == '__main__':
+    run_script(main)
\ No newline at end of file
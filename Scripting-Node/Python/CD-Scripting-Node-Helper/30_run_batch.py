@@ -0,0 +1,60 @@
+#==============================================================================
+# Name   : run_batch
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Demonstrate the 'run_batch' function of the Compound Discoverer Scripting Node "Batch" (CDScriptingNodeBatch) file. The function is defined in the CDScriptingNodeBatch and is used to run a Scripting Node script again on many archived job folders (e.g., 'Scratch/Job239/Script(3)'), on a pool of processes, with the Windows paths of each node file rewritten to the local archive, and to collect the status and time of each job.
+# Usage  : python 30_run_batch.py <archive folder>
+#          The same run from the command line: python CDScriptingNodeBatch.py 26_run_script.py <archive folder> --map "C:/ProgramData/Thermo=D:/Archive/Thermo"
+#==============================================================================
+
+
+# Load Libraries
+import os    # Miscellaneous operating system interfaces.
+import sys    # System-specific parameters and functions.
+from CDScriptingNodeBatch import run_batch    # Import the 'run_batch' function from the CDScriptingNodeBatch module.
+#==============================
+
+
+# Run the batch under "if __name__ == '__main__':", since the processes of the pool import this file again on Windows.
+if __name__ == '__main__':
+    # Define a variable to store the archive folder (e.g., a copy of the 'Scratch' folder of Compound Discoverer, with one folder per job).
+    archive = sys.argv[1]
+
+    # Define a variable to store the path map: the original (Windows) prefixes of the paths in the node files and the local prefixes they are replaced with.
+    # The original job folder of each node file (the folder of its 'ExpectedResponsePath') is always mapped to the folder of its 'node_args.json'; the path map is only needed for data files outside the job folder.
+    path_map = [('C:/ProgramData/Thermo', 'D:/Archive/Thermo')]
+
+    # Use the function 'run_batch' to run the script on all the job folders of the archive.
+    # Parameters
+    # ----------
+    # script : str
+    #     The path of the script file, with a script function that takes the CDScriptingResponse object (e.g., '26_run_script.py').
+    # folders : list
+    #     The folders in which to look for job folders (folders with a 'node_args.json' file), e.g., a 'Scratch' folder.
+    # max_workers : int, optional
+    #     The number of jobs run at the same time (default is the number of CPU cores).
+    # function : str, optional
+    #     The name of the script function (default is 'main').
+    # timing : bool, optional
+    #     If True, the timing report of each job is saved next to its response node file (default is True).
+    # path_map : list, optional
+    #     Additional (original prefix, local prefix) pairs (default is none).
+    # output : str, optional
+    #     The path of the JSON file to which the summary is saved (default is none).
+
+    # Returns
+    # -------
+    # list
+    #     The summary of each job, in the order of the job folders, e.g.:
+    #     [{'Job': 'D:/Archive/Scratch/Job2/Script(1)', 'Status': 'OK', 'Seconds': 2.41, 'Error': None},
+    #      {'Job': 'D:/Archive/Scratch/Job10/Script(1)', 'Status': 'Failed', 'Seconds': 0.35, 'Error': "FileNotFoundError: [Errno 2] No such file or directory: 'D:/Archive/Scratch/Job10/Script(1)/ConsolidatedGCEICompoundItem.txt'"}]
+
+    # Notes
+    # -----
+    # Each job is run on a copy of its node file with the paths rewritten ('node_args.local.json'); the archived 'node_args.json' is left unchanged. The output of the script is saved to 'batch_log.txt' in each job folder.
+    summary = run_batch(os.path.join(os.path.dirname(os.path.abspath(__file__)), '26_run_script.py'), [archive], path_map = path_map, output = os.path.join(archive, 'batch_summary.json'))
+
+    # Print the jobs that failed.
+    for job in summary:
+        if job['Status'] != 'OK':
+            print(f"{job['Job']}: {job['Error']}")
\ No newline at end of file
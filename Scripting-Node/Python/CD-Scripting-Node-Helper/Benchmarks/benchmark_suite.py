@@ -0,0 +1,153 @@
+#==============================================================================
+# Name   : benchmark_suite
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Time the main operations of the CDScriptingNodeHelper (loading a table, computing per-group statistics, adding a column, writing a connection table, and committing the response) on synthetic Compound Discoverer exports of several sizes, and save the results to compare them with earlier runs.
+# Usage  : python benchmark_suite.py [--sizes 10000x6 100000x6 100000x100] [--repeat 3] [--directory <folder>] [--output benchmark_results.json] [--compare <earlier results>]
+#==============================================================================
+
+
+# Load Libraries
+import argparse    # Parser for command-line options, arguments and sub-commands.
+import json    # JSON encoder and decoder.
+import numpy as np    # NumPy is a Python library for numerical computing with arrays.
+import os    # Miscellaneous operating system interfaces.
+import pandas as pd    # Pandas is a Python library for data analysis and manipulation.
+import platform    # Access to underlying platform's identifying data.
+import shutil    # High-level file operations.
+import sys    # System-specific parameters and functions.
+import tempfile    # Generate temporary files and directories.
+import time    # Time access and conversions.
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from CDScriptingNodeHelper import CDScriptingResponse, dumps_json    # Import the CDScriptingResponse class and the 'dumps_json' function from the CDScriptingNodeHelper module.
+from generate_export import generate_export    # Import the 'generate_export' function from the generate_export module.
+#==============================
+
+
+TABLE_NAME = 'GC EI Compounds'
+
+
+def measure(function, setup=None, repeat: int = 3):
+    """
+    Returns the shortest wall time in seconds of 'repeat' calls of a function; if 'setup' is given, it is called (untimed) before each call and its result is passed to the function.
+    """
+    times = []
+
+    for _ in range(repeat):
+        arguments = (setup(),) if setup is not None else ()
+        start = time.perf_counter()
+        function(*arguments)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+def benchmark(node_file_path: str, repeat: int = 3):
+    """
+    Times each operation on the export described by the node file, and returns a dictionary of operation names and times in seconds.
+    """
+    # The CDScriptingResponse object reads the path of the node file from the first command line argument.
+    sys.argv[1:] = [node_file_path]
+    response = CDScriptingResponse()
+    node_args = response.get_node_file()
+    directory = os.path.dirname(node_file_path)
+
+    data = response.load_table(TABLE_NAME, node_args, structures=True)
+    ids = data['GC EI Compounds ID'].to_numpy()
+
+    def new_response():
+        node_response = response.add_node_file(node_args)
+        response.add_table(node_response, TableName='Benchmark Table', DataFile=os.path.join(directory, 'BenchmarkTable.out.txt'), DataFormat='CSV')
+        response.add_column(node_response, TableName='Benchmark Table', ColumnName='Benchmark Table ID', ID='ID', DataType='Int')
+        response.add_column(node_response, TableName='Benchmark Table', ColumnName='Benchmark Table WorkflowID', ID='WorkflowID', DataType='Int')
+        return node_response
+
+    def open_table():
+        with response.open_table(TABLE_NAME, node_args) as table:
+            table.get_column('Area Max')
+
+    def commit(node_response):
+        response.add_column(node_response, TABLE_NAME, 'Benchmark Column', DataType='Int')
+        data['Benchmark Column'] = ids * 2
+        response.add_table_data(node_response, TABLE_NAME, data)
+        response.commit(node_response)
+
+    results = {
+        'load_table': measure(lambda: response.load_table(TABLE_NAME, node_args), repeat=repeat),
+        'load_table (structures)': measure(lambda: response.load_table(TABLE_NAME, node_args, structures=True), repeat=repeat),
+        'open_table': measure(open_table, repeat=repeat),
+        'group_stats': measure(lambda: response.group_stats(data), repeat=repeat),
+        'append_columns': measure(lambda: response.append_columns(TABLE_NAME, {'Benchmark Column': ids * 2}, node_args), repeat=repeat),
+        'add_connection_table': measure(lambda node_response: response.add_connection_table(node_response, TABLE_NAME, 'Benchmark Table', (ids, np.ones(len(ids), dtype=np.int64))), new_response, repeat),
+        'add_table_data + commit': measure(commit, new_response, repeat)
+    }
+
+    data.drop(columns='Benchmark Column', inplace=True, errors='ignore')
+
+    return results
+
+
+def environment():
+    """
+    Returns the details of the machine and of the Python packages the results depend on.
+    """
+    return {
+        'Date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'Platform': platform.platform(),
+        'Processor': platform.processor() or platform.machine(),
+        'CPUs': os.cpu_count(),
+        'Python': platform.python_version(),
+        'NumPy': np.__version__,
+        'pandas': pd.__version__
+    }
+
+
+def compare(results: list, previous_path: str):
+    """
+    Prints the ratio of the time of each operation to its time in earlier results (a ratio above 1 is a slowdown).
+    """
+    with open(previous_path, mode='r', encoding='utf-8') as f:
+        previous = {(result['Rows'], result['Files'], result['Operation']): result['Seconds'] for result in json.load(f)['Results']}
+
+    print(f'\nCompared with {previous_path}:')
+    for result in results:
+        key = (result['Rows'], result['Files'], result['Operation'])
+        if key in previous:
+            print(f'{result["Rows"]:>9} {result["Files"]:>6} {result["Operation"]:<24} {previous[key]:>10.3f} {result["Seconds"]:>10.3f} {result["Seconds"] / previous[key]:>8.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time the CDScriptingNodeHelper on synthetic Compound Discoverer exports.')
+    parser.add_argument('--sizes', nargs='+', default=['10000x6', '100000x6', '100000x100'], help='the sizes of the exports, as <rows>x<files> (default 10000x6 100000x6 100000x100)')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of times each operation is timed; the shortest time is kept (default 3)')
+    parser.add_argument('--directory', help='the directory in which the exports are generated and kept (default is a temporary directory, removed afterwards)')
+    parser.add_argument('--output', default='benchmark_results.json', help='the file to which the results are saved (default benchmark_results.json)')
+    parser.add_argument('--compare', help='earlier results to compare with')
+    args = parser.parse_args()
+
+    root = args.directory or tempfile.mkdtemp(prefix='cd_benchmark_')
+    results = []
+
+    print(f'{"rows":>9} {"files":>6} {"operation":<24} {"time (s)":>10}')
+
+    try:
+        for size in args.sizes:
+            rows, files = (int(number) for number in size.lower().split('x'))
+            node_file_path = generate_export(os.path.join(root, f'{rows}x{files}'), rows, files)
+
+            for operation, seconds in benchmark(node_file_path, args.repeat).items():
+                results.append({'Rows': rows, 'Files': files, 'Operation': operation, 'Seconds': seconds})
+                print(f'{rows:>9} {files:>6} {operation:<24} {seconds:>10.3f}')
+
+    finally:
+        if args.directory is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+    with open(args.output, mode='wb') as f:
+        f.write(dumps_json({'Environment': environment(), 'Repeat': args.repeat, 'Results': results}))
+
+    print(f'Results saved to {args.output}')
+
+    if args.compare:
+        compare(results, args.compare)
\ No newline at end of file
@@ -0,0 +1,222 @@
+#==============================================================================
+# Name   : generate_export
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Generate a synthetic Compound Discoverer export (a 'node_args.json' node file and the 'GC EI Compounds' data file it describes) shaped like the example export in the 'Data' folder, with any number of rows and sample files, to measure the CDScriptingNodeHelper at production sizes.
+# Usage  : python generate_export.py <output directory> [--rows 100000] [--files 6] [--seed 0]
+#==============================================================================
+
+
+# Load Libraries
+import argparse    # Parser for command-line options, arguments and sub-commands.
+import json    # JSON encoder and decoder.
+import numpy as np    # NumPy is a Python library for numerical computing with arrays.
+import os    # Miscellaneous operating system interfaces.
+#==============================
+
+
+# Columns of the example 'GC EI Compounds' table that are not per-file columns (name, 'DataType', and 'Options').
+COMPOUND_COLUMNS = [
+    ('GC EI Compounds ID', 'Int', {}),
+    ('Structure', 'String', {}),
+    ('TIC Sum', 'Float', {}),
+    ('Name', 'String', {}),
+    ('RT in min', 'Float', {}),
+    ('Reference mz', 'Float', {}),
+    ('Avg TIC', 'Float', {}),
+    ('NIST Lib Hit Formula', 'String', {}),
+    ('NIST Theo Mol Mass', 'Float', {}),
+    ('NIST Observed Mol Mass', 'Float', {}),
+    ('Area Max', 'Float', {}),
+    ('MS Depth', 'Int', {}),
+    ('Total Score', 'Float', {}),
+    ('HRF Score', 'Float', {}),
+    ('RHRF Score', 'Float', {}),
+    ('SI', 'Int', {}),
+    ('RSI', 'Int', {}),
+    ('Calculated RI', 'Int', {}),
+    ('RI Delta', 'Int', {}),
+    ('MS2', 'String', {}),
+    ('Calc MW', 'Float', {}),
+    ('Checked', 'Boolean', {}),
+    ('Tags', 'Boolean', {'DataGroupName': 'Tags'})
+]
+
+
+# Per-file columns: metric, 'DataType', and 'DataGroupName'.
+FILE_COLUMNS = [
+    ('Area', 'Float', 'Area'),
+    ('Gap Status', 'Int', 'GapStatus'),
+    ('Gap Fill Status', 'Int', 'GapFillStatus')
+]
+
+
+# Gap Status labels, their probabilities, and the matching Gap Fill Status codes (as in the example export).
+GAP_STATUSES = ['No gap', 'Full gap', 'Missing reference mass']
+GAP_PROBABILITIES = [0.3, 0.65, 0.05]
+GAP_FILL_STATUSES = [1, 128, 2]
+
+
+# Elements of the synthetic structures and their probabilities.
+ELEMENTS = ['C', 'O', 'N', 'Cl', 'S', 'Si']
+ELEMENT_PROBABILITIES = [0.7, 0.14, 0.08, 0.03, 0.03, 0.02]
+
+
+def sample_names(files: int):
+    """
+    Returns the sample names of the files: half 'Genuine' and half 'Suspect' replicates (e.g., 'Genuine_1raw'), as in the example export.
+    """
+    genuine = (files + 1) // 2
+    return [f'Genuine_{number + 1}raw' for number in range(genuine)] + [f'Suspect_{number + 1}raw' for number in range(files - genuine)]
+
+
+def make_molfile(rng, atoms: int):
+    """
+    Returns a synthetic molfile (MDL V2000) with the specified number of atoms, flattened with ';' in place of line breaks as in the 'Structure' column.
+    """
+    rings = list(range(1, atoms - 5, 6))
+    bonds = atoms - 1 + len(rings)
+    elements = rng.choice(ELEMENTS, size=atoms, p=ELEMENT_PROBABILITIES)
+    coordinates = np.round(rng.uniform(-5, 5, size=(atoms, 2)), 4)
+
+    lines = ['No Name', '  -NISTMS-12099911132D 1   1.0         0.0          ', 'Oct 15 22:03:26 2024 (hash=00000000)', f'{atoms:>3}{bonds:>3}  0  0  0  0  0  0  0  0  0']
+    lines += [f'{x:>10.4f}{y:>10.4f}{0:>10.4f} {element:<3} 0  0  0     0  0  0  0  0  0' for (x, y), element in zip(coordinates, elements)]
+    lines += [f'{first:>3}{first + 1:>3}{order:>3}  0  0  0  0' for first, order in zip(range(1, atoms), rng.choice([1, 2], size=atoms - 1, p=[0.7, 0.3]))]
+    lines += [f'{first:>3}{first + 6:>3}  1  0  0  0  0' for first in rings]
+
+    return ';'.join(lines) + ';$$$$'
+
+
+def column_descriptions(files: int):
+    """
+    Returns the 'ColumnDescriptions' of the synthetic 'GC EI Compounds' table.
+    """
+    descriptions = [{'ColumnName': name, 'ID': 'ID' if name == 'GC EI Compounds ID' else '', 'DataType': DataType, 'Options': dict(Options)} for name, DataType, Options in COMPOUND_COLUMNS]
+
+    for metric, DataType, DataGroupName in FILE_COLUMNS:
+        descriptions += [{'ColumnName': f'{metric} {sample} F{number + 1}', 'ID': '', 'DataType': DataType, 'Options': {'DataGroupName': DataGroupName}} for number, sample in enumerate(sample_names(files))]
+
+    return descriptions
+
+
+def generate_block(rng, first_id: int, rows: int, files: int, molfiles: list, structure_fraction: float, missing_fraction: float):
+    """
+    Returns a block of rows of the synthetic 'GC EI Compounds' table as text, with quoted fields padded as in the example export.
+    """
+    padding = np.where(np.arange(files) > 0, ' ', '')
+
+    ids = np.arange(first_id, first_id + rows)
+    rt = np.round(rng.uniform(2, 40, rows), 3)
+    areas = np.round(rng.lognormal(15, 1.5, size=(rows, files))).astype(np.int64)
+    area_text = np.char.add(padding, areas.astype(str))
+    area_text[rng.random((rows, files)) < missing_fraction] = ' '
+    gaps = rng.choice(len(GAP_STATUSES), size=(rows, files), p=GAP_PROBABILITIES)
+    structures = np.where(rng.random(rows) < structure_fraction, np.array(molfiles, dtype=object)[rng.integers(0, len(molfiles), rows)], '')
+    named = rng.random(rows) < 0.8
+
+    columns = {
+        'GC EI Compounds ID': ids.astype(str),
+        'Structure': structures,
+        'TIC Sum': np.round(rng.lognormal(17, 1, rows)).astype(np.int64).astype(str),
+        'Name': np.where(named, np.char.add('Compound ', ids.astype(str)), np.char.add('Peak@', rt.astype(str))),
+        'RT in min': rt.astype(str),
+        'Reference mz': np.round(rng.uniform(50, 600, rows), 5).astype(str),
+        'Avg TIC': np.round(rng.lognormal(16, 1, rows)).astype(np.int64).astype(str),
+        'NIST Lib Hit Formula': np.where(named, np.char.add('C', rng.integers(3, 40, rows).astype(str)), ''),
+        'NIST Theo Mol Mass': np.where(named, np.round(rng.uniform(50, 700, rows), 5).astype(str), ''),
+        'NIST Observed Mol Mass': np.full(rows, ''),
+        'Area Max': areas.max(axis=1).astype(str),
+        'MS Depth': np.full(rows, '1'),
+        'Total Score': np.round(rng.uniform(40, 100, rows), 1).astype(str),
+        'HRF Score': np.round(rng.uniform(40, 100, rows), 1).astype(str),
+        'RHRF Score': np.round(rng.uniform(40, 100, rows), 1).astype(str),
+        'SI': rng.integers(300, 999, rows).astype(str),
+        'RSI': rng.integers(300, 999, rows).astype(str),
+        'Calculated RI': np.full(rows, ''),
+        'RI Delta': np.full(rows, ''),
+        'MS2': np.full(rows, 'NoMSn'),
+        'Calc MW': np.round(rng.uniform(50, 700, rows), 5).astype(str),
+        'Checked': np.full(rows, 'False'),
+        'Tags': np.full(rows, '')
+    }
+
+    # The per-file columns are handled as (rows x files) arrays, and all fields are joined into lines at once.
+    blocks = [np.column_stack([values.astype(object) for values in columns.values()]), area_text, np.char.add(padding, np.array(GAP_STATUSES)[gaps]), np.char.add(padding, np.array(GAP_FILL_STATUSES).astype(str)[gaps])]
+    fields = np.hstack([block.astype(object) for block in blocks])
+
+    return ''.join('"' + '"\t"'.join(row) + '"\r\n' for row in fields.tolist())
+
+
+def generate_export(directory: str, rows: int = 100000, files: int = 6, seed: int = 0, structure_fraction: float = 0.78, missing_fraction: float = 0.01):
+    """
+    Generates a synthetic Compound Discoverer export.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to which the node file ('node_args.json') and the data file ('ConsolidatedGCEICompoundItem.txt') are written.
+    rows : int, optional
+        The number of rows (compounds) of the table (default is 100000).
+    files : int, optional
+        The number of sample files, i.e., of 'Area', 'Gap Status', and 'Gap Fill Status' columns (default is 6).
+    seed : int, optional
+        The seed of the random number generator (default is 0).
+    structure_fraction : float, optional
+        The fraction of rows with a structure (default is 0.78, as in the example export).
+    missing_fraction : float, optional
+        The fraction of missing (single-space) 'Area' values (default is 0.01).
+
+    Returns
+    -------
+    str
+        The path of the node file.
+
+    Notes
+    -----
+    The data file is written in blocks of rows, so tables of 10^6 rows and 1000 files (about 3000 columns) can be generated without holding the table in memory. Fields are quoted and tab-separated, lines end with '\r\n', and the values of all files but the first are padded with a space, as in the example export.
+    """
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    DataFile = os.path.join(directory, 'ConsolidatedGCEICompoundItem.txt')
+    node_file = {
+        'CurrentWorkflowID': 239,
+        'ExpectedResponsePath': os.path.join(directory, 'node_response.json'),
+        'ResultFilePath': os.path.join(directory, 'Synthetic.cdResult'),
+        'NodeParameters': {},
+        'Version': 1,
+        'Tables': [{
+            'TableName': 'GC EI Compounds',
+            'DataFile': DataFile,
+            'DataFormat': 'CSV',
+            'Options': {},
+            'ColumnDescriptions': column_descriptions(files)
+        }]
+    }
+
+    molfiles = [make_molfile(rng, atoms) for atoms in rng.integers(5, 40, 500)]
+    block_rows = max(1000, 2000000 // (len(COMPOUND_COLUMNS) + 3 * files))
+
+    with open(DataFile, mode='w', encoding='utf-8', newline='') as f:
+        f.write('"' + '"\t"'.join(column['ColumnName'] for column in node_file['Tables'][0]['ColumnDescriptions']) + '"\r\n')
+
+        for block in range(0, rows, block_rows):
+            f.write(generate_block(rng, block + 1, min(block_rows, rows - block), files, molfiles, structure_fraction, missing_fraction))
+
+    node_file_path = os.path.join(directory, 'node_args.json')
+
+    with open(node_file_path, mode='w', encoding='utf-8') as f:
+        json.dump(node_file, f, indent=1)
+
+    return node_file_path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate a synthetic Compound Discoverer export shaped like the example export.')
+    parser.add_argument('directory', help='the output directory')
+    parser.add_argument('--rows', type=int, default=100000, help='the number of rows (default 100000)')
+    parser.add_argument('--files', type=int, default=6, help='the number of sample files (default 6)')
+    parser.add_argument('--seed', type=int, default=0, help='the seed of the random number generator (default 0)')
+    args = parser.parse_args()
+
+    print(f'Generated {generate_export(args.directory, args.rows, args.files, args.seed)}')
\ No newline at end of file
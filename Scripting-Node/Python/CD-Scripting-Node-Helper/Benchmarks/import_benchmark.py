@@ -0,0 +1,102 @@
+#==============================================================================
+# Name   : import_benchmark
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Measure the start-up time of scripts that use the CDScriptingNodeHelper (importing it, and a script that only reads and writes node files), each in a new Python process as Compound Discoverer runs them, and check that pandas and NumPy are not imported until a table is loaded.
+# Usage  : python import_benchmark.py [number of repeats (default 10)] [limit for the import in ms (default none)]
+#==============================================================================
+
+
+# Load Libraries
+import argparse    # Parser for command-line options, arguments and sub-commands.
+import json    # JSON encoder and decoder.
+import os    # Miscellaneous operating system interfaces.
+import subprocess    # Subprocess management.
+import sys    # System-specific parameters and functions.
+import tempfile    # Generate temporary files and directories.
+import time    # Time access and conversions.
+#==============================
+
+
+# Define the number of repeats of each measurement, and the limit (in ms) above which importing the CDScriptingNodeHelper fails the benchmark.
+parser = argparse.ArgumentParser(description='Measure the start-up time of scripts that use the CDScriptingNodeHelper, each in a new Python process.')
+parser.add_argument('repeats', nargs='?', type=int, default=10, help='the number of times each snippet is run; the shortest time is kept (default 10)')
+parser.add_argument('limit', nargs='?', type=float, help='the time in ms above which importing the CDScriptingNodeHelper fails the benchmark (default none)')
+args = parser.parse_args()
+
+repeats = args.repeats
+limit = args.limit
+
+helper_directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+node_args_path = os.path.join(helper_directory, '..', '..', 'Data', 'node_args.json')
+output_directory = tempfile.mkdtemp(prefix='cd_import_benchmark_')
+
+
+# The code run in each new process; each prints the modules of interest that it imported.
+check = 'import sys; print(json.dumps(sorted(name for name in ("numpy", "pandas") if name in sys.modules)))'
+snippets = {
+    'python': 'import json; ' + check,
+    'import CDScriptingNodeHelper': 'import json; from CDScriptingNodeHelper import CDScriptingResponse; ' + check,
+    'node file only script': f'''import json, os
+from CDScriptingNodeHelper import CDScriptingResponse
+response = CDScriptingResponse({node_args_path!r})
+node_args = response.get_node_file()
+node_response = response.add_node_file(node_args)
+response.set_table_options(node_response, 'GC EI Compounds', {{'Comment': 'Options set by a script'}})
+response.save_to_file(node_response, os.path.join({output_directory!r}, 'node_response.json'))
+''' + check,
+    'load_table script': f'''import json
+from CDScriptingNodeHelper import CDScriptingResponse
+response = CDScriptingResponse({node_args_path!r})
+node_args = response.get_node_file()
+node_args['Tables'][0]['DataFile'] = {os.path.join(helper_directory, '..', '..', 'Data', 'ConsolidatedGCEICompoundItem.txt')!r}
+response.load_table('GC EI Compounds', node_args)
+''' + check,
+    'import pandas and NumPy': 'import json, numpy, pandas; ' + check
+}
+
+
+# Run each snippet in a new process and keep the shortest wall time; the modules are compiled once before the measurements, as they would be after the first run of a script.
+environment = dict(os.environ, PYTHONPATH=helper_directory)
+environment.pop('PYTHONDONTWRITEBYTECODE', None)
+results = []
+
+for name, snippet in snippets.items():
+    times = []
+
+    for repeat in range(repeats + 1):
+        start = time.perf_counter()
+        process = subprocess.run([sys.executable, '-c', snippet], env=environment, capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+
+        if process.returncode != 0:
+            raise Exception(f'Failed to run {name}: {process.stderr}')
+
+        if repeat > 0:
+            times.append(elapsed)
+
+    results.append((name, min(times), json.loads(process.stdout.strip().splitlines()[-1])))
+
+
+# Print the results; the time of the interpreter alone is subtracted to give the time added by each snippet.
+baseline = results[0][1]
+
+print(f'{"snippet":<30} {"time (ms)":>10} {"added (ms)":>11}  imported')
+for name, elapsed, modules in results:
+    print(f'{name:<30} {elapsed * 1000:>10.1f} {(elapsed - baseline) * 1000:>11.1f}  {", ".join(modules) or "-"}')
+
+
+# Fail if importing the CDScriptingNodeHelper or running a node file only script imports pandas or NumPy, or if the import takes longer than the limit.
+failures = [f'{name} imports {", ".join(modules)}' for name, elapsed, modules in results[1:3] if modules]
+
+if limit is not None and (results[1][1] - baseline) * 1000 > limit:
+    failures.append(f'import CDScriptingNodeHelper takes {(results[1][1] - baseline) * 1000:.1f} ms (limit {limit:.1f} ms)')
+
+for filename in os.listdir(output_directory):
+    os.remove(os.path.join(output_directory, filename))
+os.rmdir(output_directory)
+
+if failures:
+    print('\n'.join(failures))
+    sys.exit(1)
+#==============================
\ No newline at end of file
@@ -0,0 +1,89 @@
+#==============================================================================
+# Name   : json_benchmark
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Compare the time and size of the node file JSON written by 'save_to_file' (indented and compact, with each of the JSON packages installed), using the 'node_response.json' example file scaled up to a large number of columns.
+# Usage  : python json_benchmark.py [number of columns (default 10000)] [number of repeats (default 5)]
+#==============================================================================
+
+
+# Load Libraries
+import argparse    # Parser for command-line options, arguments and sub-commands.
+import copy    # Shallow and deep copy operations.
+import importlib.util    # Find modules without importing them.
+import json    # JSON encoder and decoder.
+import os    # Miscellaneous operating system interfaces.
+import sys    # System-specific parameters and functions.
+import timeit    # Measure execution time of small code snippets.
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from CDScriptingNodeHelper import JSON_BACKENDS, dumps_json    # Import the JSON backends and the 'dumps_json' function from the CDScriptingNodeHelper module.
+#==============================
+
+
+# Define the number of columns of the scaled node file and the number of repeats of each measurement.
+parser = argparse.ArgumentParser(description='Compare the time and size of the node file JSON written with each of the JSON packages installed.')
+parser.add_argument('columns', nargs='?', type=int, default=10000, help='the number of columns of the scaled node file (default 10000)')
+parser.add_argument('repeats', nargs='?', type=int, default=5, help='the number of times each measurement is repeated; the shortest time is kept (default 5)')
+args = parser.parse_args()
+
+number_of_columns = args.columns
+repeats = args.repeats
+
+
+# Read the example 'node_response.json' file.
+node_response_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'Data', 'node_response.json')
+
+with open(node_response_path, mode='r', encoding='utf-8') as f:
+    node_response = json.load(f)
+
+
+# Scale the node file up: copy the columns of the first table (with new names) until the node file has the number of columns wanted.
+table = node_response['Tables'][0]
+columns = table['ColumnDescriptions']
+total_columns = sum(len(t['ColumnDescriptions']) for t in node_response['Tables'])
+template_columns = list(columns)
+
+for number in range(max(number_of_columns - total_columns, 0)):
+    column = copy.deepcopy(template_columns[number % len(template_columns)])
+    column['ColumnName'] = f'{column["ColumnName"]} {number // len(template_columns) + 1}'
+    column['ID'] = ''
+    columns.append(column)
+
+print(f'Node file: {sum(len(t["ColumnDescriptions"]) for t in node_response["Tables"])} columns in {len(node_response["Tables"])} tables.')
+#==============================
+
+
+# Measure the time to serialize and write the node file, and to read it back, in each mode.
+output_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'json_benchmark.json')
+backends = [backend for backend in JSON_BACKENDS if backend == 'json' or importlib.util.find_spec(backend) is not None]
+results = []
+
+for backend in backends:
+    for compact in (False, True):
+        def write():
+            with open(output_path, mode='wb') as f:
+                f.write(dumps_json(node_response, compact, backend))
+
+        def read():
+            with open(output_path, mode='rb') as f:
+                return json.loads(f.read())
+
+        write_time = min(timeit.repeat(write, number=1, repeat=repeats))
+        read_time = min(timeit.repeat(read, number=1, repeat=repeats))
+
+        if read() != node_response:
+            raise Exception(f'JSON written with {backend} (compact={compact}) does not match the node file.')
+
+        results.append((backend, 'compact' if compact else 'indented', write_time, read_time, os.path.getsize(output_path)))
+
+os.remove(output_path)
+
+
+# Print the results, relative to the default of earlier versions ('json', indented).
+baseline = next(write_time for backend, mode, write_time, read_time, size in results if backend == 'json' and mode == 'indented')
+
+print(f'{"backend":<8} {"mode":<9} {"write (ms)":>11} {"read (ms)":>10} {"size (KB)":>10} {"speed-up":>9}')
+for backend, mode, write_time, read_time, size in results:
+    print(f'{backend:<8} {mode:<9} {write_time * 1000:>11.1f} {read_time * 1000:>10.1f} {size / 1024:>10.0f} {baseline / write_time:>8.1f}x')
+#==============================
\ No newline at end of file
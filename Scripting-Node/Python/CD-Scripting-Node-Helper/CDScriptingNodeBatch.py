@@ -0,0 +1,244 @@
+#==============================================================================
+# Name   : CDScriptingNodeBatch
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Compound Discoverer Scripting Node "Batch" runner used to run a Scripting Node script again on many archived job folders (e.g., 'Scratch/Job239/Script(3)', each with its own 'node_args.json' and data files), on a pool of processes, and to collect the status and time of each job.
+# Usage  : python CDScriptingNodeBatch.py <script> <folder> [<folder> ...] [--max-workers 4] [--map C:/ProgramData/Thermo=D:/Archive] [--output batch_summary.json]
+#==============================================================================
+
+
+import argparse    # Parser for command-line options, arguments and sub-commands.
+import concurrent.futures    # Launching parallel tasks.
+import contextlib    # Utilities for with-statement contexts.
+import glob    # Unix style pathname pattern expansion.
+import io    # Core tools for working with streams.
+import json    # JSON encoder and decoder.
+import os    # Miscellaneous operating system interfaces.
+import re    # Regular expression operations.
+import sys    # System-specific parameters and functions.
+import time    # Time access and conversions.
+import traceback    # Print or retrieve a stack traceback.
+
+from CDScriptingNodeLauncher import run    # Import the 'run' function from the CDScriptingNodeLauncher module.
+
+
+# Name of the copy of 'node_args.json' with the paths rewritten to the local job folder, written next to it; the archived 'node_args.json' is left unchanged.
+LOCAL_NODE_FILE = 'node_args.local.json'
+
+
+# Name of the file to which the output of the script is saved, in each job folder.
+BATCH_LOG_FILE = 'batch_log.txt'
+
+
+def find_jobs(folders: list):
+    """
+    Returns the paths of the 'node_args.json' files in the specified folders and their subfolders (e.g., a 'Scratch' folder, or single 'JobNNN' folders), in natural order (Job2 before Job10).
+    """
+    paths = set()
+
+    for folder in folders:
+        paths.update(os.path.abspath(path) for path in glob.glob(os.path.join(glob.escape(folder), '**', 'node_args.json'), recursive=True))
+
+    return sorted(paths, key=lambda path: [int(part) if part.isdigit() else part.lower() for part in re.split(r'(\d+)', path)])
+
+
+def rewrite_path(path: str, path_map: list):
+    """
+    Returns the path with the first matching prefix of 'path_map' (a list of (original prefix, local prefix) pairs) replaced; prefixes match regardless of case and of '/' or '\\' separators, as on Windows.
+    """
+    normalized = path.replace('\\', '/')
+
+    for original, local in path_map:
+        original = original.replace('\\', '/').rstrip('/')
+
+        if normalized.lower() == original.lower() or normalized.lower().startswith(original.lower() + '/'):
+            rest = normalized[len(original):].strip('/')
+            return os.path.join(local, *rest.split('/')) if rest else local
+
+    return path
+
+
+def rewrite_node_file(node_file_path: str, path_map: list = None):
+    """
+    Writes a copy of a node file with the paths of the original job folder (and those of 'path_map') rewritten to local paths, and returns the path of the copy.
+
+    Parameters
+    ----------
+    node_file_path : str
+        The path of the archived 'node_args.json' file.
+    path_map : list, optional
+        Additional (original prefix, local prefix) pairs, e.g., [('C:/ProgramData/Thermo', 'D:/Archive/Thermo')] for data files outside the job folder (default is none).
+
+    Returns
+    -------
+    str
+        The path of the copy ('node_args.local.json', in the same folder as the node file).
+
+    Notes
+    -----
+    The original job folder is the folder of the node file's 'ExpectedResponsePath' (e.g., 'C:/ProgramData/Thermo/Compound Discoverer 3.3/Scratch/Job239/Script(3)'); it is mapped to the folder of the node file, so the 'DataFile' of each table and the 'ExpectedResponsePath' point to the archived files.
+    """
+    with open(node_file_path, mode='r', encoding='utf-8') as f:
+        node_file = json.load(f)
+
+    folder = os.path.dirname(os.path.abspath(node_file_path))
+    path_map = list(path_map or [])
+
+    if node_file.get('ExpectedResponsePath'):
+        path_map.insert(0, (node_file['ExpectedResponsePath'].replace('\\', '/').rsplit('/', 1)[0], folder))
+
+    for key in ('ExpectedResponsePath', 'ResultFilePath'):
+        if isinstance(node_file.get(key), str):
+            node_file[key] = rewrite_path(node_file[key], path_map)
+
+    for table in node_file.get('Tables', []):
+        if isinstance(table.get('DataFile'), str):
+            table['DataFile'] = rewrite_path(table['DataFile'], path_map)
+
+    local_path = os.path.join(folder, LOCAL_NODE_FILE)
+
+    with open(local_path, mode='w', encoding='utf-8') as f:
+        json.dump(node_file, f, indent=1)
+
+    return local_path
+
+
+def run_job(script: str, node_file_path: str, function: str = 'main', timing: bool = True, path_map: list = None):
+    """
+    Runs the script on one job folder (in a process of the pool) and returns the job's summary.
+
+    Parameters
+    ----------
+    script : str
+        The path of the script file.
+    node_file_path : str
+        The path of the job's archived 'node_args.json' file.
+    function : str, optional
+        The name of the script function, which takes the CDScriptingResponse object (default is 'main').
+    timing : bool, optional
+        If True, the timing report of the job is saved next to its response node file (default is True).
+    path_map : list, optional
+        Additional (original prefix, local prefix) pairs (see 'rewrite_node_file').
+
+    Returns
+    -------
+    dict
+        The job's summary: the job folder, the status ('OK' or 'Failed'), the wall time in seconds, and the error, if any.
+
+    Notes
+    -----
+    The script runs with the job folder as the working directory, and its output is saved to 'BATCH_LOG_FILE' in the job folder.
+    """
+    folder = os.path.dirname(node_file_path)
+    directory = os.getcwd()
+    output = io.StringIO()
+    error = None
+    start = time.perf_counter()
+
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            os.chdir(folder)
+            run(script, rewrite_node_file(node_file_path, path_map), function, timing)
+
+        except (Exception, SystemExit) as e:
+            traceback.print_exc()
+            error = f'{type(e).__name__}: {str(e)}'
+
+        finally:
+            os.chdir(directory)
+
+    seconds = time.perf_counter() - start
+
+    try:
+        with open(os.path.join(folder, BATCH_LOG_FILE), mode='w', encoding='utf-8') as f:
+            f.write(output.getvalue())
+    except Exception as e:
+        print(f'Failed to save log of {folder}: {str(e)}')
+
+    return {'Job': folder, 'Status': 'OK' if error is None else 'Failed', 'Seconds': seconds, 'Error': error}
+
+
+def run_batch(script: str, folders: list, max_workers: int = None, function: str = 'main', timing: bool = True, path_map: list = None, output: str = None):
+    """
+    Runs a script on all the job folders found in the specified folders, on a pool of processes.
+
+    Parameters
+    ----------
+    script : str
+        The path of the script file.
+    folders : list
+        The folders in which to look for job folders (folders with a 'node_args.json' file), e.g., a 'Scratch' folder.
+    max_workers : int, optional
+        The number of jobs run at the same time (default is the number of CPU cores).
+    function : str, optional
+        The name of the script function, which takes the CDScriptingResponse object (default is 'main').
+    timing : bool, optional
+        If True, the timing report of each job is saved next to its response node file (default is True).
+    path_map : list, optional
+        Additional (original prefix, local prefix) pairs (see 'rewrite_node_file').
+    output : str, optional
+        The path of the JSON file to which the summary is saved (default is none).
+
+    Returns
+    -------
+    list
+        The summary of each job (see 'run_job'), in the order of the job folders.
+
+    Notes
+    -----
+    Each process of the pool imports the script and the CDScriptingNodeHelper once and then runs jobs one after the other, so pandas and NumPy are imported once per process rather than once per job. If a process of the pool stops (e.g., runs out of memory), its job and the jobs not yet started are reported as failed.
+    """
+    script = os.path.abspath(script)
+    jobs = find_jobs(folders)
+    results = dict()
+    start = time.perf_counter()
+
+    if not jobs:
+        print(f'No job folders found in {", ".join(folders)}.')
+        return []
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers or min(len(jobs), os.cpu_count() or 1)) as executor:
+        futures = {executor.submit(run_job, script, path, function, timing, path_map): path for path in jobs}
+
+        for future in concurrent.futures.as_completed(futures):
+            path = futures[future]
+
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'Job': os.path.dirname(path), 'Status': 'Failed', 'Seconds': None, 'Error': f'{type(e).__name__}: {str(e)}'}
+
+            results[path] = result
+            print(f'[{len(results)}/{len(jobs)}] {result["Status"]:<6} {result["Seconds"] or 0:>8.2f} s  {result["Job"]}' + (f'  ({result["Error"]})' if result['Error'] else ''))
+
+    summary = [results[path] for path in jobs]
+    failed = sum(result['Status'] != 'OK' for result in summary)
+    print(f'{len(summary) - failed} of {len(summary)} jobs succeeded in {time.perf_counter() - start:.1f} s.')
+
+    if output:
+        try:
+            with open(output, mode='w', encoding='utf-8') as f:
+                json.dump({'Script': script, 'Wall': time.perf_counter() - start, 'Jobs': summary}, f, indent=1)
+            print(f'Successfully saved summary to {output}!')
+        except Exception as e:
+            print(f'Failed to save summary: {str(e)}')
+
+    return summary
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run a Compound Discoverer Scripting Node script on many archived job folders.')
+    parser.add_argument('script', help='the script file, with a main(response) function')
+    parser.add_argument('folders', nargs='+', help='the folders in which to look for job folders (with a node_args.json file)')
+    parser.add_argument('--max-workers', type=int, help='the number of jobs run at the same time (default is the number of CPU cores)')
+    parser.add_argument('--function', default='main', help='the script function (default main)')
+    parser.add_argument('--map', action='append', default=[], metavar='ORIGINAL=LOCAL', help='replace a path prefix of the node files (besides the original job folder), e.g., C:/ProgramData/Thermo=D:/Archive; may be repeated')
+    parser.add_argument('--no-timing', action='store_true', help='do not save the timing report of each job')
+    parser.add_argument('--output', default='batch_summary.json', help='the file to which the summary is saved (default batch_summary.json)')
+    args = parser.parse_args()
+
+    if any('=' not in pair for pair in args.map):
+        parser.error('--map must be given as ORIGINAL=LOCAL')
+
+    summary = run_batch(args.script, args.folders, args.max_workers, args.function, not args.no_timing, [tuple(pair.split('=', 1)) for pair in args.map], args.output)
+    sys.exit(0 if summary and all(result['Status'] == 'OK' for result in summary) else 1)
@@ -6,21 +6,672 @@
 #==============================================================================
 
 
-import copy    # Shallow and deep copy operations.
+import bisect    # Array bisection algorithm.
+import collections    # Container datatypes.
+import contextlib    # Utilities for with-statement contexts.
+import hashlib    # Secure hashes and message digests.
+import importlib    # The implementation of import.
+import importlib.machinery    # Finders and loaders of modules.
+import importlib.util    # Find modules without importing them.
+import io    # Core tools for working with streams.
 import json    # JSON encoder and decoder.
+import mmap    # Memory-mapped file support.
+import operator    # Standard operators as functions.
 import os    # Miscellaneous operating system interfaces.
+import re    # Regular expression operations.
 import sys    # System-specific parameters and functions.
+import tempfile    # Generate temporary files and directories.
+import threading    # Thread-based parallelism.
+import time    # Time access and conversions.
 import traceback    # Print or retrieve a stack traceback.
+import warnings    # Warning control.
+
+
+class _LazyModule:
+    def __init__(self, name: str, alias: str):
+        """
+        Initialize a stand-in for a module that is imported only the first time one of its attributes is used.
+
+        Parameters
+        ----------
+        name : str
+            The name of the module (e.g., 'pandas').
+        alias : str
+            The name of the global variable of this module that refers to the module (e.g., 'pd').
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        On first use, the module is imported and replaces the stand-in in the globals of this module, so later uses refer to the module itself at no extra cost.
+        pandas and NumPy take most of the time of importing the CDScriptingNodeHelper (about a second, several on some Windows machines). Importing them lazily means that scripts that only read and write node files (e.g., to add tables and columns or to set 'Options') start in tens of milliseconds; they are imported the first time a table is loaded or written.
+        """
+        self.__name = name
+        self.__alias = alias
+
+
+    def __getattr__(self, attribute: str):
+        """
+        Imports the module, replaces the stand-in with it, and returns the attribute of the module.
+        """
+        module = importlib.import_module(self.__name)
+        globals()[self.__alias] = module
+
+        return getattr(module, attribute)
+
+
+np = _LazyModule('numpy', 'np')    # NumPy is a Python library for numerical computing with arrays (imported on first use).
+pd = _LazyModule('pandas', 'pd')    # Pandas is a Python library for data analysis and manipulation (imported on first use).
+concurrent_futures = _LazyModule('concurrent.futures', 'concurrent_futures')    # Launching parallel tasks (imported on first use).
+shared_memory = _LazyModule('multiprocessing.shared_memory', 'shared_memory')    # Shared memory for direct access across processes (imported on first use).
+
+
+# Data types of the 'ColumnDescriptions' 'DataType' values, as used when reading tables exported by Compound Discoverer.
+# 'Int' and 'Boolean' columns may contain empty values, hence the nullable pandas data types.
+DATA_TYPES = {
+    'Int': 'Int64',
+    'Float': 'float64',
+    'String': str,
+    'Boolean': 'boolean'
+}
+
+
+# 'DataGroupName' values of the per-file status columns, which repeat a few values in every row (e.g., ' Full gap', ' No gap', ' 128') and are read as categorical data.
+# Compound Discoverer describes both as 'Int', but exports the labels of 'GapStatus' (e.g., ' Full gap') and the codes of 'GapFillStatus' (e.g., ' 128').
+CATEGORICAL_DATA_GROUPS = ('GapStatus', 'GapFillStatus')
+
+
+# Names of the columns that hold a molfile per row (with ';' in place of line breaks), which are left out of 'load_table' and parsed on demand by 'CDStructureColumn'.
+STRUCTURE_COLUMNS = ('Structure',)
+
+
+# Number of parsed structures kept by a 'CDStructureColumn' (least recently used structures are evicted first).
+STRUCTURE_CACHE_SIZE = 1024
+
+
+# JSON packages used to save node files, in order of preference; the first one installed is used ('json' is part of the standard library).
+JSON_BACKENDS = ('orjson', 'ujson', 'json')
+
+
+# Values (besides the pandas defaults) that are read as missing; Compound Discoverer exports some missing numbers as a single space.
+NA_VALUES = [' ']
+
+
+# Size in bytes of the blocks in which data files are scanned line by line (e.g., by 'validate'), which bounds the memory used regardless of the size of the file.
+SCAN_BLOCK_SIZE = 16 * 1048576
+
+
+def categorize(values, numeric: bool = False):
+    """
+    Cleans the categories of categorical data read from a data file exported by Compound Discoverer.
+
+    Parameters
+    ----------
+    values : pandas.Categorical or pandas.Series
+        The categorical data, whose categories may be padded with spaces (e.g., ' Full gap' and 'Full gap').
+    numeric : bool, optional
+        If True, the categories are converted to integers (e.g., for 'Gap Fill Status' codes) (default is False).
+
+    Returns
+    -------
+    pandas.Categorical
+        The categorical data, with padding spaces removed from the categories and categories that become identical merged; empty categories become missing values.
+
+    Notes
+    -----
+    Only the categories (a handful of values) are processed; the per-row codes are remapped with a single vectorized lookup.
+    """
+    values = pd.Categorical(values)
+    labels = [str(label).strip() for label in values.categories]
+    if numeric:
+        labels = [int(float(label)) if label != '' else '' for label in labels]
+
+    categories = pd.Index(sorted(set(labels) - {''}))
+
+    recode = np.append(categories.get_indexer(labels), -1)
+    return pd.Categorical.from_codes(recode[values.codes], categories)
+
+
+def parse_molfile(molfile: str, separator: str = '\n'):
+    """
+    Parses a molfile (MDL V2000 format) into arrays of atoms and bonds.
+
+    Parameters
+    ----------
+    molfile : str
+        The molfile, e.g., a value of the 'Structure' column of a table exported by Compound Discoverer.
+    separator : str, optional
+        The line separator of the molfile (default is '\\n'; Compound Discoverer exports use ';').
+
+    Returns
+    -------
+    dict
+        The structure:
+        - 'Name' : str, the first line of the molfile
+        - 'Elements' : numpy.ndarray of str, the element symbol of each atom
+        - 'Coordinates' : numpy.ndarray of float64 of shape (number of atoms, 3), the x, y, and z coordinates of each atom
+        - 'Charges' : numpy.ndarray of int8, the formal charge of each atom
+        - 'Bonds' : numpy.ndarray of int32 of shape (number of bonds, 2), the positions (starting at 0) in 'Elements' of the two atoms of each bond
+        - 'BondOrders' : numpy.ndarray of int8, the bond type of each bond (1, 2, 3, or 4 for aromatic)
+
+    Raises
+    ------
+    Exception
+        If the molfile is not in the V2000 format or its atom and bond blocks are incomplete.
+    """
+    lines = molfile.split(separator)
+
+    try:
+        counts = lines[3]
+        atoms, bonds = int(counts[0:3]), int(counts[3:6])
+    except (IndexError, ValueError):
+        raise Exception('Cannot parse molfile: the counts line is missing or invalid.')
+
+    if 'V3000' in counts:
+        raise Exception('Cannot parse molfile: only the V2000 format is supported.')
+
+    atom_block, bond_block = lines[4:4 + atoms], lines[4 + atoms:4 + atoms + bonds]
+
+    if len(atom_block) != atoms or len(bond_block) != bonds:
+        raise Exception(f'Cannot parse molfile: expected {atoms} atoms and {bonds} bonds.')
+
+    atom_fields = [line.split() for line in atom_block]
+    bond_fields = [line[0:3] + ' ' + line[3:6] + ' ' + line[6:9] for line in bond_block]
+
+    Coordinates = np.array([fields[0:3] for fields in atom_fields], dtype=np.float64).reshape(atoms, 3)
+    Elements = np.array([fields[3] for fields in atom_fields], dtype=str)
+    Charges = np.array([{1: 3, 2: 2, 3: 1, 5: -1, 6: -2, 7: -3}.get(int(fields[5]) if len(fields) > 5 else 0, 0) for fields in atom_fields], dtype=np.int8)
+
+    charge_lines = [line for line in lines[4 + atoms + bonds:] if line.startswith('M  CHG')]
+
+    if charge_lines:
+        # As per the format, 'M  CHG' lines supersede the charges of the atom block.
+        Charges[:] = 0
+
+        for line in charge_lines:
+            values = [int(value) for value in line[6:].split()[1:]]
+            Charges[np.array(values[0::2], dtype=np.int32) - 1] = values[1::2]
+
+    bond_values = np.array(' '.join(bond_fields).split(), dtype=np.int32).reshape(bonds, 3)
+
+    return {
+        'Name': lines[0].strip(),
+        'Elements': Elements,
+        'Coordinates': Coordinates,
+        'Charges': Charges,
+        'Bonds': bond_values[:, 0:2] - 1,
+        'BondOrders': bond_values[:, 2].astype(np.int8)
+    }
+
+
+def dumps_json(obj, compact: bool = False, backend: str = None, fast: bool = False):
+    """
+    Serializes an object (e.g., a node file dictionary) to JSON.
+
+    Parameters
+    ----------
+    obj : dict or list
+        The object to serialize.
+    compact : bool, optional
+        If True, the JSON is written on a single line without spaces between items; otherwise it is indented with 4 spaces (default is False).
+    backend : str, optional
+        The JSON package to use, one of 'JSON_BACKENDS' (default is 'json', or with 'fast=True', the first of 'JSON_BACKENDS' that is installed).
+    fast : bool, optional
+        If True, the fastest JSON package installed is used (default is False).
+
+    Returns
+    -------
+    bytes
+        The UTF-8 encoded JSON (non-ASCII characters are written as they are).
+
+    Raises
+    ------
+    Exception
+        If the backend is not one of 'JSON_BACKENDS'.
+
+    Notes
+    -----
+    By default, the JSON is written by the 'json' module of the standard library, as 'json.dump' with 'indent=4' (non-ASCII characters and NaN are written as they are), whichever packages are installed, so the files handed to Compound Discoverer do not depend on the environment.
+    'orjson' and 'ujson' are optional packages that serialize several times faster, but their output differs: 'orjson' indents with 2 spaces (the only indentation it supports), serializes NumPy arrays and scalars, and writes NaN as null. They are only used when asked for ('fast=True' or 'backend'); if the fast backend cannot serialize the object, the 'json' module is used instead.
+    """
+    if backend is None:
+        backend = next(name for name in JSON_BACKENDS if name == 'json' or importlib.util.find_spec(name) is not None) if fast else 'json'
+
+    if backend not in JSON_BACKENDS:
+        raise Exception(f'Unknown JSON backend {backend}; expected one of {", ".join(JSON_BACKENDS)}.')
+
+    try:
+        if backend == 'orjson':
+            import orjson
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2))
+
+        elif backend == 'ujson':
+            import ujson
+            return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False, indent=0 if compact else 4).encode('utf-8')
+
+    except TypeError:
+        pass
+
+    if compact:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=4).encode('utf-8')
+
+
+def run_script(function, timing: bool = True, filename: str = 'node_timing.json', node_file_path: str = None):
+    """
+    Runs a Scripting Node script function with a CDScriptingResponse object, recording the time spent in each phase of the script.
+
+    Parameters
+    ----------
+    function : callable
+        The script function, which takes the CDScriptingResponse object (e.g., def main(response): ...).
+    timing : bool, optional
+        If True, the timing report is saved as a JSON file next to the node file's 'ExpectedResponsePath' (default is True).
+    filename : str, optional
+        The name of the timing report file (default is 'node_timing.json').
+    node_file_path : str, optional
+        The path of the node file (default is the first command line argument, sys.argv[1]).
+
+    Returns
+    -------
+    object
+        The value returned by the script function.
+
+    Raises
+    ------
+    Exception
+        Any exception raised by the script function, after the timing report has been saved.
+
+    Notes
+    -----
+    The phases recorded are the reading of the node file, the loading of each table ('load_table', 'stream_table'), the script function itself ('compute', the time not spent in any of the other phases), the writing of each data file ('commit', 'append_columns', 'add_connection_table'; with 'commit', the data files are written in parallel, within a 'write files' phase), and the writing of the response node file ('commit', 'save_to_file'). For each phase, the report gives the wall time, the CPU time, and the peak resident memory of the process at the end of the phase (see 'CDTimer').
+    Usage: if __name__ == '__main__': run_script(main)
+    """
+    response = CDScriptingResponse(node_file_path)
+    response.timer = CDTimer() if timing else None
+    error = None
+
+    try:
+        with response.timer.phase('compute') if timing else contextlib.nullcontext():
+            return function(response)
+
+    except Exception as e:
+        error = e
+        raise
+
+    finally:
+        if timing:
+            node_file = response.get_node_file(read_only=True)
+            directory = os.path.dirname(node_file.get('ExpectedResponsePath') or node_file_path or sys.argv[1])
+            response.timer.save(os.path.join(directory, filename), Script=getattr(function, '__name__', str(function)), Error=None if error is None else f'{type(error).__name__}: {str(error)}')
+
+
+def file_fingerprint(path: str, sample_size: int = 1048576):
+    """
+    Returns a fingerprint of a file, used to tell whether the file has changed.
+
+    Parameters
+    ----------
+    path : str
+        The path of the file.
+    sample_size : int, optional
+        The number of bytes hashed at the start and at the end of the file (default is 1 MiB).
+
+    Returns
+    -------
+    list
+        The size of the file, its modification time (in nanoseconds), and a SHA-1 hash of its first and last 'sample_size' bytes.
+
+    Notes
+    -----
+    Hashing samples of the file rather than the whole file keeps the fingerprint cheap for multi-GB data files; files up to twice 'sample_size' are hashed completely.
+    """
+    stat = os.stat(path)
+    digest = hashlib.sha1()
+
+    with open(path, mode='rb') as f:
+        digest.update(f.read(sample_size))
+
+        if stat.st_size > sample_size:
+            f.seek(max(stat.st_size - sample_size, sample_size))
+            digest.update(f.read(sample_size))
+
+    return [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+
+
+def _split_lines(data: bytes):
+    """
+    Finds the lines of a block of a tab-separated data file, with vectorized NumPy operations.
+
+    Parameters
+    ----------
+    data : bytes
+        The block, starting at the start of a line.
+
+    Returns
+    -------
+    tuple
+        The offsets of the ends of the complete lines (just after each '\n'), the number of fields of each line, and whether each line is blank, as NumPy arrays.
+
+    Notes
+    -----
+    Tabs and line breaks within double-quoted fields (where the number of double quotes before them is odd; escaped quotes '""' count twice) are part of the field and are not counted as separators.
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    # The parity of the number of quotes so far (a uint8 count wraps around at 256, which keeps the parity).
+    outside = (np.cumsum(buffer == 34, dtype=np.uint8) & 1) == 0
+    ends = np.flatnonzero((buffer == 10) & outside)
+    tabs = np.flatnonzero((buffer == 9) & outside)
+    fields = np.diff(np.searchsorted(tabs, ends), prepend=0) + 1
+    lengths = np.diff(ends, prepend=-1)
+    blank = (lengths == 1) | ((lengths == 2) & (buffer[np.maximum(ends - 1, 0)] == 13))
+
+    return ends + 1, fields, blank
+
+
+def _shard_results(result, rows: int, outputs: list):
+    """
+    Returns the result of the function of 'map_rows' for a shard of rows as a float64 array of shape (rows, number of outputs).
+    """
+    if isinstance(result, dict):
+        result = np.column_stack([np.asarray(result[name], dtype=np.float64) for name in outputs])
+
+    result = np.asarray(result, dtype=np.float64)
+
+    if result.ndim == 1:
+        result = result.reshape(-1, 1)
+
+    if result.shape != (rows, len(outputs)):
+        raise Exception(f'The function returned an array of shape {result.shape} for {rows} rows; expected {(rows, len(outputs))}.')
+
+    return result
+
+
+def _function_reference(function):
+    """
+    Returns the function of 'map_rows' as it is sent to the processes of the pool: the function itself, or, for a function of a script imported from its file (e.g., by CDScriptingNodeLauncher), the path of the file, the name of the module, and the name of the function, since new processes (on Windows and macOS) cannot import such a module by its name.
+    """
+    module = sys.modules.get(getattr(function, '__module__', None) or '')
+    spec = getattr(module, '__spec__', None)
+
+    if spec is None or not getattr(spec, 'origin', None) or spec.name == '__main__' or '.' in spec.name or getattr(function, '__qualname__', '') != getattr(function, '__name__', None):
+        return function
+
+    if importlib.machinery.PathFinder.find_spec(spec.name) is not None:
+        return function
+
+    return (spec.origin, spec.name, function.__name__)
+
+
+def _resolve_function(reference):
+    """
+    Returns the function of 'map_rows' from the reference returned by '_function_reference', importing the script file (once per process) if needed.
+    """
+    if not isinstance(reference, tuple):
+        return reference
+
+    path, name, function = reference
+
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+
+    return getattr(sys.modules[name], function)
+
+
+def _map_rows_shard(function, input_name: str, output_name: str, shape: tuple, outputs: list, start: int, end: int):
+    """
+    Runs the function of 'map_rows' on rows start to end of the input block in shared memory (in a process of the pool), and writes its results to the same rows of the output block.
+    """
+    input_memory = shared_memory.SharedMemory(name=input_name)
+    output_memory = shared_memory.SharedMemory(name=output_name)
+    values = results = None
+    error = None
+
+    try:
+        values = np.ndarray(shape, dtype=np.float64, buffer=input_memory.buf)
+        results = np.ndarray((shape[0], len(outputs)), dtype=np.float64, buffer=output_memory.buf)
+        results[start:end] = _shard_results(_resolve_function(function)(values[start:end]), end - start, outputs)
+
+    except Exception:
+        # The traceback holds the views of the shared memory, which must be released before it is closed.
+        error = traceback.format_exc()
+
+    del values, results
+    input_memory.close()
+    output_memory.close()
+
+    if error is not None:
+        raise Exception(f'Failed to compute rows {start} to {end}:\n{error}')
+
+
+def _read_only(self, *args, **kwargs):
+    """
+    Raises an exception; replaces the methods that would modify a read-only node file.
+    """
+    raise Exception('Cannot modify the node file returned by get_node_file(read_only=True); use get_node_file() or add_node_file to get a copy that can be modified.')
+
+
+class _ReadOnlyDict(dict):
+    """
+    A dictionary of the node file returned by 'get_node_file(read_only=True)', which cannot be modified. It is still a dict, so it can be read, saved as JSON, and passed to the methods of CDScriptingResponse as usual; 'copy.deepcopy' returns a modifiable copy.
+    """
+    __setitem__ = __delitem__ = __ior__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return _thaw(self)
+
+
+class _ReadOnlyList(list):
+    """
+    A list of the node file returned by 'get_node_file(read_only=True)' (e.g., 'Tables', 'ColumnDescriptions'), which cannot be modified.
+    """
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return _thaw(self)
+
+
+def _freeze(value):
+    """
+    Returns a read-only copy of a parsed JSON value, with '_ReadOnlyDict' and '_ReadOnlyList' in place of its dictionaries and lists.
+    """
+    if isinstance(value, dict):
+        return _ReadOnlyDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return _ReadOnlyList(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """
+    Returns a modifiable copy of a parsed JSON value (e.g., a read-only node file), with plain dictionaries and lists; faster than 'copy.deepcopy', as JSON values hold no shared or recursive references.
+    """
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    return value
+
+
+class _NodeFileIndex:
+    def __init__(self, node_file: dict):
+        """
+        Initialize the index of a node file's tables and columns.
+
+        Parameters
+        ----------
+        node_file : dict
+            The node file dictionary to index.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        The index maps each 'TableName' to its table dictionary and each ('TableName', 'ColumnName') pair to the position of the column in the table's 'ColumnDescriptions' list, so that lookups do not scan the node file. Tables and columns added or removed through the CDScriptingResponse methods update the maps in place.
+        Column positions are kept as the positions the columns had when the table was indexed, together with the sorted list of the (indexed) positions of the columns removed since; the position of a column is its indexed position less the number of removed columns before it (found by bisection), so that removing a column does not re-index the table. The table is re-indexed once more columns have been removed than remain.
+        The index remembers the lists it was built from and their lengths, and each lookup that finds a name checks that the table or column found still has that name. If the node file is edited directly (i.e., not through the CDScriptingResponse methods), e.g., by adding, removing, or replacing a table or column, the change is detected on the next lookup and the affected part of the index is rebuilt.
+        A lookup that does not find a name trusts the index and does not scan the node file, so lookups stay O(1) (e.g., in 'add_table' and 'add_column', which look up names that do not exist yet). A table or column renamed in place, by editing its 'TableName' or 'ColumnName', is therefore found under its new name only once its part of the index is rebuilt (e.g., after a lookup of its old name).
+        """
+        self.node_file = node_file
+        self.columns = dict()
+        self.removed = dict()
+        self.columns_lists = dict()
+        self.rebuild()
+
+
+    def rebuild(self):
+        """
+        Rebuilds the table map from the node file; the column maps are kept, and checked against the tables' 'ColumnDescriptions' lists when used.
+        """
+        self.tables_list = self.node_file.get('Tables')
+        self.tables_count = len(self.tables_list or [])
+        self.tables = dict()
+        self.table_positions = dict()
+
+        for position, table in enumerate(self.tables_list or []):
+            if table['TableName'] not in self.tables:
+                self.tables[table['TableName']] = table
+                self.table_positions[table['TableName']] = position
+
+
+    def get_table(self, TableName: str):
+        """
+        Returns the table dictionary for the specified table name, or None if the table does not exist.
+        """
+        if self.node_file.get('Tables') is not self.tables_list or len(self.tables_list or []) != self.tables_count:
+            self.rebuild()
+
+        table = self.tables.get(TableName)
+
+        if table is not None and (table['TableName'] != TableName or self.tables_list[self.table_positions[TableName]] is not table):
+            self.rebuild()
+            table = self.tables.get(TableName)
+
+        return table
+
+
+    def get_column_position(self, TableName: str, ColumnName: str):
+        """
+        Returns the position of the specified column in the table's 'ColumnDescriptions' list, or None if the column does not exist.
+        """
+        table = self.get_table(TableName)
+        columns = table.get('ColumnDescriptions', [])
+
+        indexed_columns, indexed_count = self.columns_lists.get(TableName, (None, 0))
+
+        if indexed_columns is not columns or indexed_count != len(columns):
+            self.index_columns(TableName)
+
+        position = self.position(TableName, ColumnName)
+
+        if position is not None and columns[position]['ColumnName'] != ColumnName:
+            self.index_columns(TableName)
+            position = self.position(TableName, ColumnName)
+
+        return position
+
+
+    def position(self, TableName: str, ColumnName: str):
+        """
+        Returns the position of the specified column from its indexed position, or None if the column is not in the index.
+        """
+        indexed_position = self.columns[TableName].get(ColumnName)
+
+        if indexed_position is None:
+            return None
+        return indexed_position - bisect.bisect_left(self.removed[TableName], indexed_position)
+
+
+    def index_columns(self, TableName: str):
+        """
+        Rebuilds the column map of the specified table.
+        """
+        columns = self.tables[TableName].get('ColumnDescriptions', [])
+        names = list(map(operator.itemgetter('ColumnName'), columns))
+
+        # Built from the last column to the first, so that the first of several columns with the same name is kept.
+        self.columns[TableName] = dict(zip(reversed(names), range(len(names) - 1, -1, -1)))
+        self.removed[TableName] = []
+        self.columns_lists[TableName] = (columns, len(columns))
+
+
+    def append_table(self, table: dict):
+        """
+        Appends a table to the node file and to the index.
+        """
+        self.tables_list.append(table)
+        self.tables_count += 1
+        self.tables[table['TableName']] = table
+        self.table_positions[table['TableName']] = self.tables_count - 1
+
+
+    def remove_table(self, TableName: str):
+        """
+        Removes a table from the node file and re-indexes the remaining tables.
+        """
+        del self.tables_list[self.table_positions[TableName]]
+        self.columns.pop(TableName, None)
+        self.removed.pop(TableName, None)
+        self.columns_lists.pop(TableName, None)
+        self.rebuild()
+
+
+    def append_column(self, TableName: str, column: dict):
+        """
+        Appends a column to the specified table and to the index.
+        """
+        columns = self.tables[TableName]['ColumnDescriptions']
+        columns.append(column)
+        self.columns[TableName][column['ColumnName']] = len(columns) - 1 + len(self.removed[TableName])
+        self.columns_lists[TableName] = (columns, len(columns))
+
+
+    def remove_column(self, TableName: str, ColumnName: str):
+        """
+        Removes a column from the specified table and from the index.
+        """
+        columns = self.tables[TableName]['ColumnDescriptions']
+        del columns[self.position(TableName, ColumnName)]
+        bisect.insort(self.removed[TableName], self.columns[TableName].pop(ColumnName))
+        self.columns_lists[TableName] = (columns, len(columns))
+
+        if len(self.removed[TableName]) > len(columns):
+            self.index_columns(TableName)
 
 
 class CDScriptingResponse:
-    def __init__(self):
+    def __init__(self, node_file_path: str = None):
         """
         Initialize the CDScriptingResponse object.
 
         Parameters
         ----------
-        None
+        node_file_path : str, optional
+            The path of the node file (default is the first command line argument, sys.argv[1], as passed by Compound Discoverer).
 
         Returns
         -------
@@ -28,22 +679,92 @@ class CDScriptingResponse:
 
         Notes
         -----
-        The constructor extracts the directory and filename from the first command line argument (sys.argv[1]), and initializes empty dictionaries for the node file, tables, and columns.
+        The constructor extracts the directory and filename of the node file from 'node_file_path' or, by default, from the first command line argument (sys.argv[1]), and initializes empty dictionaries for the node file, tables, and columns, as well as for the table and column indices of the node files handled by the object (see '__get_index').
+        The node file itself is not read until 'get_node_file' is called. The tables dictionary holds the data of the tables added with 'add_table_data', which are written by 'commit'.
+        If 'timer' is set to a CDTimer (e.g., by 'run_script'), the time spent reading the node file, loading each table, and writing each data file and the response node file is recorded as a phase of the timer.
         """
-        self.__directory = os.path.dirname(sys.argv[1])
-        self.__basename = os.path.basename(sys.argv[1])
-        self.__node_file = dict()
+        if node_file_path is None:
+            node_file_path = sys.argv[1]
+
+        self.__directory = os.path.dirname(node_file_path)
+        self.__basename = os.path.basename(node_file_path)
+        self.__node_file = _ReadOnlyDict()
+        self.__node_file_key = None
         self.__tables = dict()
         self.__columns = dict()
+        self.__indices = dict()
+        self.timer = None
+
+
+    def __phase(self, name: str):
+        """
+        Returns a context manager that records the enclosed code as a phase of the timer, or does nothing if no timer is set.
+        """
+        if self.timer is None:
+            return contextlib.nullcontext()
+        return self.timer.phase(name)
+
+
+    def __nested(self, function):
+        """
+        Returns the function, wrapped so that the phases it records on another thread are nested in the current phase (see 'CDTimer.wrap'), or the function itself if no timer is set.
+        """
+        if self.timer is None:
+            return function
+        return self.timer.wrap(function)
+
+
+    def __table_data(self, node_file: dict, create: bool = False):
+        """
+        Returns the data of the tables added to the node file with 'add_table_data' (the data and the path of the data file, by table name), or an empty dictionary if there are none and 'create' is False.
+        """
+        entry = self.__tables.get(id(node_file))
+
+        # Each entry holds its node file, so that a node file with the id of one freed before 'commit' does not get its data.
+        if entry is None or entry[0] is not node_file:
+            if not create:
+                return dict()
+            entry = self.__tables[id(node_file)] = (node_file, dict())
+
+        return entry[1]
+
+
+    def __get_index(self, node_file: dict):
+        """
+        Returns the table and column index of the specified node file, building it on first use.
+
+        Parameters
+        ----------
+        node_file : dict
+            The node file dictionary to index.
+
+        Returns
+        -------
+        _NodeFileIndex
+            The index of the node file's tables and columns.
+
+        Notes
+        -----
+        The object keeps the indices of at most three node files: the node file read by 'get_node_file' ('node file', replaced when the node file is read again, e.g., by 'reload'), the node file created by the last call of 'add_node_file' ('response', replaced by the next call), and the last other node file used ('other'). Each index holds its node file and is found by identity, so an index is never used for another node file, and node files the object no longer indexes can be freed. An index is only a cache: a node file whose index was replaced is indexed again when it is next used.
+        """
+        for index in self.__indices.values():
+            if index.node_file is node_file:
+                return index
+
+        index = _NodeFileIndex(node_file)
+        self.__indices['node file' if node_file is self.__node_file else 'other'] = index
+
+        return index
 
     
-    def get_node_file(self):
+    def get_node_file(self, read_only: bool = False):
         """
         Reads the node file from disk and returns a copy of its contents.
 
         Parameters
         ----------
-        None
+        read_only : bool, optional
+            If True, the parsed node file itself is returned, read-only, instead of a deep copy (default is False).
 
         Returns
         -------
@@ -58,17 +779,48 @@ class CDScriptingResponse:
         Notes
         -----
         The method reads the node file from disk using the directory and filename stored in the CDScriptingResponse object, and returns a deep copy of its contents as a dictionary. If the node file cannot be read from disk, the method prints an error message and returns None.
+        With 'read_only=True', no copy is made: the returned dictionary is the one held by the CDScriptingResponse object. Its dictionaries and lists raise an exception if they are modified (they are still dicts and lists, e.g., for 'json.dump'), so that the node file read by later calls is never changed. Use 'add_node_file' to create a response node file from it that can be modified.
+        The parsed node file is cached on the CDScriptingResponse object together with the path, modification time, and size of the file. The file is only read and parsed again if one of these has changed; use 'reload' to force a fresh read.
         """
         node_file = None
+        path = os.path.join(self.__directory, self.__basename)
         try:
-            with open(os.path.join(self.__directory, self.__basename), 'r') as f:
-                self.__node_file = json.load(f)
+            stat = os.stat(path)
+            key = (path, stat.st_mtime_ns, stat.st_size)
+
+            if key != self.__node_file_key:
+                with self.__phase('read node file'), open(path, 'r') as f:
+                    self.__node_file = _freeze(json.load(f))
+                self.__node_file_key = key
+                self.__indices.pop('node file', None)
         
         except Exception as e:
             print(f'Failed to read node file: {str(e)}')
         
-        node_file = copy.deepcopy(self.__node_file)
+        node_file = self.__node_file if read_only else _thaw(self.__node_file)
         return node_file
+
+
+    def reload(self, read_only: bool = False):
+        """
+        Reads the node file from disk again, regardless of the cached copy, and returns its contents.
+
+        Parameters
+        ----------
+        read_only : bool, optional
+            If True, the parsed node file itself is returned instead of a deep copy (default is False).
+
+        Returns
+        -------
+        dict
+            The node file contents as a dictionary.
+
+        Notes
+        -----
+        The method discards the node file cached by 'get_node_file' and reads it from disk. Node files previously returned with 'read_only=True' are not changed by the reload.
+        """
+        self.__node_file_key = None
+        return self.get_node_file(read_only=read_only)
     
 
     def get_table(self, node_file: dict, TableName: str):
@@ -92,9 +844,7 @@ class CDScriptingResponse:
         Exception
             If the table with the specified name cannot be found in the node file.
         """
-        tables = node_file.get('Tables', [])
-
-        table = next((table for table in tables if table['TableName'] == TableName), None)
+        table = self.__get_index(node_file).get_table(TableName)
 
         if table is None:
             raise Exception(f'Cannot find table {TableName} in node file.')
@@ -126,13 +876,12 @@ class CDScriptingResponse:
             If the table with the specified name does not exist in the node file, or if the column with the specified name does not exist in the table.
         """
         table = self.get_table(node_file, TableName)
+        position = self.__get_index(node_file).get_column_position(TableName, ColumnName)
 
-        column = next((column for column in table.get('ColumnDescriptions', []) if column['ColumnName'] == ColumnName), None)
-
-        if column is None:
+        if position is None:
             raise Exception(f'Cannot find column {ColumnName} in table {TableName}.')
 
-        return column
+        return table['ColumnDescriptions'][position]
 
 
     def add_node_file(self, node_file, **kwargs):
@@ -160,8 +909,10 @@ class CDScriptingResponse:
         Notes
         -----
         The function adds the new node file to the CDScriptingResponse object and returns the updated node file dictionary. The function raises an exception if the node file cannot be added to the CDScriptingResponse object.
+        The new node file is a complete copy of 'node_file' (made without 'copy.deepcopy', which is several times slower), so it can be modified freely, directly or with the methods of CDScriptingResponse, without changing 'node_file'; 'node_file' may be the read-only node file returned by 'get_node_file(read_only=True)'.
+        The new node file is indexed (see '__get_index') in place of the node file created by the previous call.
         """
-        node_file = copy.deepcopy(node_file) or {}
+        node_file = _thaw(node_file or {})
 
         for key, default in [
             ('CurrentWorkflowID', node_file.get('CurrentWorkflowID')),
@@ -173,8 +924,9 @@ class CDScriptingResponse:
         ]:
             node_file[key] = kwargs.get(key, default)
 
-        return node_file
+        self.__indices['response'] = _NodeFileIndex(node_file)
 
+        return node_file
 
 
     def add_table(self, node_file: dict, TableName: str, **kwargs):
@@ -204,7 +956,9 @@ class CDScriptingResponse:
         Exception
             If a table with the same name already exists in the node file.
         """
-        if any(table['TableName'] == TableName for table in node_file.get('Tables', [])):
+        index = self.__get_index(node_file)
+
+        if index.get_table(TableName) is not None:
             raise Exception(f'Table {TableName} already exists in node file.')
 
         new_table = {
@@ -215,7 +969,7 @@ class CDScriptingResponse:
             'ColumnDescriptions': kwargs.get('ColumnDescriptions', [])
         }
 
-        node_file['Tables'].append(new_table)
+        index.append_table(new_table)
 
         return node_file
 
@@ -253,22 +1007,118 @@ class CDScriptingResponse:
         The function adds the new column to the specified table in the node file and returns the updated node file dictionary.
         The function raises an exception if a column with the same name already exists in the table, or if the table with the specified name does not exist in the node file.
         """
-        for table in node_file['Tables']:
-            if table['TableName'] == TableName:
-                if any(column['ColumnName'] == ColumnName for column in table['ColumnDescriptions']):
-                    raise Exception(f'Column {ColumnName} already exists in table {TableName}.')
+        index = self.__get_index(node_file)
+
+        if index.get_table(TableName) is None:
+            raise Exception(f'Table {TableName} not found.')
+
+        if index.get_column_position(TableName, ColumnName) is not None:
+            raise Exception(f'Column {ColumnName} already exists in table {TableName}.')
+
+        new_column = {
+            'ColumnName': ColumnName,
+            'ID': kwargs.get('ID', ''),
+            'DataType': kwargs.get('DataType', ''),
+            'Options': kwargs.get('Options', {})
+        }
+
+        index.append_column(TableName, new_column)
+        return node_file
+
+
+    def add_connection_table(self, node_file: dict, FirstTable: str, SecondTable: str, id_pairs, DataFile: str = None, WorkflowID=None, TableName: str = None, defer: bool = False):
+        """
+        Writes the data file of a connection table between two tables and adds the connection table to the node file.
+
+        Parameters
+        ----------
+        node_file : dict
+            The node file dictionary containing the two tables, to which the connection table is added.
+        FirstTable : str
+            The name of the first table (e.g., the table exported by Compound Discoverer).
+        SecondTable : str
+            The name of the second table (e.g., a new table added with 'add_table').
+        id_pairs : numpy.ndarray or tuple
+            The pairs of connected rows, either as an array of shape (number of pairs, 2) or as a tuple of two arrays of the same length: the IDs of the first table's rows and the IDs of the second table's rows. An ID may appear in several pairs (one-to-many and many-to-many connections).
+        DataFile : str, optional
+            The path of the data file to write (default is the first table's 'DataFile' with the second table's name appended, e.g., 'ConsolidatedGCEICompoundItem-NewCDTable.out.txt').
+        WorkflowID : int or numpy.ndarray, optional
+            The value(s) of the 'WorkflowID' columns (default is the node file's 'CurrentWorkflowID', which is then required).
+        TableName : str, optional
+            The name of the connection table (default is '<FirstTable> - <SecondTable>').
+        defer : bool, optional
+            If True, the data file is written by 'commit' along with the other data files of the response, rather than immediately (default is False).
+
+        Returns
+        -------
+        dict
+            The updated node file dictionary with the connection table.
+
+        Raises
+        ------
+        Exception
+            If either table cannot be found in the node file or has no 'ID' column, if the ID arrays are not integers of the same length, if a table with the same name already exists in the node file, or if 'WorkflowID' is not given and the node file has no 'CurrentWorkflowID'.
+
+        Notes
+        -----
+        The connection table's columns are the 'ID' and 'WorkflowID' columns of the first table followed by those of the second table, in the order of their 'ColumnDescriptions' (e.g., 'GC EI Compounds ID', 'New CD Table ID', 'New CD Table WorkflowID'); the connection table is added with the 'CSVConnectionTable' data format and the 'FirstTable' and 'SecondTable' options.
+        The IDs are formatted as text with vectorized NumPy operations over blocks of rows, rather than one value at a time, so millions of pairs are written in a single pass.
+        """
+        if TableName is None:
+            TableName = f'{FirstTable} - {SecondTable}'
+
+        if WorkflowID is None:
+            if 'CurrentWorkflowID' not in node_file:
+                raise Exception(f'Failed to add connection table {TableName}: node file has no CurrentWorkflowID; pass WorkflowID.')
+            WorkflowID = node_file['CurrentWorkflowID']
+
+        if isinstance(id_pairs, tuple):
+            id_pairs = np.column_stack([np.asarray(ids) for ids in id_pairs]) if len(id_pairs) == 2 and len(id_pairs[0]) == len(id_pairs[1]) else None
+        else:
+            id_pairs = np.asarray(id_pairs)
+
+        if id_pairs is None or id_pairs.ndim != 2 or id_pairs.shape[1] != 2 or not (np.issubdtype(id_pairs.dtype, np.integer) or len(id_pairs) == 0):
+            raise Exception(f'IDs of connection table {TableName} must be two integer arrays of the same length.')
+
+        id_columns = []
+
+        for position, name in enumerate((FirstTable, SecondTable)):
+            table = self.get_table(node_file, name)
+            columns = [column for column in table.get('ColumnDescriptions', []) if column.get('ID') in ('ID', 'WorkflowID')]
+
+            if not any(column['ID'] == 'ID' for column in columns):
+                raise Exception(f'Table {name} has no ID column; cannot connect.')
+
+            for column in columns:
+                values = id_pairs[:, position] if column['ID'] == 'ID' else np.broadcast_to(np.asarray(WorkflowID, dtype=np.int64), len(id_pairs))
+                id_columns.append((column['ColumnName'], column['ID'], values))
+
+        if DataFile is None:
+            # The first table's 'DataFile' may already have been set to its '.out.txt' file (e.g., by 'add_table_data').
+            FirstDataFile = self.get_table(node_file, FirstTable)['DataFile']
+            FirstDataFile = FirstDataFile[:-len('.out.txt')] if FirstDataFile.endswith('.out.txt') else os.path.splitext(FirstDataFile)[0]
+            DataFile = FirstDataFile + '-' + re.sub(r'\W', '', SecondTable) + '.out.txt'
+
+        def write(path):
+            with open(path, mode='wb') as f:
+                f.write(b'\t'.join(self.__format_value(ColumnName) for ColumnName, ID, values in id_columns) + b'\r\n')
 
-                new_column = {
-                    'ColumnName': ColumnName,
-                    'ID': kwargs.get('ID', ''),
-                    'DataType': kwargs.get('DataType', ''),
-                    'Options': kwargs.get('Options', {})
-                }
+                for block in range(0, len(id_pairs), 65536):
+                    f.write(self.__format_integers([values[block:block + 65536] for ColumnName, ID, values in id_columns]))
 
-                table['ColumnDescriptions'].append(new_column)
-                return node_file
+        if not defer:
+            with self.__phase(f'write {os.path.basename(DataFile)}'):
+                write(DataFile)
 
-        raise Exception(f'Table {TableName} not found.')
+        self.add_table(node_file, TableName, DataFile=DataFile, DataFormat='CSVConnectionTable', Options={'FirstTable': FirstTable, 'SecondTable': SecondTable})
+
+        for ColumnName, ID, values in id_columns:
+            self.add_column(node_file, TableName, ColumnName, ID=ID, DataType='Int')
+
+        if defer:
+            self.add_table_data(node_file, TableName, write, DataFile)
+
+        return node_file
 
 
     def update_node_file(self, node_file: dict, **kwargs):
@@ -337,12 +1187,13 @@ class CDScriptingResponse:
         -----
         The function updates the options for the specified table both in the node file.
         """
-        for table in node_file['Tables']:
-            if table['TableName'] == TableName:
-                table['Options'] = Options
-                return node_file
-        
-        raise Exception(f'Cannot find table {TableName} in node file; cannot set options.')
+        table = self.__get_index(node_file).get_table(TableName)
+
+        if table is None:
+            raise Exception(f'Cannot find table {TableName} in node file; cannot set options.')
+
+        table['Options'] = Options
+        return node_file
         
 
     def set_column_options(self, node_file: dict, TableName: str, ColumnName: str, Options: dict):   
@@ -374,14 +1225,15 @@ class CDScriptingResponse:
         -----
         The function updates the options for the specified column both in the node file.
         """
-        for table in node_file['Tables']:
-            if table['TableName'] == TableName:
-                for column in table['ColumnDescriptions']:
-                    if column['ColumnName'] == ColumnName:
-                        column['Options'] = Options
-                        return node_file
+        index = self.__get_index(node_file)
+        table = index.get_table(TableName)
+        position = index.get_column_position(TableName, ColumnName) if table is not None else None
+
+        if position is None:
+            raise Exception(f'Cannot find column {ColumnName} in table {TableName}; cannot set options.')
 
-        raise Exception(f'Cannot find column {ColumnName} in table {TableName}; cannot set options.')
+        table['ColumnDescriptions'][position]['Options'] = Options
+        return node_file
 
 
     def remove_table(self, node_file: dict, TableName: str):   
@@ -409,12 +1261,14 @@ class CDScriptingResponse:
         -----
         The function removes the specified table from the node file.
         """
-        for table in node_file['Tables']:
-            if table['TableName'] == TableName:
-                node_file['Tables'].remove(table)
-                return node_file
-        
-        raise Exception(f'Cannot find table {TableName} in node file; cannot remove.')
+        index = self.__get_index(node_file)
+
+        if index.get_table(TableName) is None:
+            raise Exception(f'Cannot find table {TableName} in node file; cannot remove.')
+
+        index.remove_table(TableName)
+        self.__table_data(node_file).pop(TableName, None)
+        return node_file
     
     
     def remove_column(self, node_file: dict, TableName: str, ColumnName: str):   
@@ -444,17 +1298,16 @@ class CDScriptingResponse:
         -----
         The function removes the specified column both from the node file.
         """
-        for table in node_file['Tables']:
-            if table['TableName'] == TableName:
-                for column in table['ColumnDescriptions']:
-                    if column['ColumnName'] == ColumnName:
-                        table['ColumnDescriptions'].remove(column)
-                        return node_file
+        index = self.__get_index(node_file)
 
-        raise Exception(f'Cannot find column {ColumnName} in table {TableName}; cannot remove.')
+        if index.get_table(TableName) is None or index.get_column_position(TableName, ColumnName) is None:
+            raise Exception(f'Cannot find column {ColumnName} in table {TableName}; cannot remove.')
 
+        index.remove_column(TableName, ColumnName)
+        return node_file
 
-    def save_to_file(self, node_file: dict, filename: str):   
+
+    def save_to_file(self, node_file: dict, filename: str, compact: bool = False, backend: str = None, fast: bool = False):   
         """
         Saves the node file to a file on disk.
 
@@ -465,6 +1318,13 @@ class CDScriptingResponse:
         filename : str
             The filename to which to save the node file. If not an absolute path, then the
             file is saved in the same directory as the script.
+        compact : bool, optional
+            If True, the node file is saved on a single line without indentation, which is
+            smaller and faster to write and read (default is False).
+        backend : str, optional
+            The JSON package to use, one of 'JSON_BACKENDS' (default is 'json'; see 'dumps_json').
+        fast : bool, optional
+            If True, the node file is serialized with the fastest JSON package installed, e.g., 'orjson', whose output differs from that of 'json' (default is False; see 'dumps_json').
 
         Returns
         -------
@@ -479,6 +1339,8 @@ class CDScriptingResponse:
         -----
         The function saves the specified node file to the file system. If the directory does not
         exist, it is created. If the file already exists, it is overwritten.
+        The node file is serialized with 'dumps_json' (by default as 'json.dump' with 'indent=4';
+        with 'fast=True', e.g., with the optional 'orjson' package) and written in a single operation.
         """
         if not os.path.isabs(filename):
             filename = os.path.join(self.__directory, filename)
@@ -488,11 +1350,1904 @@ class CDScriptingResponse:
         os.makedirs(os.path.dirname(filename), exist_ok=True)
 
         try:
-            with open(filename, mode='w', encoding='utf-8') as f:
-                json.dump(node_file, f, indent=4, ensure_ascii=False)
+            with self.__phase('write response'), open(filename, mode='wb') as f:
+                f.write(dumps_json(node_file, compact, backend, fast))
             print(f'Successfully saved node file to {filename}!')
         
         except Exception as e:
             print(f'Failed to save node file to {filename}: {str(e)}')
             print(traceback.format_exc())
 
+
+    def add_table_data(self, node_file: dict, TableName: str, data, DataFile: str = None):
+        """
+        Sets the data of a table of the response node file, to be written to the table's data file by 'commit'.
+
+        Parameters
+        ----------
+        node_file : dict
+            The response node file dictionary containing the table.
+        TableName : str
+            The name of the table.
+        data : pandas.DataFrame or callable
+            The table's data, or a function that takes the path of a file and writes the table's data file to it (e.g., lambda path: response.append_columns('GC EI Compounds', columns, DataFile=path)).
+        DataFile : str, optional
+            The path of the table's data file (default is the table's 'DataFile' if it ends with '.out.txt', otherwise the table's 'DataFile' with the extension '.out.txt').
+
+        Returns
+        -------
+        dict
+            The node file dictionary, with the table's 'DataFile' set to the path of the data file to be written.
+
+        Raises
+        ------
+        Exception
+            If the table with the specified name cannot be found in the node file.
+
+        Notes
+        -----
+        Nothing is written until 'commit' is called; setting the data of a table again replaces the data set before.
+        """
+        table = self.get_table(node_file, TableName)
+
+        if DataFile is None:
+            DataFile = table['DataFile'] if table['DataFile'].endswith('.out.txt') else os.path.splitext(table['DataFile'])[0] + '.out.txt'
+
+        table['DataFile'] = DataFile
+        self.__table_data(node_file, create=True)[TableName] = (data, DataFile)
+
+        return node_file
+
+
+    def commit(self, node_file: dict, filename: str = None, max_workers: int = None, compact: bool = False, validate: bool = False, fast: bool = False):
+        """
+        Writes the data files of the tables added with 'add_table_data' and then the node file, so that Compound Discoverer receives either all of the results or none of them.
+
+        Parameters
+        ----------
+        node_file : dict
+            The response node file dictionary to save.
+        filename : str, optional
+            The filename to which to save the node file. If not an absolute path, then the file is saved in the same directory as the script (default is the node file's 'ExpectedResponsePath').
+        max_workers : int, optional
+            The number of data files written at the same time (default is the number of data files, up to 32).
+        compact : bool, optional
+            If True, the node file is saved on a single line without indentation (default is False; see 'save_to_file').
+        validate : bool, optional
+            If True, the data files written are checked against the node file with 'validate' before they replace the existing files (default is False).
+        fast : bool, optional
+            If True, the node file is serialized with the fastest JSON package installed (default is False; see 'dumps_json').
+
+        Returns
+        -------
+        str
+            The path of the node file saved.
+
+        Raises
+        ------
+        Exception
+            If a data frame lacks columns described in the node file for its table, if any of the data files or the node file cannot be written, or (with 'validate=True') if the node file and the data files do not match; the errors of all files are reported together.
+
+        Notes
+        -----
+        Each data file is first written to a temporary file in the directory of the data file, on a pool of threads, and flushed to disk (fsync). Only once all of the data files are written, each temporary file replaces its data file (a rename, which is atomic on the same file system) and the node file is written last, in the same way. If any data file fails, the temporary files are removed and neither the data files nor the node file are changed, so a half-written result is never handed back to Compound Discoverer (which reads the data files listed in the node file found at 'ExpectedResponsePath').
+        Data frames are written as tab-separated text files with 'to_csv', as in the example scripts.
+        """
+        if filename is None:
+            filename = node_file.get('ExpectedResponsePath') or 'node_response.json'
+
+        if not os.path.isabs(filename):
+            filename = os.path.join(self.__directory, filename)
+
+        tables = self.__table_data(node_file)
+
+        # Data frames that lack described columns (e.g., 'Structure', which 'load_table' leaves out unless 'structures=True') are rejected before anything is written, even without 'validate'.
+        missing = []
+
+        for TableName, (data, DataFile) in tables.items():
+            if not callable(data):
+                names = [column['ColumnName'] for column in self.get_table(node_file, TableName)['ColumnDescriptions'] if column['ColumnName'] not in data.columns]
+                if names:
+                    missing.append(f'{DataFile}: columns {", ".join(names)} of table {TableName} are described in the node file but missing from its data')
+
+        if missing:
+            raise Exception('Failed to write response files; nothing was saved:\n' + '\n'.join(sorted(missing)))
+
+        files = [(DataFile, data if callable(data) else (lambda f, data=data: data.to_csv(f, sep='\t', index=False)), callable(data)) for data, DataFile in tables.values()]
+        files.append((filename, lambda f: f.write(dumps_json(node_file, compact, fast=fast).decode('utf-8')), False))
+        phases = {path: f'write {os.path.basename(path)}' for path, writer, to_path in files[:-1]}
+        phases[filename] = 'write response'
+
+        temporary_files = dict()
+        errors = []
+
+        with self.__phase('write files'), concurrent_futures.ThreadPoolExecutor(max_workers=max_workers or min(len(files), 32)) as executor:
+            futures = {executor.submit(self.__nested(self.__write_temporary_file), path, writer, to_path, phases[path]): path for path, writer, to_path in files}
+
+            for future in concurrent_futures.as_completed(futures):
+                try:
+                    temporary_files[futures[future]] = future.result()
+                except Exception as e:
+                    errors.append(f'{futures[future]}: {str(e)}')
+
+        if validate and not errors:
+            with self.__phase('validate'):
+                errors = self.validate(node_file, max_workers, DataFiles={TableName: temporary_files[DataFile] for TableName, (data, DataFile) in tables.items()})
+
+        if errors:
+            for temporary_file in temporary_files.values():
+                os.remove(temporary_file)
+            raise Exception('Failed to write response files; nothing was saved:\n' + '\n'.join(sorted(errors)))
+
+        with self.__phase('replace files'):
+            for path, writer, to_path in files:
+                os.replace(temporary_files[path], path)
+
+        self.__tables.pop(id(node_file), None)
+        print(f'Successfully saved node file to {filename}!')
+
+        return filename
+
+
+    def validate(self, node_file: dict, max_workers: int = None, rows: int = None, DataFiles: dict = None):
+        """
+        Checks the data files of the tables of a response node file against the tables' 'ColumnDescriptions', to find the problems that would make Compound Discoverer reject the import.
+
+        Parameters
+        ----------
+        node_file : dict
+            The response node file dictionary to check.
+        max_workers : int, optional
+            The number of data files checked at the same time (default is the number of tables, up to 32).
+        rows : int, optional
+            The number of rows of each data file to check (default is all rows).
+        DataFiles : dict, optional
+            The paths of the data files to check instead of the tables' 'DataFile', by table name (e.g., the files written but not yet saved by 'commit').
+
+        Returns
+        -------
+        list
+            The problems found, as messages starting with the table name; an empty list if none were found.
+
+        Notes
+        -----
+        For each table, the following are checked:
+        - the data file exists and every row has as many fields as the header;
+        - every column of 'ColumnDescriptions' has a matching column in the header, with no duplicate names (columns of the data file that are not described are ignored by Compound Discoverer and are allowed);
+        - the table has an 'ID' column and, if it is not one of the tables of the node file passed to the script (see 'get_node_file'), a 'WorkflowID' column; connection tables ('CSVConnectionTable') have the 'FirstTable' and 'SecondTable' options, naming tables of the node file;
+        - the values of 'Int', 'Float', and 'Boolean' columns can be read as such (columns of the 'CATEGORICAL_DATA_GROUPS' data groups, exported as labels, are not checked), and the 'ID' and 'WorkflowID' columns have no missing values.
+        Each data file is read once, sequentially and in blocks of complete lines ('SCAN_BLOCK_SIZE'): the fields of each line are counted (tabs within double-quoted fields are not separators), and the values of the columns checked are parsed from the same block as text, without converting them. The data files are read in parallel on a pool of threads. All problems are reported together, with up to 3 example rows per column.
+        """
+        tables = node_file.get('Tables', [])
+        DataFiles = DataFiles or dict()
+        source_tables = {table['TableName'] for table in self.get_node_file(read_only=True).get('Tables', [])}
+        table_names = {table['TableName'] for table in tables} | source_tables
+
+        problems = []
+
+        with concurrent_futures.ThreadPoolExecutor(max_workers=max_workers or max(min(len(tables), 32), 1)) as executor:
+            futures = [executor.submit(self.__validate_table, table, DataFiles.get(table['TableName'], table['DataFile']), table['TableName'] not in source_tables, table_names, rows) for table in tables]
+
+            for future in futures:
+                problems += future.result()
+
+        return problems
+
+
+    def __validate_table(self, table: dict, DataFile: str, new: bool, table_names: set, rows: int = None):
+        """
+        Returns the problems found in the data file of a table (see 'validate').
+        """
+        TableName = table['TableName']
+        columns = table.get('ColumnDescriptions', [])
+        IDs = [column.get('ID') for column in columns]
+        problems = []
+
+        if 'ID' not in IDs:
+            problems.append(f'Table {TableName}: no ID column (a column with ID \'ID\').')
+
+        if table.get('DataFormat') == 'CSVConnectionTable':
+            for option in ('FirstTable', 'SecondTable'):
+                if (table.get('Options') or {}).get(option) not in table_names:
+                    problems.append(f'Table {TableName}: option {option} does not name a table of the node file.')
+
+        elif new and 'WorkflowID' not in IDs:
+            problems.append(f'Table {TableName}: no WorkflowID column (a column with ID \'WorkflowID\'), required for new tables.')
+
+        try:
+            with open(DataFile, mode='rb') as f:
+                header_line = f.readline()
+            header = [name.strip('"') for name in header_line.decode('utf-8').rstrip('\r\n').split('\t')]
+
+        except Exception as e:
+            return problems + [f'Table {TableName}: cannot read data file {DataFile}: {str(e)}']
+
+        names = [column['ColumnName'] for column in columns]
+
+        for name in sorted({name for name in names if names.count(name) > 1} | {name for name in header if header.count(name) > 1}):
+            problems.append(f'Table {TableName}: duplicate column {name}.')
+
+        for name in names:
+            if name not in header:
+                problems.append(f'Table {TableName}: column {name} is described but not in the header of the data file.')
+
+        checks = dict()
+
+        for column in columns:
+            if column['ColumnName'] not in header or (column.get('Options') or {}).get('DataGroupName') in CATEGORICAL_DATA_GROUPS:
+                continue
+            elif column.get('DataType') in ('Int', 'Float', 'Boolean') or column.get('ID') in ('ID', 'WorkflowID'):
+                checks[column['ColumnName']] = column
+
+        bad_rows = {name: [] for name in checks}
+        bad_counts = {name: 0 for name in checks}
+        ragged_lines = []
+        ragged_count = 0
+
+        # The data file is read once, in blocks of complete lines: the fields of each line are counted, and the values of the columns checked are parsed from the same block.
+        try:
+            with open(DataFile, mode='rb') as f:
+                f.readline()
+                remainder = b''
+                line = 1
+                row = 0
+
+                while rows is None or row < rows:
+                    block = f.read(SCAN_BLOCK_SIZE)
+                    data = remainder + block
+
+                    if not block:
+                        if not data:
+                            break
+                        data += b'' if data.endswith(b'\n') else b'\n'
+
+                    ends, fields, blank = _split_lines(data)
+
+                    if len(ends) == 0:
+                        if not block:
+                            raise Exception(f'unterminated quoted field after line {line}')
+                        remainder = data
+                        continue
+
+                    if rows is not None and row + int((~blank).sum()) > rows:
+                        last = np.flatnonzero(~blank)[rows - row - 1] + 1
+                        ends, fields, blank = ends[:last], fields[:last], blank[:last]
+
+                    complete, remainder = data[:ends[-1]], data[ends[-1]:]
+
+                    ragged = np.flatnonzero(~blank & (fields != len(header)))
+                    ragged_count += len(ragged)
+                    ragged_lines += [(line + 1 + int(position), int(fields[position])) for position in ragged[:3 - len(ragged_lines)]]
+
+                    if checks:
+                        chunk = pd.read_csv(io.BytesIO(header_line + complete), sep='\t', header=0, index_col=False, dtype=str, keep_default_na=False, usecols=list(checks), engine='c')
+
+                        for name, column in checks.items():
+                            values = chunk[name].str.strip()
+                            present = values != ''
+                            DataType = column.get('DataType')
+
+                            if DataType == 'Int':
+                                bad = present & ~values.str.fullmatch(r'[+-]?\d+')
+                            elif DataType == 'Float':
+                                bad = present & pd.to_numeric(values.where(present, '0'), errors='coerce').isna() & ~values.str.fullmatch(r'(?i)[+-]?(nan|inf|infinity)')
+                            elif DataType == 'Boolean':
+                                bad = present & ~values.str.lower().isin(['true', 'false', '1', '0'])
+                            else:
+                                bad = pd.Series(False, index=values.index)
+
+                            if column.get('ID') in ('ID', 'WorkflowID'):
+                                bad = bad | ~present
+
+                            bad_counts[name] += int(bad.sum())
+                            bad_rows[name] += [(row + index + 1, value) for index, value in values[bad].head(3).items()][:3 - len(bad_rows[name])]
+
+                    line += len(ends)
+                    row += int((~blank).sum())
+
+                    if not block:
+                        break
+
+        except Exception as e:
+            return problems + [f'Table {TableName}: cannot parse data file {DataFile}: {str(e).strip()}']
+
+        if ragged_count:
+            examples = ', '.join(f'line {number}: {count} fields' for number, count in ragged_lines)
+            problems.append(f'Table {TableName}: {ragged_count} rows have a different number of fields than the header ({len(header)} fields) ({examples}).')
+
+        for name, column in checks.items():
+            if bad_counts[name]:
+                examples = ', '.join(f'row {row}: {value!r}' for row, value in bad_rows[name])
+                expected = f'{column.get("DataType")} values' + (' without missing values' if column.get('ID') in ('ID', 'WorkflowID') else '')
+                problems.append(f'Table {TableName}: column {name} has {bad_counts[name]} invalid values, expected {expected} ({examples}).')
+
+        return problems
+
+
+    def __write_temporary_file(self, path: str, writer, to_path: bool = False, phase: str = None):
+        """
+        Writes a file with the specified writer (a function that takes an open text file, or the path of the file if 'to_path' is True) to a temporary file in the directory of the path, flushes it to disk, and returns the path of the temporary file.
+        """
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+
+        descriptor, temporary_file = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+
+        try:
+            with self.__phase(phase or f'write {os.path.basename(path)}'):
+                if to_path:
+                    os.close(descriptor)
+                    writer(temporary_file)
+
+                    with open(temporary_file, mode='rb+') as f:
+                        os.fsync(f.fileno())
+                else:
+                    with open(descriptor, mode='w', encoding='utf-8', newline='') as f:
+                        writer(f)
+                        f.flush()
+                        os.fsync(f.fileno())
+
+        except Exception:
+            os.remove(temporary_file)
+            raise
+
+        return temporary_file
+
+
+    def load_table(self, TableName: str, node_file: dict = None, engine: str = None, columns=None, cache: bool = False, structures: bool = False):
+        """
+        Reads the data file of a table exported by Compound Discoverer into a data frame, using the data types given by the table's 'ColumnDescriptions'.
+
+        Parameters
+        ----------
+        TableName : str
+            The name of the table to read.
+        node_file : dict, optional
+            The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+        engine : str, optional
+            The pandas parser engine to use (default is 'pyarrow' if the pyarrow package is installed, otherwise 'c').
+        columns : list or callable, optional
+            The columns to read, either as a list of column names or as a function that takes a column dictionary from 'ColumnDescriptions' and returns True for the columns to read (default is all columns).
+        cache : bool, optional
+            If True, the data read is saved to a binary cache file next to the data file, and later calls read the cache file instead of the data file for as long as the data file is unchanged (default is False).
+        structures : bool, optional
+            If True, the 'STRUCTURE_COLUMNS' (e.g., 'Structure') are read as text along with the other columns; otherwise they are left out unless listed in 'columns' (default is False).
+
+        Returns
+        -------
+        pandas.DataFrame
+            The table's data, with one column per column read from the data file (in the order of 'columns' if given as a list, otherwise in the order of the data file).
+
+        Raises
+        ------
+        Exception
+            If the table with the specified name cannot be found in the node file.
+
+        Notes
+        -----
+        Each column is read with the data type mapped from its 'DataType' in 'DATA_TYPES' (Int, Float, String, Boolean), so the values are converted as the file is parsed rather than inferred and converted afterwards. Padding spaces (e.g., ' 6316709') are ignored when reading numbers and stripped from text values; single-space values are read as missing.
+        Columns of the 'CATEGORICAL_DATA_GROUPS' data groups ('Gap Status' and 'Gap Fill Status', one column per file) are read as categorical data: one small integer code per row and the table of labels (e.g., 'Full gap', 'No gap') or codes (e.g., 128) kept once per column, which takes a fraction of the memory of text and allows vectorized filters (see 'CDSampleIndex.count'). Writing the data frame (e.g., with 'to_csv') writes the labels back.
+        Only the selected 'columns' are converted and kept in memory. The 'Structure' column holds a molfile of several KB per row and makes up most of the data file, so it is left out by default; use 'open_structures' to parse the molfiles of individual rows when needed (the rows of the data frame and of the 'CDStructureColumn' are in the same order). Use 'structures=True' if the whole table is to be written back to Compound Discoverer, since the 'ColumnDescriptions' still list the 'Structure' column (see 'validate').
+        With 'cache=True', the typed data is saved in the Feather format (if the pyarrow package is installed, otherwise as a pandas pickle) to a '.cdcache' file next to the data file, one per selection of columns. The cache file is used as long as the size, modification time, and sampled hash (see 'file_fingerprint') of the data file match those recorded when the cache file was written; otherwise the data file is read again and the cache file replaced. This is intended for script development, where the same export is read many times.
+        """
+        with self.__phase(f'load table {TableName}'):
+            if node_file is None:
+                node_file = self.get_node_file(read_only=True)
+
+            table = self.get_table(node_file, TableName)
+
+            if not structures and not isinstance(columns, (list, tuple)) and any(column['ColumnName'] in STRUCTURE_COLUMNS for column in table.get('ColumnDescriptions', [])):
+                selection = columns
+                columns = lambda column: column['ColumnName'] not in STRUCTURE_COLUMNS and (selection is None or selection(column))
+
+            options = self.__read_options(table, engine, columns)
+
+            if cache:
+                data = self.__read_cache(table, options)
+
+                if data is not None:
+                    return data
+
+            data = pd.read_csv(table['DataFile'], **options)
+
+            if 'usecols' in options and list(data.columns) != options['usecols']:
+                data = data[options['usecols']]
+
+            data = self.__strip_text(data, table)
+
+            if cache:
+                self.__write_cache(table, options, data)
+
+            return data
+
+
+    def load_all_tables(self, node_file: dict = None, TableNames: list = None, max_workers: int = None, **kwargs):
+        """
+        Reads the data files of several tables exported by Compound Discoverer at the same time, each into a data frame as with 'load_table'.
+
+        Parameters
+        ----------
+        node_file : dict, optional
+            The node file dictionary containing the tables (default is the node file returned by 'get_node_file').
+        TableNames : list, optional
+            The names of the tables to read (default is all tables of the node file).
+        max_workers : int, optional
+            The number of data files read at the same time (default is the number of CPU cores, up to the number of tables).
+        **kwargs : dict, optional
+            The options passed to 'load_table' for every table ('engine', 'columns', 'cache', 'structures').
+
+        Returns
+        -------
+        dict
+            The tables' data, as a dictionary of table names and data frames (in the order of the tables in the node file, or of 'TableNames').
+
+        Raises
+        ------
+        Exception
+            If any of the tables cannot be found in the node file or cannot be read; the errors of all tables are reported together.
+
+        Notes
+        -----
+        The data files are read on a pool of threads rather than processes: the parsers of pandas and pyarrow release the GIL while parsing, and the data frames do not have to be copied back from other processes. The wall time is then close to that of the largest table, as long as there are enough cores.
+        If 'timer' is set, each table is recorded as its own 'load table <TableName>' phase, on the thread that reads it, nested in a 'load all tables' phase (one level deeper in the report). Since the tables are read at the same time, their wall time is not subtracted from the 'Exclusive' time of 'load all tables'.
+        """
+        with self.__phase('load all tables'):
+            if node_file is None:
+                node_file = self.get_node_file(read_only=True)
+
+            if TableNames is None:
+                TableNames = [table['TableName'] for table in node_file.get('Tables', [])]
+
+            # Look the tables up before starting the threads, so that a missing table is reported before any data file is read.
+            for TableName in TableNames:
+                self.get_table(node_file, TableName)
+
+            tables = dict()
+            errors = []
+
+            with concurrent_futures.ThreadPoolExecutor(max_workers=max_workers or max(1, min(len(TableNames), os.cpu_count() or 1))) as executor:
+                futures = {executor.submit(self.__nested(self.load_table), TableName, node_file, **kwargs): TableName for TableName in TableNames}
+
+                for future in concurrent_futures.as_completed(futures):
+                    try:
+                        tables[futures[future]] = future.result()
+                    except Exception as e:
+                        errors.append(f'{futures[future]}: {str(e)}')
+
+            if errors:
+                raise Exception('Failed to load tables:\n' + '\n'.join(sorted(errors)))
+
+            return {TableName: tables[TableName] for TableName in TableNames}
+
+
+    def __cache_paths(self, table: dict, options: dict):
+        """
+        Returns the paths of the cache file and of its metadata file for the specified table and read options.
+        """
+        key = json.dumps([options.get('usecols'), sorted((name, str(dtype)) for name, dtype in options['dtype'].items()), options['na_values']])
+        path = os.path.splitext(table['DataFile'])[0] + '.' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:12] + '.cdcache'
+
+        return path, path + '.json'
+
+
+    def __read_cache(self, table: dict, options: dict):
+        """
+        Returns the data frame saved in the cache file of the specified table, or None if there is no valid cache file.
+        """
+        path, metadata_path = self.__cache_paths(table, options)
+
+        try:
+            with open(metadata_path, mode='r', encoding='utf-8') as f:
+                metadata = json.load(f)
+
+            if metadata['fingerprint'] != file_fingerprint(table['DataFile']):
+                return None
+
+            if metadata['format'] == 'feather':
+                return pd.read_feather(path)
+            return pd.read_pickle(path)
+
+        except Exception:
+            return None
+
+
+    def __write_cache(self, table: dict, options: dict, data):
+        """
+        Saves the data frame read from the data file of the specified table to its cache file.
+        """
+        path, metadata_path = self.__cache_paths(table, options)
+
+        try:
+            fingerprint = file_fingerprint(table['DataFile'])
+
+            if importlib.util.find_spec('pyarrow') is not None:
+                data.reset_index(drop=True).to_feather(path)
+                cache_format = 'feather'
+            else:
+                data.to_pickle(path)
+                cache_format = 'pickle'
+
+            with open(metadata_path, mode='w', encoding='utf-8') as f:
+                json.dump({'DataFile': table['DataFile'], 'format': cache_format, 'fingerprint': fingerprint}, f)
+
+        except Exception as e:
+            print(f'Failed to save cache file {path}: {str(e)}')
+
+
+    def stream_table(self, TableName: str, function, node_file: dict = None, DataFile: str = None, chunksize: int = 100000, columns=None):
+        """
+        Reads the data file of a table in chunks, applies a function to each chunk, and appends the result to a new data file.
+
+        Parameters
+        ----------
+        TableName : str
+            The name of the table to read.
+        function : callable
+            A function that takes a chunk of the table (a data frame) and returns the data frame to write (e.g., the chunk with new columns added). If the function returns None, the chunk itself is written.
+        node_file : dict, optional
+            The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+        DataFile : str, optional
+            The path of the data file to write (default is the table's 'DataFile' with the extension '.out.txt').
+        chunksize : int, optional
+            The number of rows per chunk (default is 100000).
+        columns : list or callable, optional
+            The columns to read, as for 'load_table' (default is all columns).
+
+        Returns
+        -------
+        str
+            The path of the data file written.
+
+        Raises
+        ------
+        Exception
+            If the table with the specified name cannot be found in the node file.
+
+        Notes
+        -----
+        The chunks are read with the same data types as 'load_table' and written as tab-separated text files, the header being written with the first chunk only. Only one chunk is held in memory at a time, so the memory used depends on 'chunksize' rather than on the size of the table.
+        The function should return the same columns, in the same order, for every chunk. The 'ColumnDescriptions' of the response node file must be updated separately (e.g., with 'add_column'), as must the table's 'DataFile' if the data file written is to be imported back into Compound Discoverer.
+        """
+        with self.__phase(f'stream table {TableName}'):
+            if node_file is None:
+                node_file = self.get_node_file(read_only=True)
+
+            table = self.get_table(node_file, TableName)
+
+            if DataFile is None:
+                DataFile = os.path.splitext(table['DataFile'])[0] + '.out.txt'
+
+            options = self.__read_options(table, 'c', columns)
+
+            with pd.read_csv(table['DataFile'], chunksize=chunksize, **options) as chunks, open(DataFile, mode='w', encoding='utf-8', newline='') as f:
+                for number, chunk in enumerate(chunks):
+                    if 'usecols' in options and list(chunk.columns) != options['usecols']:
+                        chunk = chunk[options['usecols']]
+
+                    chunk = self.__strip_text(chunk, table)
+                    result = function(chunk)
+
+                    if result is None:
+                        result = chunk
+
+                    result.to_csv(f, sep='\t', index=False, header=(number == 0))
+
+            return DataFile
+
+
+    def open_table(self, TableName: str, node_file: dict = None):
+        """
+        Opens the data file of a table exported by Compound Discoverer as a LazyCDTable, which decodes columns only when they are accessed.
+
+        Parameters
+        ----------
+        TableName : str
+            The name of the table to open.
+        node_file : dict, optional
+            The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+
+        Returns
+        -------
+        LazyCDTable
+            The table, indexed but not yet decoded.
+
+        Raises
+        ------
+        Exception
+            If the table with the specified name cannot be found in the node file, or if its data file cannot be indexed.
+        """
+        if node_file is None:
+            node_file = self.get_node_file(read_only=True)
+
+        return LazyCDTable(self.get_table(node_file, TableName))
+
+
+    def open_structures(self, TableName: str, node_file: dict = None, ColumnName: str = 'Structure', maxsize: int = STRUCTURE_CACHE_SIZE):
+        """
+        Opens the structure column of a table exported by Compound Discoverer as a CDStructureColumn, which parses the molfile of a row only when it is accessed.
+
+        Parameters
+        ----------
+        TableName : str
+            The name of the table.
+        node_file : dict, optional
+            The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+        ColumnName : str, optional
+            The name of the column holding the molfiles (default is 'Structure').
+        maxsize : int, optional
+            The number of parsed structures to keep in memory (default is 'STRUCTURE_CACHE_SIZE').
+
+        Returns
+        -------
+        CDStructureColumn
+            The column, holding the byte offsets of each row's molfile in the data file.
+
+        Raises
+        ------
+        Exception
+            If the table or the column with the specified name cannot be found.
+        """
+        return self.open_table(TableName, node_file).get_structures(ColumnName, maxsize)
+
+
+    def append_columns(self, TableName: str, columns: dict, node_file: dict = None, DataFile: str = None):
+        """
+        Writes a copy of the data file of a table with new columns appended, without parsing the original data.
+
+        Parameters
+        ----------
+        TableName : str
+            The name of the table whose data file is copied.
+        columns : dict
+            The new columns, as a dictionary of column names and values (lists, NumPy arrays, or pandas Series, with one value per row of the table).
+        node_file : dict, optional
+            The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+        DataFile : str, optional
+            The path of the data file to write (default is the table's 'DataFile' with the extension '.out.txt').
+
+        Returns
+        -------
+        str
+            The path of the data file written.
+
+        Raises
+        ------
+        Exception
+            If the table with the specified name cannot be found in the node file, or if the number of values of a new column does not match the number of rows (non-blank lines after the header) of the data file.
+
+        Notes
+        -----
+        The data file is copied line by line and the new values are appended to the bytes of each line, so the original columns are neither parsed nor re-formatted. Text values are written in double quotes, numbers as they are, and missing values (None, NaN) as empty fields.
+        The copy is written to a temporary file in the same directory, which replaces 'DataFile' only if all rows were appended; otherwise 'DataFile' is left as it was.
+        The data file is expected to hold one row per line, as exported by Compound Discoverer. The 'ColumnDescriptions' of the response node file must be updated separately (e.g., with 'add_column'), as must the table's 'DataFile'.
+        """
+        with self.__phase(f'write {TableName} columns'):
+            if node_file is None:
+                node_file = self.get_node_file(read_only=True)
+
+            table = self.get_table(node_file, TableName)
+
+            if DataFile is None:
+                DataFile = os.path.splitext(table['DataFile'])[0] + '.out.txt'
+
+            header = b''.join(b'\t' + self.__format_value(str(ColumnName)) for ColumnName in columns)
+            values = [[self.__format_value(value) for value in (column.tolist() if hasattr(column, 'tolist') else column)] for column in columns.values()]
+            rows = [b''.join(b'\t' + value for value in row) for row in zip(*values)]
+
+            if any(len(column) != len(rows) for column in values):
+                raise Exception(f'New columns of table {TableName} have different numbers of values; cannot append.')
+
+            def write(path):
+                with open(table['DataFile'], mode='rb') as source, open(path, mode='wb') as f:
+                    line = next(iter(source), b'')
+                    content = line.rstrip(b'\r\n')
+                    f.write(content + header + line[len(content):])
+
+                    # Blank lines are not rows (as in 'validate'): they are copied as they are, without values.
+                    number = 0
+                    for line in source:
+                        content = line.rstrip(b'\r\n')
+
+                        if not content:
+                            f.write(line)
+                            continue
+                        elif number < len(rows):
+                            f.write(content + rows[number] + line[len(content):])
+                        number += 1
+
+                if number != len(rows):
+                    raise Exception(f'New columns of table {TableName} have {len(rows)} values, but its data file has {number} rows; cannot append.')
+
+            # The copy is written to a temporary file that replaces the data file only once it is complete, so a failed append leaves no truncated file behind.
+            os.replace(self.__write_temporary_file(DataFile, write, to_path=True), DataFile)
+
+            return DataFile
+
+
+    def __format_value(self, value):
+        """
+        Formats a value as a field of a tab-separated data file.
+
+        Parameters
+        ----------
+        value : object
+            The value to format.
+
+        Returns
+        -------
+        bytes
+            The UTF-8 encoded field: text in double quotes, numbers and booleans as they are, and missing values as an empty field.
+        """
+        if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+            return b''
+        elif isinstance(value, (bool, int, float)):
+            return str(value).encode('utf-8')
+        else:
+            return b'"' + str(value).replace('"', '""').encode('utf-8') + b'"'
+
+
+    def __format_integers(self, columns: list):
+        """
+        Formats columns of integers as the lines of a tab-separated data file, with vectorized NumPy operations.
+
+        Parameters
+        ----------
+        columns : list of numpy.ndarray
+            The columns, of the same length.
+
+        Returns
+        -------
+        bytes
+            The lines, each ending with '\\r\\n' (as in the data files exported by Compound Discoverer).
+        """
+        fields, valid = [], []
+
+        for values in columns:
+            values = np.asarray(values, dtype=np.int64)
+            magnitudes = np.abs(values)
+            width = len(str(int(magnitudes.max()))) if len(values) else 1
+
+            # One character per digit (most significant first) and one for the sign, leading zeros and '+' signs left out.
+            powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+            digits = (magnitudes[:, None] // powers % 10 + 48).astype(np.uint8)
+            significant = (magnitudes[:, None] >= powers) | (powers == 1)
+
+            fields += [np.where(values < 0, 45, 0).astype(np.uint8)[:, None], digits, np.full((len(values), 1), 9, dtype=np.uint8)]
+            valid += [(values < 0)[:, None], significant, np.ones((len(values), 1), dtype=bool)]
+
+        fields[-1][:] = 13
+        fields.append(np.full((len(fields[-1]), 1), 10, dtype=np.uint8))
+        valid.append(np.ones((len(fields[-1]), 1), dtype=bool))
+
+        return np.hstack(fields)[np.hstack(valid)].tobytes()
+
+
+    def __read_options(self, table: dict, engine: str = None, columns=None):
+        """
+        Returns the pandas 'read_csv' options used to read the data file of the specified table.
+
+        Parameters
+        ----------
+        table : dict
+            The table dictionary from the node file.
+        engine : str, optional
+            The pandas parser engine to use (default is 'pyarrow' if the pyarrow package is installed, otherwise 'c').
+        columns : list or callable, optional
+            The columns to read, either as a list of column names or as a function that takes a column dictionary from 'ColumnDescriptions' and returns True for the columns to read (default is all columns).
+
+        Returns
+        -------
+        dict
+            The keyword arguments for 'pandas.read_csv'.
+        """
+        if engine is None:
+            engine = 'pyarrow' if importlib.util.find_spec('pyarrow') is not None else 'c'
+
+        descriptions = table.get('ColumnDescriptions', [])
+
+        if callable(columns):
+            columns = [column['ColumnName'] for column in descriptions if columns(column)]
+
+        dtype = dict()
+
+        for column in descriptions:
+            if columns is not None and column['ColumnName'] not in columns:
+                continue
+            elif (column.get('Options') or {}).get('DataGroupName') in CATEGORICAL_DATA_GROUPS:
+                dtype[column['ColumnName']] = 'category'
+            elif column.get('DataType') in DATA_TYPES:
+                dtype[column['ColumnName']] = DATA_TYPES[column['DataType']]
+
+        options = {
+            'sep': '\t',
+            'header': 0,
+            'dtype': dtype,
+            'na_values': NA_VALUES,
+            'engine': engine
+        }
+
+        if columns is not None:
+            options['usecols'] = list(columns)
+
+        return options
+
+
+    def __strip_text(self, data, table: dict):
+        """
+        Strips the padding spaces from the text and categorical columns of a data frame read from the data file of the specified table.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The data frame read from the table's data file.
+        table : dict
+            The table dictionary from the node file.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The data frame, with padding spaces removed from its text columns and from the categories of its categorical columns.
+        """
+        for column in table.get('ColumnDescriptions', []):
+            if column['ColumnName'] not in data.columns:
+                continue
+            elif (column.get('Options') or {}).get('DataGroupName') in CATEGORICAL_DATA_GROUPS:
+                data[column['ColumnName']] = categorize(data[column['ColumnName']], numeric=column.get('DataType') == 'Int' and (column.get('Options') or {}).get('DataGroupName') != 'GapStatus')
+            elif column.get('DataType') == 'String':
+                data[column['ColumnName']] = data[column['ColumnName']].str.strip()
+
+        return data
+
+
+    def get_sample_index(self, TableName: str, node_file: dict = None, groups=None):
+        """
+        Builds the index of the samples, files, and per-file columns of a table from its 'ColumnDescriptions'.
+
+        Parameters
+        ----------
+        TableName : str
+            The name of the table.
+        node_file : dict, optional
+            The node file dictionary containing the table (default is the node file returned by 'get_node_file').
+        groups : dict or callable, optional
+            The sample group of each sample, as for 'CDSampleIndex' (default is the sample name without its replicate number).
+
+        Returns
+        -------
+        CDSampleIndex
+            The index of the table's per-file columns.
+
+        Raises
+        ------
+        Exception
+            If the table with the specified name cannot be found in the node file.
+        """
+        if node_file is None:
+            node_file = self.get_node_file(read_only=True)
+
+        return CDSampleIndex(self.get_table(node_file, TableName).get('ColumnDescriptions', []), groups=groups)
+
+
+    def group_stats(self, data, metric: str = 'Area', groups=None, reference: str = None, statistics=('Mean', 'Median', 'SD', 'CV'), ratios: bool = True):
+        """
+        Computes per-sample-group statistics of the per-file columns of a metric (e.g., the 'Area' columns) of a table.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame or LazyCDTable
+            The table's data, e.g., as returned by 'load_table' or 'open_table'.
+        metric : str, optional
+            The metric whose per-file columns are used, i.e., the part of the column names before the sample name (default is 'Area').
+        groups : dict or callable, optional
+            The sample group of each sample, either as a dictionary of sample names and groups or as a function that takes a sample name and returns its group (default is the sample name without its replicate number, e.g., 'Genuine' for 'Genuine_1raw').
+        reference : str, optional
+            The group used as the denominator of the ratios (default is the first group).
+        statistics : list, optional
+            The statistics to compute for each group, among 'Mean', 'Median', 'SD', and 'CV' (default is all).
+        ratios : bool, optional
+            If True, the fold change and log2 fold change of the mean of each group relative to the mean of the reference group are computed (default is True).
+
+        Returns
+        -------
+        pandas.DataFrame
+            The statistics, with one row per row of the table and columns named, e.g., 'Area Mean (Genuine)', 'Area CV (Genuine)', 'Area Fold Change (Suspect/Genuine)', and 'Area Log2 Fold Change (Suspect/Genuine)'.
+
+        Raises
+        ------
+        Exception
+            If the table has no per-file columns for the specified metric, or if the reference group is not one of the groups.
+
+        Notes
+        -----
+        The per-file columns are found from their names ('<metric> <sample> F<file ID>', e.g., 'Area Genuine_1raw F1') with a CDSampleIndex, so no column positions are needed. Their values are copied once into a float64 array with the columns of each group side by side, and each statistic is computed for all rows of a group in a single vectorized operation; missing values are ignored.
+        'SD' is the sample standard deviation and 'CV' the coefficient of variation in percent. Groups (and ratios) appear in the order of their first column in the table.
+        """
+        names = getattr(data, 'column_names', None) or list(data.columns)
+        index = CDSampleIndex([{'ColumnName': name} for name in names], groups=groups, metrics=[metric])
+
+        if metric not in index.metrics:
+            raise Exception(f'Cannot find {metric} columns in table.')
+
+        group_files = index.get_group_files(metric)
+
+        if ratios and reference is not None and reference not in group_files:
+            raise Exception(f'Cannot find group {reference} in {metric} columns; the groups are {", ".join(map(str, group_files))}.')
+
+        values = index.get_matrix(data, metric, [file for files in group_files.values() for file in files])
+        bounds = dict()
+        position = 0
+
+        for group, files in group_files.items():
+            bounds[group] = slice(position, position + len(files))
+            position += len(files)
+
+        results = dict()
+        means = dict()
+
+        with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+
+            for group, bound in bounds.items():
+                block = values[:, bound]
+                means[group] = np.nanmean(block, axis=1)
+
+                if 'Mean' in statistics:
+                    results[f'{metric} Mean ({group})'] = means[group]
+                if 'Median' in statistics:
+                    results[f'{metric} Median ({group})'] = np.nanmedian(block, axis=1)
+                if 'SD' in statistics or 'CV' in statistics:
+                    sd = np.nanstd(block, axis=1, ddof=1)
+                    if 'SD' in statistics:
+                        results[f'{metric} SD ({group})'] = sd
+                    if 'CV' in statistics:
+                        results[f'{metric} CV ({group})'] = sd / means[group] * 100
+
+            if ratios:
+                reference = reference if reference is not None else next(iter(bounds))
+
+                for group in bounds:
+                    if group != reference:
+                        fold_change = means[group] / means[reference]
+                        results[f'{metric} Fold Change ({group}/{reference})'] = fold_change
+                        results[f'{metric} Log2 Fold Change ({group}/{reference})'] = np.log2(fold_change)
+
+        return pd.DataFrame(results, index=getattr(data, 'index', None))
+
+
+    def map_rows(self, data, columns: list, function, outputs, max_workers: int = None, shards: int = None):
+        """
+        Computes new columns from numeric columns of a table by running a function over shards of rows on a pool of processes.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame or LazyCDTable
+            The table's data, e.g., as returned by 'load_table' or 'open_table'.
+        columns : list
+            The names of the numeric columns passed to the function (e.g., the 'Area' columns and 'Total Score').
+        function : callable
+            The function, which takes a float64 array of shape (number of rows of the shard, number of columns), with the columns in the order of 'columns' and missing values as NaN, and returns the new values for these rows: an array of shape (number of rows of the shard, number of outputs), a one-dimensional array if there is a single output, or a dictionary of output names and one-dimensional arrays. It must be defined at the top level of a module (e.g., of the script), so that the processes of the pool can import it.
+        outputs : str or list
+            The name(s) of the new column(s).
+        max_workers : int, optional
+            The number of processes (default is the number of CPU cores). With one process, the function runs in this process on all rows at once.
+        shards : int, optional
+            The number of shards of rows (default is 'max_workers'); more shards than processes balance functions whose time varies between rows.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The new columns (float64), with one row per row of the table, e.g., to be added to the table with data[result.columns] = result and to the node file with 'add_column' (DataType 'Float').
+
+        Raises
+        ------
+        Exception
+            If the function fails, or returns values of the wrong shape, for any shard; the errors of all shards are reported together.
+
+        Notes
+        -----
+        The columns are copied once into a float64 array in shared memory ('multiprocessing.shared_memory'), and the results are written by the processes into a second one; only the names of the shared memory blocks and the rows of each shard are sent to the processes, so the data is not pickled. This suits per-row computations written in pure Python (e.g., a custom score over the 'Area' and score columns), which use a single core otherwise; vectorized NumPy computations are usually faster in a single process.
+        On Windows, new processes import the script again: the script must run its code under "if __name__ == '__main__':" (e.g., with 'run_script'). Functions of scripts run through the CDScriptingNodeLauncher worker or the CDScriptingNodeBatch runner are imported by the processes from the script file.
+        """
+        with self.__phase('map rows'):
+            outputs = [outputs] if isinstance(outputs, str) else list(outputs)
+            max_workers = max_workers or os.cpu_count() or 1
+            rows = len(data)
+
+            values = np.empty((rows, len(columns)), dtype=np.float64)
+            for position, ColumnName in enumerate(columns):
+                values[:, position] = pd.Series(data[ColumnName]).to_numpy(dtype=np.float64, na_value=np.nan)
+
+            if max_workers == 1 or rows == 0:
+                return pd.DataFrame(_shard_results(function(values), rows, outputs), columns=outputs, index=getattr(data, 'index', None))
+
+            input_memory = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+            output_memory = shared_memory.SharedMemory(create=True, size=max(rows * len(outputs) * 8, 1))
+
+            try:
+                np.ndarray(values.shape, dtype=np.float64, buffer=input_memory.buf)[:] = values
+                bounds = np.linspace(0, rows, min(shards or max_workers, rows) + 1).astype(int)
+                errors = []
+
+                with concurrent_futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [executor.submit(_map_rows_shard, _function_reference(function), input_memory.name, output_memory.name, values.shape, outputs, start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+                    for future in concurrent_futures.as_completed(futures):
+                        try:
+                            future.result()
+                        except Exception as e:
+                            errors.append(str(e))
+
+                if errors:
+                    raise Exception('Failed to map rows:\n' + '\n'.join(errors))
+
+                results = np.ndarray((rows, len(outputs)), dtype=np.float64, buffer=output_memory.buf).copy()
+
+            finally:
+                input_memory.close()
+                input_memory.unlink()
+                output_memory.close()
+                output_memory.unlink()
+
+            return pd.DataFrame(results, columns=outputs, index=getattr(data, 'index', None))
+
+
+class LazyCDTable:
+    def __init__(self, table: dict):
+        """
+        Initialize the LazyCDTable object from a table of the node file.
+
+        Parameters
+        ----------
+        table : dict
+            The table dictionary from the node file ('TableName', 'DataFile', 'ColumnDescriptions', etc.).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        Exception
+            If the data file cannot be indexed (e.g., a row does not have as many fields as the header).
+
+        Notes
+        -----
+        The constructor memory-maps the data file (read-only) and indexes the byte offsets of its lines and fields in a single pass over the mapped buffer, block by block; no value is decoded and the file is not copied into memory. A column is decoded into a NumPy array the first time it is accessed (e.g., table['Name']) and cached, so columns that are never accessed cost nothing beyond the index. The 'STRUCTURE_COLUMNS' (e.g., 'Structure') are not decoded as text, but returned as a CDStructureColumn that parses the molfile of a row when it is accessed.
+        Columns are decoded according to their 'DataType': 'Float' as float64 (NaN for missing values), 'Int' as int64 (or float64 with NaN if values are missing), 'Boolean' as bool (or object with None if values are missing), and 'String' as object arrays of text without padding spaces. Columns of the 'CATEGORICAL_DATA_GROUPS' data groups are decoded into pandas Categorical arrays (small integer codes and the labels kept once), as with 'load_table'.
+        Numeric and boolean columns are converted from the mapped buffer with vectorized NumPy operations, without creating a Python object per value. Use 'field' to access a single raw value as a view of the buffer.
+        The data file is expected to hold one row per line and no tabs within values, as exported by Compound Discoverer. The data file stays mapped until 'close' is called (or the 'with' block ends, if the LazyCDTable is used as a context manager).
+        """
+        self.table = table
+        self.__columns = dict()
+
+        with open(table['DataFile'], mode='rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise Exception(f'Data file of table {table["TableName"]} is empty; cannot index.')
+
+            self.__buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.__index()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def close(self):
+        """
+        Unmaps the data file. Columns already decoded remain available.
+        """
+        self.__buffer.close()
+
+
+    def __index(self):
+        """
+        Indexes the byte offsets of the lines and fields of the data file.
+
+        Notes
+        -----
+        The mapped buffer is scanned in blocks of 'SCAN_BLOCK_SIZE' bytes (cut at the end of a line), so the temporary arrays of the scan take the same memory whatever the size of the file. The start of each line is kept as an absolute offset, while the offsets of the tabs and of the end of the line are kept relative to the start of the line, as 16-bit integers for blocks whose lines are shorter than 64 KiB and as 32-bit integers otherwise (a table's index takes about 2 bytes per field, rather than 8). Where the platform supports it (e.g., Linux), the pages of each block are released once scanned (with 'madvise'), so the scan does not keep the whole file resident either.
+        """
+        data = np.frombuffer(self.__buffer, dtype=np.uint8)
+        header = None
+        blocks = []
+        line = 0
+        start = 0
+        released = 0
+        block_size = SCAN_BLOCK_SIZE
+
+        while start < len(data):
+            block = data[start:start + block_size]
+            newlines = np.flatnonzero(block == 10)
+            last = start + len(block) == len(data)
+
+            if not last and len(newlines) == 0:
+                # A line longer than the block: scan it in a larger block.
+                block_size *= 2
+                continue
+
+            if last:
+                line_starts = np.concatenate(([0], newlines + 1))
+                line_ends = np.append(newlines, len(block))
+            else:
+                block = block[:newlines[-1] + 1]
+                line_starts = np.concatenate(([0], newlines[:-1] + 1))
+                line_ends = newlines
+
+            line_ends = line_ends - ((line_ends > line_starts) & (block[np.maximum(line_ends - 1, 0)] == 13))
+            nonempty = line_ends > line_starts
+            line_starts, line_ends = line_starts[nonempty], line_ends[nonempty]
+            tabs = np.flatnonzero(block == 9)
+
+            if header is None and len(line_starts):
+                header = self.__buffer[start + line_starts[0]:start + line_ends[0]].split(b'\t')
+                self.column_names = [self.__unquote(name).decode('utf-8') for name in header]
+
+            if header is not None:
+                tabs_per_line = np.diff(np.searchsorted(tabs, np.append(line_starts, len(block))))
+
+                if np.any(tabs_per_line != len(header) - 1):
+                    raise Exception(f'Line {line + int(np.flatnonzero(tabs_per_line != len(header) - 1)[0]) + 1} of the data file of table {self.table["TableName"]} does not have {len(header)} fields; cannot index.')
+
+                line += len(line_starts)
+
+                if not blocks:
+                    tabs = tabs[len(header) - 1:]
+                    line_starts, line_ends = line_starts[1:], line_ends[1:]
+
+                lengths = line_ends - line_starts
+                dtype = np.uint16 if len(lengths) == 0 or lengths.max() <= 0xFFFF else np.uint32
+                blocks.append((line_starts + start, lengths.astype(dtype), (tabs.reshape(len(line_starts), len(header) - 1) - line_starts[:, None]).astype(dtype)))
+
+            start += len(block)
+            block_size = SCAN_BLOCK_SIZE
+
+            # The pages of the block are released from the memory of the process (they stay in the file system cache), where the platform allows it.
+            if hasattr(mmap, 'MADV_DONTNEED') and start // mmap.PAGESIZE > released:
+                self.__buffer.madvise(mmap.MADV_DONTNEED, released * mmap.PAGESIZE, (start // mmap.PAGESIZE - released) * mmap.PAGESIZE)
+                released = start // mmap.PAGESIZE
+
+        if header is None:
+            raise Exception(f'Data file of table {self.table["TableName"]} has no header; cannot index.')
+
+        self.__line_starts = np.concatenate([starts for starts, lengths, tabs in blocks])
+        self.__line_lengths = np.concatenate([lengths for starts, lengths, tabs in blocks])
+        self.__tabs = np.concatenate([tabs for starts, lengths, tabs in blocks])
+        del blocks
+        self.__positions = {name: position for position, name in reversed(list(enumerate(self.column_names)))}
+        self.__descriptions = {column['ColumnName']: column for column in self.table.get('ColumnDescriptions', [])}
+
+
+    def __len__(self):
+        """
+        Returns the number of rows of the table.
+        """
+        return len(self.__line_starts)
+
+
+    def __contains__(self, ColumnName: str):
+        """
+        Returns True if the table has a column with the specified name.
+        """
+        return ColumnName in self.__positions
+
+
+    def __getitem__(self, ColumnName: str):
+        """
+        Returns the values of the specified column, decoding the column on first access.
+        """
+        return self.get_column(ColumnName)
+
+
+    def spans(self, ColumnName: str):
+        """
+        Returns the byte offsets of the values of the specified column in the data file.
+
+        Parameters
+        ----------
+        ColumnName : str
+            The name of the column.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            The start and end (exclusive) offsets of each row's value, without the enclosing double quotes.
+
+        Raises
+        ------
+        Exception
+            If the column with the specified name cannot be found in the table.
+        """
+        if ColumnName not in self.__positions:
+            raise Exception(f'Cannot find column {ColumnName} in table {self.table["TableName"]}.')
+
+        position = self.__positions[ColumnName]
+        starts = self.__line_starts if position == 0 else self.__line_starts + self.__tabs[:, position - 1] + 1
+        ends = self.__line_starts + (self.__line_lengths if position == len(self.column_names) - 1 else self.__tabs[:, position])
+
+        data = np.frombuffer(self.__buffer, dtype=np.uint8)
+        quoted = (ends - starts >= 2) & (data[np.minimum(starts, len(data) - 1)] == 34) & (data[np.maximum(ends - 1, 0)] == 34)
+
+        return starts + quoted, ends - quoted
+
+
+    def field(self, row: int, ColumnName: str):
+        """
+        Returns the raw value of the specified row and column as a view of the mapped data file.
+
+        Parameters
+        ----------
+        row : int
+            The row number (starting at 0).
+        ColumnName : str
+            The name of the column.
+
+        Returns
+        -------
+        memoryview
+            The bytes of the value, without the enclosing double quotes. The view is only valid until 'close' is called, and must be released before then.
+
+        Raises
+        ------
+        Exception
+            If the column with the specified name cannot be found in the table.
+
+        Notes
+        -----
+        Only the offsets of the specified row are computed, from the index of its line, so a call takes the same time whatever the number of rows.
+        """
+        if ColumnName not in self.__positions:
+            raise Exception(f'Cannot find column {ColumnName} in table {self.table["TableName"]}.')
+
+        position = self.__positions[ColumnName]
+        line_start = int(self.__line_starts[row])
+        start = line_start if position == 0 else line_start + int(self.__tabs[row, position - 1]) + 1
+        end = line_start + int(self.__line_lengths[row] if position == len(self.column_names) - 1 else self.__tabs[row, position])
+
+        if end - start >= 2 and self.__buffer[start] == 34 and self.__buffer[end - 1] == 34:
+            start, end = start + 1, end - 1
+
+        return memoryview(self.__buffer)[start:end]
+
+
+    def read(self, start: int, end: int):
+        """
+        Returns a copy of the bytes at the specified offsets of the data file (e.g., as returned by 'spans').
+        """
+        return self.__buffer[start:end]
+
+
+    def get_column(self, ColumnName: str):
+        """
+        Returns the values of the specified column as a NumPy array, decoding the column on first access.
+
+        Parameters
+        ----------
+        ColumnName : str
+            The name of the column.
+
+        Returns
+        -------
+        numpy.ndarray or CDStructureColumn
+            The values of the column, with the data type given by the column's 'DataType', or a CDStructureColumn for the 'STRUCTURE_COLUMNS'.
+
+        Raises
+        ------
+        Exception
+            If the column with the specified name cannot be found in the table.
+        """
+        if ColumnName not in self.__columns and ColumnName in STRUCTURE_COLUMNS:
+            self.__columns[ColumnName] = self.get_structures(ColumnName)
+
+        elif ColumnName not in self.__columns:
+            self.__columns[ColumnName] = self.__decode(ColumnName, self.__descriptions.get(ColumnName, {}))
+
+        return self.__columns[ColumnName]
+
+
+    def get_structures(self, ColumnName: str = 'Structure', maxsize: int = STRUCTURE_CACHE_SIZE):
+        """
+        Returns the specified column as a CDStructureColumn, which parses the molfile of a row only when it is accessed.
+
+        Parameters
+        ----------
+        ColumnName : str, optional
+            The name of the column holding the molfiles (default is 'Structure').
+        maxsize : int, optional
+            The number of parsed structures to keep in memory (default is 'STRUCTURE_CACHE_SIZE').
+
+        Returns
+        -------
+        CDStructureColumn
+            The column, holding the byte offsets of each row's molfile in the data file.
+        """
+        return CDStructureColumn(self, ColumnName, maxsize)
+
+
+    def __decode(self, ColumnName: str, column: dict):
+        """
+        Decodes the values of a column according to the column's 'DataType'.
+        """
+        DataType = column.get('DataType', 'String')
+        DataGroupName = (column.get('Options') or {}).get('DataGroupName')
+
+        starts, ends = self.spans(ColumnName)
+
+        if DataGroupName in CATEGORICAL_DATA_GROUPS:
+            labels, codes = np.unique(self.__gather(starts, ends), return_inverse=True)
+            values = pd.Categorical.from_codes(codes.ravel(), [label.decode('utf-8') for label in labels])
+
+            return categorize(values, numeric=DataType == 'Int' and DataGroupName != 'GapStatus')
+
+        elif DataType in ('Float', 'Int', 'Boolean'):
+            values = np.char.strip(self.__gather(starts, ends))
+            missing = values == b''
+
+            if DataType == 'Boolean':
+                booleans = values == b'True'
+                return booleans if not missing.any() else np.where(missing, None, booleans)
+
+            if DataType == 'Int' and not missing.any():
+                return values.astype(np.int64)
+
+            values[missing] = b'nan'
+            return values.astype(np.float64)
+
+        else:
+            return np.array([self.__buffer[start:end].strip().replace(b'""', b'"').decode('utf-8') or None for start, end in zip(starts.tolist(), ends.tolist())], dtype=object)
+
+
+    def __gather(self, starts, ends):
+        """
+        Copies the raw values at the specified byte offsets of the mapped data file into a fixed-width NumPy bytes array, with vectorized operations over blocks of rows.
+        """
+        data = np.frombuffer(self.__buffer, dtype=np.uint8)
+        lengths = ends - starts
+        width = max(int(lengths.max()) if len(lengths) else 0, 3)
+
+        offsets = np.arange(width)
+        chars = np.empty((len(starts), width), dtype=np.uint8)
+
+        for block in range(0, len(starts), 65536):
+            rows = slice(block, block + 65536)
+            chars[rows] = data[np.minimum(starts[rows, None] + offsets, len(data) - 1)]
+            chars[rows][offsets >= lengths[rows, None]] = 0
+
+        del data
+        return chars.view(f'S{width}').ravel()
+
+
+    def __unquote(self, value: bytes):
+        """
+        Removes the enclosing double quotes from a raw value.
+        """
+        if len(value) >= 2 and value[:1] == b'"' and value[-1:] == b'"':
+            return value[1:-1].replace(b'""', b'"')
+        return value
+
+
+class CDStructureColumn:
+    def __init__(self, table: LazyCDTable, ColumnName: str = 'Structure', maxsize: int = STRUCTURE_CACHE_SIZE):
+        """
+        Initialize the CDStructureColumn object from a column of molfiles of a LazyCDTable.
+
+        Parameters
+        ----------
+        table : LazyCDTable
+            The table holding the column.
+        ColumnName : str, optional
+            The name of the column holding the molfiles (default is 'Structure').
+        maxsize : int, optional
+            The number of parsed structures to keep in memory (default is 'STRUCTURE_CACHE_SIZE').
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        Exception
+            If the column with the specified name cannot be found in the table.
+
+        Notes
+        -----
+        Only the byte offsets of each row's molfile are kept; a molfile is read from the mapped data file and parsed (see 'parse_molfile') when its row is accessed, e.g., structures[0]. The parsed structures of the 'maxsize' most recently accessed rows are kept, so repeated access to the same rows is not parsed again.
+        The column reads from the data file mapped by the table, so it can only be accessed until the table is closed.
+        """
+        self.table = table
+        self.ColumnName = ColumnName
+        self.maxsize = maxsize
+        self.__starts, self.__ends = table.spans(ColumnName)
+        self.__structures = collections.OrderedDict()
+
+
+    def __len__(self):
+        """
+        Returns the number of rows of the column.
+        """
+        return len(self.__starts)
+
+
+    def __getitem__(self, row: int):
+        """
+        Returns the parsed structure of the specified row.
+        """
+        return self.get_structure(row)
+
+
+    def raw(self, row: int):
+        """
+        Returns the molfile of the specified row as exported, i.e., as bytes with ';' in place of line breaks.
+        """
+        return self.table.read(int(self.__starts[row]), int(self.__ends[row])).replace(b'""', b'"')
+
+
+    def get_molfile(self, row: int):
+        """
+        Returns the molfile of the specified row as text with line breaks, or None if the row has no structure.
+        """
+        molfile = self.raw(row).decode('utf-8')
+        return molfile.replace(';', '\n') if molfile.strip() else None
+
+
+    def get_structure(self, row: int):
+        """
+        Returns the parsed structure of the specified row.
+
+        Parameters
+        ----------
+        row : int
+            The row number (starting at 0).
+
+        Returns
+        -------
+        dict or None
+            The structure's atoms and bonds as returned by 'parse_molfile', or None if the row has no structure.
+
+        Raises
+        ------
+        Exception
+            If the molfile of the row cannot be parsed.
+        """
+        row = int(row) % len(self)
+
+        if row in self.__structures:
+            self.__structures.move_to_end(row)
+            return self.__structures[row]
+
+        molfile = self.raw(row).decode('utf-8')
+
+        try:
+            structure = parse_molfile(molfile, separator=';') if molfile.strip() else None
+        except Exception as e:
+            raise Exception(f'Row {row} of column {self.ColumnName}: {str(e)}')
+
+        self.__structures[row] = structure
+
+        if len(self.__structures) > self.maxsize:
+            self.__structures.popitem(last=False)
+
+        return structure
+
+
+    def cache_clear(self):
+        """
+        Removes all parsed structures from memory.
+        """
+        self.__structures.clear()
+
+
+class CDSampleIndex:
+    def __init__(self, ColumnDescriptions: list, groups=None, metrics=None):
+        """
+        Initialize the CDSampleIndex object from the 'ColumnDescriptions' of a table.
+
+        Parameters
+        ----------
+        ColumnDescriptions : list
+            The column dictionaries of the table, in the order of the table's columns.
+        groups : dict or callable, optional
+            The sample group of each sample, either as a dictionary of sample names and groups or as a function that takes a sample name and returns its group (default is the sample name without its replicate number and raw file extension, e.g., 'Genuine' for 'Genuine_1raw').
+        metrics : list, optional
+            The metrics to index (e.g., ['Area']). By default, every column with a 'DataGroupName' option and a name ending in ' F<file ID>' is indexed.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Per-file column names follow the pattern '<metric> <sample> F<file ID>' (e.g., 'Area Genuine_1raw F1', 'Gap Fill Status Suspect_3raw F6'). The metric is told apart from the sample name using the column's 'DataGroupName' option (e.g., 'GapFillStatus' for 'Gap Fill Status'), or using 'metrics' if given.
+        The index is built once, in a single pass over the column descriptions:
+            - 'metrics' : dict of metric -> {file ID: column position}
+            - 'column_names' : dict of metric -> {file ID: column name}
+            - 'samples' : dict of file ID -> sample name
+            - 'groups' : dict of file ID -> sample group
+        File IDs are integers (1 for 'F1'). Use 'get_matrix' to get the values of a metric for all rows and files as a single array.
+        """
+        self.metrics = dict()
+        self.column_names = dict()
+        self.samples = dict()
+        self.groups = dict()
+
+        for position, column in enumerate(ColumnDescriptions):
+            parsed = self.__parse(column, metrics)
+
+            if parsed is None:
+                continue
+
+            metric, sample, file = parsed
+            self.metrics.setdefault(metric, dict())[file] = position
+            self.column_names.setdefault(metric, dict())[file] = column['ColumnName']
+
+            if file not in self.samples:
+                self.samples[file] = sample
+
+                if callable(groups):
+                    self.groups[file] = groups(sample)
+                elif groups is not None:
+                    self.groups[file] = groups.get(sample, sample)
+                else:
+                    self.groups[file] = re.sub(r'[_\- ]?\d+$', '', re.sub(r'\.?raw$', '', sample)) or sample
+
+
+    def __parse(self, column: dict, metrics=None):
+        """
+        Splits a per-file column name into its metric, sample name, and file ID, or returns None if the column is not a per-file column.
+        """
+        match = re.match(r'(?P<name>.+) F(?P<file>\d+)$', column['ColumnName'])
+
+        if match is None:
+            return None
+
+        name = match.group('name')
+
+        if metrics is not None:
+            metric = next((metric for metric in metrics if name.startswith(metric + ' ')), None)
+
+            if metric is None:
+                return None
+
+            return metric, name[len(metric) + 1:], int(match.group('file'))
+
+        DataGroupName = (column.get('Options') or {}).get('DataGroupName')
+
+        if not DataGroupName:
+            return None
+
+        words = name.split(' ')
+
+        for count in range(1, len(words)):
+            if ''.join(words[:count]).lower() == DataGroupName.lower():
+                return ' '.join(words[:count]), ' '.join(words[count:]), int(match.group('file'))
+
+        return None
+
+
+    def get_files(self, metric: str = None, group: str = None):
+        """
+        Returns the file IDs, in the order of the table's columns.
+
+        Parameters
+        ----------
+        metric : str, optional
+            Only return the files that have a column for this metric (default is all files).
+        group : str, optional
+            Only return the files of this sample group (default is all groups).
+
+        Returns
+        -------
+        list
+            The file IDs.
+        """
+        files = self.metrics[metric] if metric is not None else self.samples
+        return [file for file in files if group is None or self.groups[file] == group]
+
+
+    def get_group_files(self, metric: str = None):
+        """
+        Returns the file IDs of each sample group, in the order of the table's columns.
+
+        Parameters
+        ----------
+        metric : str, optional
+            Only return the files that have a column for this metric (default is all files).
+
+        Returns
+        -------
+        dict
+            The sample groups and the list of file IDs of each group.
+        """
+        group_files = dict()
+
+        for file in self.get_files(metric):
+            group_files.setdefault(self.groups[file], []).append(file)
+
+        return group_files
+
+
+    def get_columns(self, metric: str, files: list = None):
+        """
+        Returns the names of the columns of a metric.
+
+        Parameters
+        ----------
+        metric : str
+            The metric (e.g., 'Area').
+        files : list, optional
+            The file IDs, in the order wanted (default is all files of the metric, in the order of the table's columns).
+
+        Returns
+        -------
+        list
+            The column names.
+
+        Raises
+        ------
+        Exception
+            If the metric is not indexed, or if one of the files has no column for the metric.
+        """
+        if metric not in self.column_names:
+            raise Exception(f'Cannot find metric {metric} in sample index.')
+
+        if files is None:
+            files = self.get_files(metric)
+
+        missing = [file for file in files if file not in self.column_names[metric]]
+
+        if missing:
+            raise Exception(f'Cannot find {metric} columns for files {missing} in sample index.')
+
+        return [self.column_names[metric][file] for file in files]
+
+
+    def get_matrix(self, data, metric: str, files: list = None, dtype='float64'):
+        """
+        Returns the values of a metric for all rows and files as a single two-dimensional array.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame or LazyCDTable
+            The table's data, e.g., as returned by 'load_table' or 'open_table'.
+        metric : str
+            The metric (e.g., 'Area').
+        files : list, optional
+            The file IDs, in the order wanted (default is all files of the metric, in the order of the table's columns).
+        dtype : data-type, optional
+            The data type of the array (default is float64; use object for text metrics such as 'Gap Status').
+
+        Returns
+        -------
+        numpy.ndarray
+            The array of shape (number of rows, number of files), with one column per file.
+        """
+        columns = self.get_columns(metric, files)
+        matrix = np.empty((len(data), len(columns)), dtype=dtype)
+
+        for position, ColumnName in enumerate(columns):
+            matrix[:, position] = np.asarray(data[ColumnName], dtype=dtype)
+
+        return matrix
+
+
+    def get_codes(self, data, metric: str, files: list = None):
+        """
+        Returns the values of a categorical metric (e.g., 'Gap Status') for all rows and files as a single two-dimensional array of integer codes.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame or LazyCDTable
+            The table's data, e.g., as returned by 'load_table' or 'open_table'.
+        metric : str
+            The metric (e.g., 'Gap Status' or 'Gap Fill Status').
+        files : list, optional
+            The file IDs, in the order wanted (default is all files of the metric, in the order of the table's columns).
+
+        Returns
+        -------
+        tuple
+            The array of codes of shape (number of rows, number of files), with -1 for missing values, and the list of labels (labels[code] is the label of a code), shared by all files.
+        """
+        columns = [pd.Categorical(data[ColumnName]) for ColumnName in self.get_columns(metric, files)]
+        labels = pd.Index(list(dict.fromkeys(label for column in columns for label in column.categories)))
+        codes = np.empty((len(data), len(columns)), dtype=np.int8 if len(labels) < 128 else np.int32)
+
+        for position, column in enumerate(columns):
+            recode = np.append(labels.get_indexer(column.categories), -1)
+            codes[:, position] = recode[column.codes]
+
+        return codes, list(labels)
+
+
+    def count(self, data, metric: str, label, files: list = None):
+        """
+        Counts, for each row, the files in which a categorical metric has the specified value.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame or LazyCDTable
+            The table's data, e.g., as returned by 'load_table' or 'open_table'.
+        metric : str
+            The metric (e.g., 'Gap Status').
+        label : str or int
+            The value to count (e.g., 'No gap').
+        files : list, optional
+            The file IDs to count over (default is all files of the metric).
+
+        Returns
+        -------
+        numpy.ndarray
+            The number of files with the value, for each row; e.g., 'data[index.count(data, 'Gap Status', 'No gap') >= 3]' selects the rows with no gap in at least 3 files.
+        """
+        codes, labels = self.get_codes(data, metric, files)
+
+        if label not in labels:
+            return np.zeros(len(data), dtype=np.int64)
+
+        return (codes == labels.index(label)).sum(axis=1)
+
+
+class CDTimer:
+    def __init__(self):
+        """
+        Initialize the CDTimer object, which records the wall time, CPU time, and peak resident memory of the phases of a script.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        Phases are recorded with 'phase' (e.g., with timer.phase('compute'): ...) and may be nested, as well as run at the same time on different threads. The wall time of a phase includes the phases nested in it; its 'Exclusive' time does not, e.g., the time of the script function that is not spent loading or writing tables.
+        Phases run on another thread are nested (their 'Depth') in the phase in which the function run on the thread was wrapped with 'wrap', e.g., the tables loaded in parallel by 'load_all_tables'. Since such phases overlap, their wall time is not subtracted from the 'Exclusive' time of that phase.
+        The CPU time is that of the process for phases run on the main thread, and that of the thread for phases run on other threads (e.g., the data files written in parallel by 'commit').
+        The peak resident memory ('PeakRSS', in bytes) is that of the process since it started, read at the end of each phase with the 'resource' module (Linux, macOS) or, if it is not available (Windows), with the optional 'psutil' package; it is None if neither is available.
+        """
+        self.start = time.perf_counter()
+        self.started = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self.phases = []
+        self.__local = threading.local()
+        self.__lock = threading.Lock()
+
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Records the enclosed code as a phase with the specified name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the phase (e.g., 'load table GC EI Compounds').
+
+        Returns
+        -------
+        contextlib.AbstractContextManager
+            The context manager recording the phase.
+        """
+        stack = self.__local.__dict__.setdefault('stack', [])
+        main = threading.current_thread() is threading.main_thread()
+        cpu_time = time.process_time if main else time.thread_time
+
+        record = {'Phase': name, 'Thread': threading.current_thread().name, 'Depth': self.__local.__dict__.get('depth', 0) + len(stack), 'Start': time.perf_counter() - self.start}
+        children = [0.0]
+        stack.append(children)
+        wall, cpu = time.perf_counter(), cpu_time()
+
+        try:
+            yield record
+
+        finally:
+            wall, cpu = time.perf_counter() - wall, cpu_time() - cpu
+            stack.pop()
+
+            if stack:
+                stack[-1][0] += wall
+
+            record.update({'Wall': wall, 'Exclusive': wall - children[0], 'CPU': cpu, 'PeakRSS': self.peak_rss()})
+
+            with self.__lock:
+                self.phases.append(record)
+
+
+    def wrap(self, function):
+        """
+        Returns a function that calls 'function' (e.g., on another thread), with the phases it records nested in the current phase of the calling thread.
+
+        Parameters
+        ----------
+        function : callable
+            The function to wrap (e.g., a function submitted to a pool of threads).
+
+        Returns
+        -------
+        callable
+            The wrapped function, which takes the same arguments and returns the same value.
+        """
+        depth = self.__local.__dict__.get('depth', 0) + len(self.__local.__dict__.get('stack', []))
+
+        def wrapped(*args, **kwargs):
+            previous = self.__local.__dict__.get('depth', 0)
+            self.__local.depth = depth
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.__local.depth = previous
+
+        return wrapped
+
+
+    def peak_rss(self):
+        """
+        Returns the peak resident memory of the process in bytes, or None if it cannot be measured.
+        """
+        if importlib.util.find_spec('resource') is not None:
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == 'darwin' else peak * 1024
+
+        elif importlib.util.find_spec('psutil') is not None:
+            import psutil
+            memory = psutil.Process().memory_info()
+            return getattr(memory, 'peak_wset', memory.rss)
+
+        return None
+
+
+    def report(self, **kwargs):
+        """
+        Returns the timing report.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Additional entries of the report (e.g., 'Script').
+
+        Returns
+        -------
+        dict
+            The report: the start date and time, the total wall and CPU time, the peak resident memory, and the phases in the order they started.
+        """
+        report = dict(kwargs)
+        report.update({
+            'Started': self.started,
+            'Wall': time.perf_counter() - self.start,
+            'CPU': time.process_time(),
+            'PeakRSS': self.peak_rss(),
+            'Phases': sorted(self.phases, key=lambda record: record['Start'])
+        })
+
+        return report
+
+
+    def save(self, filename: str, **kwargs):
+        """
+        Saves the timing report as a JSON file.
+
+        Parameters
+        ----------
+        filename : str
+            The path of the file.
+        **kwargs : dict, optional
+            Additional entries of the report (e.g., 'Script').
+
+        Returns
+        -------
+        None
+        """
+        try:
+            with open(filename, mode='wb') as f:
+                f.write(dumps_json(self.report(**kwargs)))
+            print(f'Successfully saved timing report to {filename}!')
+
+        except Exception as e:
+            print(f'Failed to save timing report to {filename}: {str(e)}')
@@ -0,0 +1,306 @@
+#==============================================================================
+# Name   : CDScriptingNodeLauncher
+# Author : Ahmad Alamiri
+# Version: v1.0 (for Compound Discoverer 3.3 SP3; CD3.3.3)
+# Aim    : Compound Discoverer Scripting Node "Launcher" used to hand the runs of Scripting Node scripts over to a long-lived worker process that has already imported the CDScriptingNodeHelper (and pandas and NumPy), so that each run does not pay for starting Python and importing them. Only the standard library is imported, so that launching takes a fraction of the time of importing the CDScriptingNodeHelper.
+# Usage  : python CDScriptingNodeLauncher.py serve    (start the worker; keep it running, e.g., in a separate console)
+#          python CDScriptingNodeLauncher.py stop     (stop the worker)
+#          python CDScriptingNodeLauncher.py run <script> <node_args.json>    (run a script through the worker, or in-process if no worker is running)
+#==============================================================================
+
+
+import argparse    # Parser for command-line options, arguments and sub-commands.
+import contextlib    # Utilities for with-statement contexts.
+import getpass    # Portable password input (and the name of the user).
+import hashlib    # Secure hashes and message digests.
+import importlib.util    # Import modules from their file paths.
+import io    # Core tools for working with streams.
+import multiprocessing.connection    # Listeners and clients for connections between processes.
+import os    # Miscellaneous operating system interfaces.
+import re    # Regular expression operations.
+import secrets    # Generate secure random numbers for managing secrets.
+import sys    # System-specific parameters and functions.
+import tempfile    # Generate temporary files and directories.
+import traceback    # Print or retrieve a stack traceback.
+
+
+# Name of the worker's pipe (Windows) or socket file (Linux, macOS), followed by the name of the user.
+WORKER_NAME = 'CDScriptingNodeWorker'
+
+
+# Path of the file holding the key with which the launcher and the worker authenticate each other; only the user can read it.
+WORKER_KEY_PATH = os.path.join(os.path.expanduser('~'), '.cdscriptingnodeworker.key')
+
+
+# Scripts loaded by the worker (or by 'run'), by path, with the modification time of the script file when it was loaded.
+_scripts = dict()
+
+
+def worker_address():
+    """
+    Returns the address of the worker: a named pipe on Windows, otherwise a socket file in the temporary directory, one per user.
+    """
+    name = f'{WORKER_NAME}-{getpass.getuser()}'
+
+    if sys.platform == 'win32':
+        return rf'\\.\pipe\{name}'
+    return os.path.join(tempfile.gettempdir(), name + '.sock')
+
+
+def load_script(script: str):
+    """
+    Imports a script file as a module and returns the module; the module is imported again only if the script file has changed since.
+
+    Parameters
+    ----------
+    script : str
+        The path of the script file.
+
+    Returns
+    -------
+    module
+        The script module, also registered in 'sys.modules'. The script's "if __name__ == '__main__':" block is not run, since the module is not imported as '__main__'.
+    """
+    script = os.path.abspath(script)
+    modified = os.path.getmtime(script)
+
+    if script in _scripts and _scripts[script][1] == modified:
+        return _scripts[script][0]
+
+    # The directory of the script is added to the module search path, so that the script can import the modules next to it (e.g., CDScriptingNodeHelper).
+    if os.path.dirname(script) not in sys.path:
+        sys.path.insert(0, os.path.dirname(script))
+
+    # The module name is unique to the path of the script, and the module is registered in 'sys.modules', so that the functions of the script can be pickled (e.g., by 'map_rows', to send them to a pool of processes).
+    name = f'cdscript_{hashlib.sha1(script.encode("utf-8")).hexdigest()[:12]}_' + re.sub(r'\W', '_', os.path.splitext(os.path.basename(script))[0])
+    spec = importlib.util.spec_from_file_location(name, script)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+
+    _scripts[script] = (module, modified)
+
+    return module
+
+
+def run(script: str, node_file_path: str, function: str = 'main', timing: bool = True, module=None):
+    """
+    Runs the function of a script in this process with 'run_script' (see CDScriptingNodeHelper).
+
+    Parameters
+    ----------
+    script : str
+        The path of the script file.
+    node_file_path : str
+        The path of the node file ('node_args.json').
+    function : str, optional
+        The name of the script function, which takes the CDScriptingResponse object (default is 'main').
+    timing : bool, optional
+        If True, the timing report is saved next to the node file's 'ExpectedResponsePath' (default is True).
+    module : module, optional
+        The script module (default is the module imported from the script file with 'load_script').
+
+    Returns
+    -------
+    object
+        The value returned by the script function.
+    """
+    if module is None:
+        module = load_script(script)
+
+    from CDScriptingNodeHelper import run_script
+
+    return run_script(getattr(module, function), timing, node_file_path=node_file_path)
+
+
+def launch(script: str, node_file_path: str = None, function: str = 'main', timing: bool = True, address: str = None):
+    """
+    Runs the function of a script in the worker, or in this process if no worker is running.
+
+    Parameters
+    ----------
+    script : str
+        The path of the script file (e.g., __file__).
+    node_file_path : str, optional
+        The path of the node file (default is the first command line argument, sys.argv[1], as passed by Compound Discoverer).
+    function : str, optional
+        The name of the script function, which takes the CDScriptingResponse object (default is 'main').
+    timing : bool, optional
+        If True, the timing report is saved next to the node file's 'ExpectedResponsePath' (default is True).
+    address : str, optional
+        The address of the worker (default is 'worker_address()').
+
+    Returns
+    -------
+    int
+        The exit status of the run: 0 if the script function succeeded, otherwise 1 (the error is printed).
+
+    Notes
+    -----
+    The output of the script in the worker is printed by the launcher once the script has finished, so that Compound Discoverer logs it as usual.
+    If the worker cannot be reached (it is not running, or the key file is missing), or it stops during the run, the script is run in this process instead, importing the CDScriptingNodeHelper as usual. Since 'commit' writes all of the response files or none of them, a run interrupted in the worker can be safely run again.
+    The worker runs one script at a time; launchers started while it is busy wait for their turn.
+    Usage (the script run by Compound Discoverer; heavy imports go inside the script function, so that they are not run by the launcher):
+        def main(response): ...
+        if __name__ == '__main__':
+            from CDScriptingNodeLauncher import launch
+            sys.exit(launch(__file__))
+    """
+    script = os.path.abspath(script)
+    node_file_path = os.path.abspath(node_file_path or sys.argv[1])
+    request = {'Script': script, 'NodeFile': node_file_path, 'Function': function, 'Timing': timing, 'Directory': os.getcwd()}
+
+    try:
+        with open(WORKER_KEY_PATH, mode='rb') as f:
+            authkey = f.read()
+
+        with multiprocessing.connection.Client(address or worker_address(), authkey=authkey) as connection:
+            connection.send(request)
+            reply = connection.recv()
+
+        print(reply['Output'], end='')
+        return reply['Status']
+
+    except Exception as e:
+        if not isinstance(e, (FileNotFoundError, ConnectionRefusedError)):
+            print(f'Failed to run script in worker, running it in-process: {str(e)}')
+
+    # In-process: a script that launches itself is already loaded as '__main__'.
+    main = sys.modules.get('__main__')
+    module = main if os.path.abspath(getattr(main, '__file__', '') or '') == script else None
+
+    try:
+        run(script, node_file_path, function, timing, module)
+        return 0
+
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+def serve(address: str = None):
+    """
+    Runs the worker: imports the CDScriptingNodeHelper, and then runs the scripts sent by 'launch' one at a time, until stopped with 'stop'.
+
+    Parameters
+    ----------
+    address : str, optional
+        The address at which the worker listens (default is 'worker_address()').
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    A new key is written to 'WORKER_KEY_PATH' (readable only by the user) each time the worker starts; launchers without the key are refused.
+    Each script runs with the working directory of its launcher, and its output (stdout and stderr) is sent back to the launcher. Script modules are kept loaded between runs and imported again only when the script file changes, so module-level state persists between runs of the same script.
+    """
+    address = address or worker_address()
+    authkey = secrets.token_bytes(32)
+
+    descriptor = os.open(WORKER_KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(descriptor, mode='wb') as f:
+        f.write(authkey)
+
+    # Import the helper, pandas, and NumPy once, now, rather than in each run (the helper itself imports pandas and NumPy only when first used).
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import CDScriptingNodeHelper
+    import numpy
+    import pandas
+
+    if sys.platform != 'win32' and os.path.exists(address):
+        os.remove(address)
+
+    with multiprocessing.connection.Listener(address, authkey=authkey) as listener:
+        print(f'Worker listening at {address} (CDScriptingNodeHelper from {CDScriptingNodeHelper.__file__})')
+
+        while True:
+            try:
+                connection = listener.accept()
+            except Exception as e:
+                print(f'Failed to accept connection: {str(e)}')
+                continue
+
+            with connection:
+                try:
+                    request = connection.recv()
+                except Exception as e:
+                    print(f'Failed to receive request: {str(e)}')
+                    continue
+
+                if request.get('Stop'):
+                    connection.send({'Status': 0, 'Output': 'Worker stopped.\n'})
+                    break
+
+                output = io.StringIO()
+                directory = os.getcwd()
+                status = 0
+
+                with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                    try:
+                        os.chdir(request['Directory'])
+                        run(request['Script'], request['NodeFile'], request['Function'], request['Timing'])
+
+                    except SystemExit as e:
+                        status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+
+                    except BaseException:
+                        traceback.print_exc()
+                        status = 1
+
+                    finally:
+                        os.chdir(directory)
+
+                print(f'{"Ran" if status == 0 else "Failed"} {request["Script"]} on {request["NodeFile"]}')
+
+                try:
+                    connection.send({'Status': status, 'Output': output.getvalue()})
+                except Exception as e:
+                    print(f'Failed to send result: {str(e)}')
+
+    if sys.platform != 'win32' and os.path.exists(address):
+        os.remove(address)
+
+
+def stop(address: str = None):
+    """
+    Stops the worker, if it is running; returns True if it was stopped.
+    """
+    try:
+        with open(WORKER_KEY_PATH, mode='rb') as f:
+            authkey = f.read()
+
+        with multiprocessing.connection.Client(address or worker_address(), authkey=authkey) as connection:
+            connection.send({'Stop': True})
+            print(connection.recv()['Output'], end='')
+        return True
+
+    except Exception as e:
+        print(f'Failed to stop worker: {str(e)}')
+        return False
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run Compound Discoverer Scripting Node scripts in a long-lived worker process.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('serve', help='start the worker')
+    commands.add_parser('stop', help='stop the worker')
+    run_parser = commands.add_parser('run', help='run a script through the worker (or in-process if no worker is running)')
+    run_parser.add_argument('script', help='the script file')
+    run_parser.add_argument('node_file', help='the node file (node_args.json)')
+    run_parser.add_argument('--function', default='main', help='the script function (default main)')
+    run_parser.add_argument('--no-timing', action='store_true', help='do not save the timing report')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve()
+    elif args.command == 'stop':
+        sys.exit(0 if stop() else 1)
+    else:
+        sys.exit(launch(args.script, args.node_file, args.function, not args.no_timing))